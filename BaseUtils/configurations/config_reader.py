@@ -1,44 +1,205 @@
 import configparser
+import json
 import os
+import re
+import threading
 
+# Переменная окружения со "замороженной" конфигурацией для воркеров параллельного запуска
+FROZEN_CONFIG_ENV = "AUTOTEST_FROZEN_CONFIG"
 
-def read_configuration(category: str, key: str, project_dir: str | None = None) -> str:
-    """
-    Читает значение из конфигурационного файла config.ini.
+# Префикс переменных окружения для переопределения значений: AUTOTEST__<СЕКЦИЯ>__<КЛЮЧ>,
+# например AUTOTEST__BASIC_INFO__BROWSER=firefox
+ENV_OVERRIDE_PREFIX = "AUTOTEST__"
 
-    Извлекает значение по указанной категории и ключу из файла конфигурации config.ini,
-    который находится в директории указанного проекта.
+_TRUE_VALUES = ("1", "true", "yes", "on")
+_FALSE_VALUES = ("0", "false", "no", "off", "")
 
-    :param category: Категория (секция) в конфигурационном файле.
-    :param key: Ключ (параметр) в указанной категории, значение которого нужно получить.
-    :param project_dir: Директория проекта, в которой находится конфигурационный файл.
-    :return: Значение параметра из конфигурационного файла в виде строки.
+_MISSING = object()
+
+
+def resolve_config_path(project_dir: str | None = None) -> str:
     """
-    # Определяем абсолютный путь к директории, в которой находится текущий файл config_reader.py
-    current_file_dir = os.path.abspath(os.path.dirname(__file__))
+    Определяет абсолютный путь к config.ini.
 
+    :param project_dir: Директория проекта, в которой находится конфигурационный файл.
+                        Если не передана - общий config.ini рядом с config_reader.py.
+    :return: Абсолютный путь к config.ini.
+    """
     if project_dir:
         # Если передан project_dir, ищет config.ini в конкретном проекте
         config_file_path = os.path.join('..', project_dir, 'configurations', 'config.ini')
     else:
         # По умолчанию ищем config.ini в той же директории, что и config_reader.py
-        config_file_path = os.path.join(current_file_dir, 'config.ini')
+        config_file_path = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'config.ini')
+    return os.path.abspath(config_file_path)
+
+
+def env_override_name(category: str, key: str) -> str:
+    """
+    Имя переменной окружения, переопределяющей значение category/key.
+    """
+    def normalize(value: str) -> str:
+        return re.sub(r"\W+", "_", value.strip()).upper()
+    return f"{ENV_OVERRIDE_PREFIX}{normalize(category)}__{normalize(key)}"
+
+
+class ConfigRegistry:
+    """
+    Общий для процесса реестр конфигурационных файлов.
+
+    Каждый файл разбирается один раз и перечитывается только при изменении времени модификации.
+    Конфигурацию можно "заморозить" и передать воркерам через переменную окружения -
+    тогда воркеры не читают и не разбирают файлы вовсе.
+    """
+
+    def __init__(self) -> None:
+        self._parsed: dict[str, tuple[int, dict[str, dict[str, str]]]] = {}
+        self._frozen: dict[str, dict[str, dict[str, str]]] | None = None
+        self._lock = threading.Lock()
+
+    def get(
+            self,
+            category: str,
+            key: str,
+            project_dir: str | None = None,
+            default: object = _MISSING
+    ) -> str:
+        """
+        Возвращает значение category/key с учетом переопределения из переменной окружения.
+
+        :param category: Категория (секция) в конфигурационном файле.
+        :param key: Ключ (параметр) в указанной категории.
+        :param project_dir: Директория проекта, в которой находится конфигурационный файл.
+        :param default: Значение по умолчанию, если секции или ключа нет.
+        :return: Значение параметра в виде строки.
+        """
+        override = os.environ.get(env_override_name(category, key))
+        if override is not None:
+            return override
 
-    # Приводим путь к абсолютному пути
-    config_file_path = os.path.abspath(config_file_path)
+        sections = self._sections(resolve_config_path(project_dir))
+        if category not in sections:
+            if default is not _MISSING:
+                return default
+            raise configparser.NoSectionError(category)
+        options = sections[category]
+        if key.lower() not in options:
+            if default is not _MISSING:
+                return default
+            raise configparser.NoOptionError(key, category)
+        return options[key.lower()]
 
-    # Проверяем, существует ли файл config.ini
-    if not os.path.isfile(config_file_path):
-        raise FileNotFoundError(f"Файл config.ini НЕ найден по пути: {config_file_path}")
+    def get_int(self, category: str, key: str, project_dir: str | None = None, default: object = _MISSING) -> int:
+        """
+        Возвращает значение category/key как int.
+        """
+        value = self.get(category, key, project_dir, default)
+        return value if value is default else int(value)
 
-    # Создаем объект ConfigParser и читаем конфигурационный файл
-    config = configparser.ConfigParser(interpolation=None)
-    config.read(config_file_path, encoding='utf-8')
+    def get_float(self, category: str, key: str, project_dir: str | None = None, default: object = _MISSING) -> float:
+        """
+        Возвращает значение category/key как float.
+        """
+        value = self.get(category, key, project_dir, default)
+        return value if value is default else float(value)
 
-    # Проверяем, существует ли секция и ключ, чтобы избежать ошибок
-    if not config.has_section(category):
-        raise configparser.NoSectionError(category)
-    if not config.has_option(category, key):
-        raise configparser.NoOptionError(key, category)
+    def get_bool(self, category: str, key: str, project_dir: str | None = None, default: object = _MISSING) -> bool:
+        """
+        Возвращает значение category/key как bool (true/false, yes/no, on/off, 1/0).
+        """
+        value = self.get(category, key, project_dir, default)
+        if value is default:
+            return value
+        normalized = value.strip().lower()
+        if normalized in _TRUE_VALUES:
+            return True
+        if normalized in _FALSE_VALUES:
+            return False
+        raise ValueError(f'Некорректное логическое значение "{value}" для [{category}] {key}')
 
-    return config.get(category, key)
+    def get_list(
+            self,
+            category: str,
+            key: str,
+            project_dir: str | None = None,
+            default: object = _MISSING,
+            separator: str = ","
+    ) -> list[str]:
+        """
+        Возвращает значение category/key как список строк (пустые элементы отбрасываются).
+        """
+        value = self.get(category, key, project_dir, default)
+        if value is default:
+            return value
+        return [item.strip() for item in value.split(separator) if item.strip()]
+
+    def freeze(self) -> dict[str, dict[str, dict[str, str]]]:
+        """
+        Снимок всех загруженных файлов (общий config.ini загружается всегда).
+        После заморозки файлы больше не читаются и не проверяются на изменения.
+
+        :return: Словарь путь -> секция -> ключ -> значение.
+        """
+        self._sections(resolve_config_path())
+        with self._lock:
+            if self._frozen is None:
+                self._frozen = {path: sections for path, (_, sections) in self._parsed.items()}
+            return self._frozen
+
+    def frozen_env(self) -> dict[str, str]:
+        """
+        Переменные окружения для передачи замороженной конфигурации дочерним процессам.
+        """
+        return {FROZEN_CONFIG_ENV: json.dumps(self.freeze(), ensure_ascii=False)}
+
+    def load_frozen(self, snapshot: dict[str, dict[str, dict[str, str]]]) -> None:
+        """
+        Загружает замороженный снимок конфигурации (например, переданный родительским процессом).
+        """
+        with self._lock:
+            self._frozen = snapshot
+
+    def _sections(self, config_file_path: str) -> dict[str, dict[str, str]]:
+        frozen = self._frozen
+        if frozen is not None and config_file_path in frozen:
+            return frozen[config_file_path]
+
+        try:
+            mtime = os.stat(config_file_path).st_mtime_ns
+        except OSError:
+            raise FileNotFoundError(f"Файл config.ini НЕ найден по пути: {config_file_path}")
+
+        cached = self._parsed.get(config_file_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with self._lock:
+            config = configparser.ConfigParser(interpolation=None)
+            config.read(config_file_path, encoding='utf-8')
+            sections = {section: dict(config.items(section)) for section in config.sections()}
+            self._parsed[config_file_path] = (mtime, sections)
+        return sections
+
+
+# Общий реестр процесса
+config_registry = ConfigRegistry()
+
+if os.environ.get(FROZEN_CONFIG_ENV):
+    config_registry.load_frozen(json.loads(os.environ[FROZEN_CONFIG_ENV]))
+
+
+def read_configuration(category: str, key: str, project_dir: str | None = None) -> str:
+    """
+    Читает значение из конфигурационного файла config.ini.
+
+    Извлекает значение по указанной категории и ключу из файла конфигурации config.ini,
+    который находится в директории указанного проекта. Файл разбирается один раз на процесс
+    (повторно - только при изменении), значение может быть переопределено переменной окружения
+    AUTOTEST__<СЕКЦИЯ>__<КЛЮЧ>.
+
+    :param category: Категория (секция) в конфигурационном файле.
+    :param key: Ключ (параметр) в указанной категории, значение которого нужно получить.
+    :param project_dir: Директория проекта, в которой находится конфигурационный файл.
+    :return: Значение параметра из конфигурационного файла в виде строки.
+    """
+    return config_registry.get(category, key, project_dir)
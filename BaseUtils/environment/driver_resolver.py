@@ -0,0 +1,149 @@
+import json
+import os
+import threading
+import time
+
+from BaseUtils.configurations import config_reader
+from BaseUtils.utils.logger import logger
+
+# Манифест с путями к уже разрешенным драйверам, сохраняется между запусками
+MANIFEST_PATH = os.path.join(os.path.expanduser("~"), ".wdm", "resolved_drivers.json")
+
+
+def _install_via_manager(browser_name: str) -> str:
+    """
+    Скачивание/поиск драйвера через webdriver_manager (сетевой путь).
+
+    :param browser_name: Название браузера (chrome, firefox, edge).
+    :return: Путь к исполняемому файлу драйвера.
+    """
+    if browser_name == "chrome":
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+    if browser_name == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager().install()
+    if browser_name == "edge":
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager().install()
+    raise ValueError(f"Unsupported browser: {browser_name}")
+
+
+class DriverBinaryResolver:
+    """
+    Разрешение пути к драйверу браузера без обращения к сети на каждый тест.
+
+    Порядок поиска:
+        1. Путь, явно указанный в config.ini (секция [driver binaries]).
+        2. Кэш текущего процесса.
+        3. Манифест на диске, сохраненный предыдущими запусками.
+        4. webdriver_manager - только при промахе кэша; результат записывается в манифест.
+    """
+
+    def __init__(self, manifest_path: str = MANIFEST_PATH) -> None:
+        self.manifest_path = manifest_path
+        self._cache: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "calls": 0,
+            "manager_installs": 0,  # Сколько раз пришлось обращаться к webdriver_manager
+            "resolution_time": 0.0,  # Суммарное время разрешения, сек
+            "last_resolution_time": 0.0,
+        }
+
+    def resolve(self, browser_name: str) -> str:
+        """
+        Возвращает путь к драйверу для указанного браузера.
+
+        :param browser_name: Название браузера (chrome, firefox, edge).
+        :return: Путь к исполняемому файлу драйвера.
+        """
+        start_time = time.perf_counter()
+        try:
+            with self._lock:
+                return self._resolve(browser_name)
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.stats["calls"] += 1
+            self.stats["resolution_time"] += elapsed
+            self.stats["last_resolution_time"] = elapsed
+
+    def invalidate(self, browser_name: str) -> None:
+        """
+        Сбрасывает закэшированный путь (например, если драйвер не подошел к обновленному браузеру).
+
+        :param browser_name: Название браузера (chrome, firefox, edge).
+        """
+        with self._lock:
+            self._cache.pop(browser_name, None)
+            manifest = self._load_manifest()
+            if manifest.pop(browser_name, None) is not None:
+                self._save_manifest(manifest)
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка по разрешению драйверов для вывода в конце сессии.
+        """
+        calls = self.stats["calls"]
+        avg_time = self.stats["resolution_time"] / calls if calls else 0.0
+        return (
+            f"Разрешение драйверов: вызовов: {calls}, "
+            f"обращений к webdriver_manager: {self.stats['manager_installs']}, "
+            f"среднее время: {avg_time * 1000:.1f} мс"
+        )
+
+    def _resolve(self, browser_name: str) -> str:
+        configured_path = self._configured_path(browser_name)
+        if configured_path:
+            if not self._is_executable(configured_path):
+                raise FileNotFoundError(
+                    f'Драйвер для "{browser_name}" НЕ найден по пути из config.ini: {configured_path}'
+                )
+            return configured_path
+
+        cached_path = self._cache.get(browser_name)
+        if cached_path:
+            return cached_path
+
+        manifest = self._load_manifest()
+        manifest_path = manifest.get(browser_name)
+        if manifest_path and self._is_executable(manifest_path):
+            self._cache[browser_name] = manifest_path
+            return manifest_path
+
+        logger.info(f'Драйвер для "{browser_name}" не найден в кэше, обращение к webdriver_manager')
+        driver_path = _install_via_manager(browser_name)
+        self.stats["manager_installs"] += 1
+        self._cache[browser_name] = driver_path
+        manifest[browser_name] = driver_path
+        self._save_manifest(manifest)
+        return driver_path
+
+    @staticmethod
+    def _configured_path(browser_name: str) -> str:
+        return config_reader.config_registry.get(category="driver binaries", key=browser_name, default="").strip()
+
+    @staticmethod
+    def _is_executable(path: str) -> bool:
+        return os.path.isfile(path) and os.access(path, os.X_OK)
+
+    def _load_manifest(self) -> dict[str, str]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest: dict[str, str]) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            tmp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(manifest, file, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.manifest_path)  # Атомарная запись для параллельных воркеров
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить манифест драйверов {self.manifest_path}: {e}")
+
+
+# Общий резолвер процесса
+driver_resolver = DriverBinaryResolver()
@@ -7,14 +7,15 @@ if project_root not in sys.path:
     sys.path.append(project_root)
 
 import platform
+import threading
+import time
+from collections import deque
 from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
 from selenium.webdriver.firefox.webdriver import WebDriver as FirefoxWebDriver
 from selenium.webdriver.edge.webdriver import WebDriver as EdgeWebDriver
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver import DesiredCapabilities
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from selenium.common.exceptions import SessionNotCreatedException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
@@ -22,6 +23,10 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from BaseUtils.configurations import config_reader
+from BaseUtils.environment.driver_resolver import driver_resolver
+from BaseUtils.pages.page_context import release_page_context
+from BaseUtils.utils.download_tracker import get_download_dir
+from BaseUtils.utils.logger import logger
 
 
 def is_windows() -> bool:
@@ -40,12 +45,15 @@ def create_driver(browser_name: str) -> WebDriver:
     :param browser_name: Название браузера (chrome, firefox, edge).
     :return: Экземпляр WebDriver для выбранного браузера.
     """
+    # У каждого воркера своя директория загрузок: параллельные тесты не видят файлы друг друга
+    download_dir = get_download_dir()
     if browser_name == "chrome":
         caps = DesiredCapabilities.CHROME.copy()  # Копия стандартных настроек для браузера
         caps['goog:loggingPrefs'] = {'performance': 'ALL'}  # Добавляет настройки логирования производительности.
 
         options = ChromeOptions()
         options.add_experimental_option('prefs', {
+            "download.default_directory": download_dir,  # Директория загрузок воркера
             "download.prompt_for_download": False,  # Отключает запрос на подтверждение скачивания файла
             "download.directory_upgrade": True,  # Разрешает обновление директории загрузок
             "safebrowsing.enabled": True  # Включает безопасный просмотр.
@@ -55,23 +63,40 @@ def create_driver(browser_name: str) -> WebDriver:
         if not is_windows():
             options.add_argument("--headless")  # Запуск браузера в headless-режиме
             options.add_argument("--window-size=1920,1080")  # Установка размера окна
-        service = ChromeService(ChromeDriverManager().install())  # Установка ChromeDriver
-        driver = ChromeWebDriver(service=service, options=options)  # Экземпляр WebDriver с настройками
+        driver_class, service_class = ChromeWebDriver, ChromeService
     elif browser_name == "firefox":
         options = FirefoxOptions()
+        options.set_preference("browser.download.folderList", 2)  # 2 - директория из browser.download.dir
+        options.set_preference("browser.download.dir", download_dir)
+        options.set_preference("browser.download.useDownloadDir", True)
+        options.set_preference("browser.download.manager.showWhenStarting", False)
         if not is_windows():
             options.add_argument("--headless")  # Запуск браузера в headless-режиме
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = FirefoxWebDriver(service=service, options=options)
+        driver_class, service_class = FirefoxWebDriver, FirefoxService
     elif browser_name == "edge":
         options = EdgeOptions()
+        options.add_experimental_option('prefs', {
+            "download.default_directory": download_dir,
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True
+        })
         if not is_windows():
             options.add_argument("--headless")  # Запуск браузера в headless-режиме
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        driver = EdgeWebDriver(service=service, options=options)
+        driver_class, service_class = EdgeWebDriver, EdgeService
     else:
         raise ValueError(f"Unsupported browser: {browser_name}")
 
+    # Путь к драйверу разрешается один раз на процесс (кэш/манифест), без сети на каждый тест
+    driver_path = driver_resolver.resolve(browser_name)
+    try:
+        driver = driver_class(service=service_class(driver_path), options=options)
+    except SessionNotCreatedException as e:
+        # Закэшированный драйвер мог устареть после обновления браузера - разрешаем заново
+        logger.warning(f'Драйвер "{driver_path}" не подошел к браузеру, повторное разрешение: {e.msg}')
+        driver_resolver.invalidate(browser_name)
+        driver_path = driver_resolver.resolve(browser_name)
+        driver = driver_class(service=service_class(driver_path), options=options)
+
     return driver
 
 
@@ -81,10 +106,23 @@ def before_scenario() -> WebDriver:
 
     :return: Экземпляр WebDriver для взаимодействия с браузером.
     """
+    pool = get_driver_pool()
+    if pool is not None:
+        return pool.acquire()  # Браузер из пула "тёплых" экземпляров
     browser_name = config_reader.read_configuration(
         category="basic info",
         key="browser"
     )
+    return _start_driver(browser_name)
+
+
+def _start_driver(browser_name: str) -> WebDriver:
+    """
+    Запуск нового браузера с общими настройками окна.
+
+    :param browser_name: Название браузера (chrome, firefox, edge).
+    :return: Экземпляр WebDriver.
+    """
     driver = create_driver(browser_name)  # Полное создание WebDriver
     if is_windows():
         driver.maximize_window()
@@ -95,6 +133,186 @@ def after_scenario(driver: WebDriver) -> None:
     """
     Завершение сценария и закрытие WebDriver.
 
+    Если включен пул браузеров, браузер не закрывается, а сбрасывается и возвращается в пул.
+
     :param driver: Экземпляр WebDriver, который нужно закрыть.
     """
+    release_page_context(driver)
+    pool = get_driver_pool()
+    if pool is not None:
+        pool.release(driver)
+        return
     driver.quit()
+
+
+class DriverPool:
+    """
+    Пул "тёплых" экземпляров WebDriver, живущих всю сессию тестов.
+
+    Вместо запуска и закрытия браузера на каждый тест пул выдает уже запущенный
+    браузер, а после теста сбрасывает его состояние (cookies, storage, лишние окна,
+    about:blank). Упавший браузер при проверке здоровья заменяется новым.
+
+    Количество одновременно запущенных браузеров пул не ограничивает: acquire() без свободного браузера
+    всегда запускает новый (тест, которому нужны два браузера, не ждет другой тест). Размер пула
+    ограничивает только количество свободных браузеров, сохраняемых между тестами, - лишние закрываются
+    в release().
+    """
+
+    def __init__(self, browser_name: str, size: int) -> None:
+        """
+        :param browser_name: Название браузера (chrome, firefox, edge).
+        :param size: Максимальное количество свободных браузеров, сохраняемых между тестами.
+        """
+        self.browser_name = browser_name
+        self.size = max(1, size)
+        self._idle: deque[WebDriver] = deque()
+        self._all: list[WebDriver] = []
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,  # Выдан уже запущенный браузер
+            "misses": 0,  # Пришлось запускать новый браузер
+            "replaced": 0,  # Браузер не прошел проверку здоровья и был заменен
+            "resets": 0,
+            "reset_time": 0.0,  # Суммарное время сброса состояния, сек
+        }
+
+    def acquire(self) -> WebDriver:
+        """
+        Выдает браузер из пула или запускает новый, если свободных нет.
+
+        :return: Экземпляр WebDriver.
+        """
+        while True:
+            with self._lock:
+                driver = self._idle.popleft() if self._idle else None
+            if driver is None:
+                break
+            if self._is_alive(driver):
+                self.stats["hits"] += 1
+                return driver
+            self._discard(driver)
+            self.stats["replaced"] += 1
+
+        self.stats["misses"] += 1
+        driver = _start_driver(self.browser_name)
+        with self._lock:
+            self._all.append(driver)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Возвращает браузер в пул после сброса состояния.
+        Если сброс не удался или пул переполнен, браузер закрывается.
+
+        :param driver: Экземпляр WebDriver, полученный через acquire().
+        """
+        start_time = time.perf_counter()
+        reset_ok = self._reset(driver)
+        self.stats["resets"] += 1
+        self.stats["reset_time"] += time.perf_counter() - start_time
+
+        with self._lock:
+            keep = reset_ok and len(self._idle) < self.size
+            if keep:
+                self._idle.append(driver)
+        if not keep:
+            self._discard(driver)
+
+    def close_all(self) -> None:
+        """
+        Закрывает все браузеры пула. Вызывается в конце сессии.
+        """
+        with self._lock:
+            drivers, self._all = self._all, []
+            self._idle.clear()
+        for driver in drivers:
+            release_page_context(driver)
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Ошибка при закрытии браузера из пула: {e}")
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка по работе пула для вывода в конце сессии.
+        """
+        resets = self.stats["resets"]
+        avg_reset = self.stats["reset_time"] / resets if resets else 0.0
+        return (
+            f"Пул браузеров ({self.browser_name}, хранится свободных: до {self.size}): "
+            f"попаданий: {self.stats['hits']}, "
+            f"промахов: {self.stats['misses']}, "
+            f"заменено упавших: {self.stats['replaced']}, "
+            f"сбросов: {resets}, среднее время сброса: {avg_reset:.3f} сек"
+        )
+
+    @staticmethod
+    def _is_alive(driver: WebDriver) -> bool:
+        """
+        Проверка здоровья браузера: сессия отвечает на простую команду.
+        """
+        try:
+            _ = driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver: WebDriver) -> bool:
+        """
+        Сбрасывает состояние браузера: закрывает лишние окна, очищает cookies и storage,
+        открывает about:blank.
+
+        :return: True, если сброс выполнен успешно.
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            driver.switch_to.default_content()
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                # Storage недоступен для некоторых страниц (например, about:blank или data:)
+                pass
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"Не удалось сбросить состояние браузера из пула: {e}")
+            return False
+
+    def _discard(self, driver: WebDriver) -> None:
+        """
+        Удаляет браузер из пула и закрывает его.
+        """
+        with self._lock:
+            if driver in self._all:
+                self._all.remove(driver)
+        release_page_context(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+_driver_pool: DriverPool | None = None
+
+
+def get_driver_pool() -> DriverPool | None:
+    """
+    Возвращает пул браузеров процесса, если он включен в config.ini (секция [driver pool]).
+
+    :return: Экземпляр DriverPool или None, если пул выключен.
+    """
+    global _driver_pool
+    if _driver_pool is None:
+        if not config_reader.config_registry.get_bool(category="driver pool", key="enabled", default=False):
+            return None
+        size = config_reader.config_registry.get_int(category="driver pool", key="size", default=2)
+        browser_name = config_reader.read_configuration(category="basic info", key="browser")
+        _driver_pool = DriverPool(browser_name=browser_name, size=size)
+    return _driver_pool
@@ -1,14 +1,12 @@
 import os
 import time
-import requests
 
 import re
 import allure
-import platform
 from typing import Tuple, List
 
 
-from BaseUtils.utils.logger import logger
+from BaseUtils.utils.logger import logger, log_lazy
 from selenium.webdriver.common.by import By
 from selenium.webdriver import ActionChains
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -20,12 +18,80 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.support.select import Select
 
-from BaseUtils.configurations.config_reader import read_configuration
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.pages.page_context import PageContext, get_page_context
+from BaseUtils.utils.attachment_policy import attach_evidence
+from BaseUtils.utils.command_counter import CommandCounter
+from BaseUtils.utils.download_tracker import DownloadTracker
+from BaseUtils.utils.element_inspector import inspect_existing_element, format_element_state
+from BaseUtils.utils.http_client import BrowserHttpClient
+from BaseUtils.utils.link_checker import COLLECT_LINKS_JS, LinkCheckResult, format_results_table, get_link_checker
+from BaseUtils.utils.page_text_scanner import PageTextScanner
+from BaseUtils.utils.screenshot_service import get_screenshot_service
 from BaseUtils.utils.switch_iframe_context import SwitchIframeContext
 
+from BaseUtils.utils.wait_engine import FIND_ELEMENT_JS
 from BaseUtils.utils.wait_utils import WaitUtils
 
 
+# Заполнение полей формы за один вызов: значение устанавливается через нативный сеттер прототипа элемента
+# (чтобы его "увидели" фреймворки вроде React/Vue), затем отправляются события input и change.
+# Сеттер берется из цепочки прототипов самого элемента (input, textarea, select), у contenteditable
+# свойства value нет - для него устанавливается текст.
+# Поля, требующие настоящего ввода с клавиатуры, возвращаются для заполнения через send_keys.
+FILL_FORM_JS = FIND_ELEMENT_JS + """
+function nativeValueSetter(el) {
+    for (var proto = Object.getPrototypeOf(el); proto; proto = Object.getPrototypeOf(proto)) {
+        var descriptor = Object.getOwnPropertyDescriptor(proto, 'value');
+        if (descriptor && descriptor.set) {
+            return descriptor.set;
+        }
+    }
+    return null;
+}
+function setValue(el, text) {
+    var setter = nativeValueSetter(el);
+    if (setter) {
+        setter.call(el, text);
+    } else if (el.isContentEditable) {
+        el.textContent = text;
+    } else {
+        el.value = text;
+    }
+}
+var fields = arguments[0], missing = [], keystrokeElements = [];
+for (var i = 0; i < fields.length; i++) {
+    var field = fields[i];
+    var el = findElement(field.by, field.value);
+    if (!el) {
+        missing.push(field.value);
+        continue;
+    }
+    if (field.keystrokes) {
+        setValue(el, '');
+        keystrokeElements.push(el);
+        continue;
+    }
+    el.focus();
+    setValue(el, field.text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+}
+return {missing: missing, keystroke_elements: keystrokeElements};
+"""
+
+# Чтение значений всех полей формы за один вызов
+READ_FORM_JS = FIND_ELEMENT_JS + """
+var fields = arguments[0], values = [];
+for (var i = 0; i < fields.length; i++) {
+    var el = findElement(fields[i].by, fields[i].value);
+    values.push(el ? (el.isContentEditable ? el.textContent : el.value) : null);
+}
+return values;
+"""
+
+
 class CustomAssertionError(AssertionError):
     """Исключение для принудительной отметки шага как failed в Allure."""
     pass
@@ -34,35 +100,60 @@ class CustomAssertionError(AssertionError):
 class BasePage:
     """
     Класс для описания общих методов для всех последующих страниц.
+    Состояние страницы - только ссылка на общий контекст драйвера (PageContext),
+    поэтому создание объекта страницы практически ничего не стоит.
     """
 
-    def __init__(self, driver: WebDriver) -> None:
+    __slots__ = ("context",)
+
+    def __init__(self, driver: WebDriver | PageContext) -> None:
         """
         Инициализация объекта BasePage.
 
         Args:
-            driver (WebDriver): Экземпляр WebDriver для Selenium.
+            driver (WebDriver | PageContext): Экземпляр WebDriver для Selenium или уже готовый контекст страниц.
         """
-        self.driver = driver
-        self.actions = ActionChains(self.driver)
-        self.base_url = read_configuration(
-            category="basic info",
-            key="base_url"
-        )
-        self.locator_map = {
-            "id": By.ID,
-            "name": By.NAME,
-            "class_name": By.CLASS_NAME,
-            "link_text": By.LINK_TEXT,
-            "xpath": By.XPATH,
-            "css": By.CSS_SELECTOR
-        }
-        self.wait_utils = WaitUtils(
-            driver,
-            self.get_locator,
-            self.get_element,
-            self.take_screenshot_when_error_and_scroll
-        )
+        self.context = driver if isinstance(driver, PageContext) else get_page_context(driver)
+        self.context.stats["pages_created"] += 1
+
+    @property
+    def driver(self) -> WebDriver:
+        """Экземпляр WebDriver."""
+        return self.context.driver
+
+    @property
+    def actions(self) -> ActionChains:
+        """ActionChains драйвера."""
+        return self.context.actions
+
+    @property
+    def base_url(self) -> str:
+        """Базовый URL приложения из config.ini."""
+        return self.context.base_url
+
+    @property
+    def http_client(self) -> BrowserHttpClient:
+        """HTTP-клиент драйвера (пул соединений, cookies браузера)."""
+        return self.context.http_client
+
+    @property
+    def locator_map(self) -> dict[str, str]:
+        """Карта типов локаторов."""
+        return self.context.locator_map
+
+    @property
+    def wait_utils(self) -> WaitUtils:
+        """Ожидания элементов драйвера."""
+        return self.context.wait_utils
+
+    def _current_url(self) -> str:
+        """
+        Текущий URL для сообщений логов (без исключения, если окно уже закрыто).
+        """
+        try:
+            return self.driver.current_url
+        except Exception:
+            return "Нового окна браузера"
 
     def get_locator(self, locator_type: str, locator_value: str) -> Tuple[str, str]:
         """
@@ -75,13 +166,7 @@ class BasePage:
         Returns:
             Tuple[str, str]: Кортеж с типом и значением локатора.
         """
-        try:
-            if locator_type not in self.locator_map:
-                raise ValueError(f"Неподдерживаемый Тип Локатора: {locator_type}")
-            return self.locator_map[locator_type], locator_value
-        except Exception as e:
-            logger.error(f"Ошибка при получении локатора: {e}")
-            raise e
+        return self.context.get_locator(locator_type, locator_value)
 
     def get_element(
             self,
@@ -104,23 +189,7 @@ class BasePage:
             NoSuchElementException: Если элемент не найден на странице.
             ValueError: Если тип локатора не поддерживается.
         """
-        try:
-            element_locator: Tuple[str, str] = self.get_locator(locator_type, locator_value)
-            if list_of_elements:
-                # Возвращаем список элементов
-                return self.driver.find_elements(*element_locator)
-            else:
-                # Возвращаем один элемент
-                return self.driver.find_element(*element_locator)
-        except (NoSuchElementException, TimeoutException, Exception) as e:
-            error_message = (
-                f'Элемент с локатором: "{locator_type}" \n'
-                f'И значением: "{locator_value}" \n'
-                f"НЕ НАЙДЕН на странице с помощью метода find_element-s: \n\n"
-                f"{e}"
-            )
-            logger.error(error_message)
-            raise e
+        return self.context.get_element(locator_type, locator_value, list_of_elements)
 
     @allure.step('Клик на элемент с локатором: "{locator_type}" и значением: "{locator_value}"')
     def click_on_element(self, locator_type: str, locator_value: str) -> bool:
@@ -131,26 +200,27 @@ class BasePage:
             locator_type (str): Тип локатора (например, "id", "xpath").
             locator_value (str): Значение локатора.
         """
-        try:
-            current_url = self.driver.current_url
-        except Exception:
-            current_url = "Нового окна браузера"
-        if self.wait_utils.wait_for_element_to_be_visible(locator_type, locator_value) or \
-                self.wait_utils.wait_for_element_to_be_clickable(locator_type, locator_value):
+        # Одно ожидание составного условия (видим + доступен), элемент возвращается сразу
+        element = self.wait_utils.wait_for_element_to_be_visible(
+            locator_type, locator_value, return_elem=True, require_enabled=True)
+        if element:
+            # URL фиксируется до клика (клик может перейти на другую страницу): отложенно формируется только текст
+            page_url = self._current_url()
             try:
-                element = self.get_element(locator_type, locator_value)
                 element.click()
-                log = (
-                    f'Клик на элемент: \n'
-                    f'С локатором: "{locator_type}" \n'
-                    f'и значением: "{locator_value}" \n'
-                    f'На странице: {current_url}\n'
-                )
-                logger.info(log)
-                allure.attach(
+
+                def build_log() -> str:
+                    return (
+                        f'Клик на элемент: \n'
+                        f'С локатором: "{locator_type}" \n'
+                        f'и значением: "{locator_value}" \n'
+                        f'На странице: {page_url}\n'
+                        f"Выполнен УСПЕШНО"
+                    )
+                log_lazy(build_log)
+                attach_evidence(
                     name="Успешный клик",
-                    body=f"{log}"
-                         f"Выполнен УСПЕШНО",
+                    body=build_log,
                     attachment_type=allure.attachment_type.TEXT
                 )
                 return True
@@ -169,17 +239,19 @@ class BasePage:
                     self.scroll_to_element(locator_type, locator_value)
                     element = self.get_element(locator_type, locator_value)
                     self.driver.execute_script("arguments[0].click();", element)
-                    log = (
-                        f'Клик на элемент: \n '
-                        f'С локатором: "{locator_type}" \n'
-                        f'и значением: "{locator_value}" \n'
-                        f'Выполнен с использованием JavaScript \n'
-                        f'На странице: "{current_url}" \n'
-                    )
-                    logger.info(log)
-                    allure.attach(
+
+                    def build_js_log() -> str:
+                        return (
+                            f'Клик на элемент: \n '
+                            f'С локатором: "{locator_type}" \n'
+                            f'и значением: "{locator_value}" \n'
+                            f'Выполнен с использованием JavaScript \n'
+                            f'На странице: "{page_url}" \n'
+                        )
+                    log_lazy(build_js_log)
+                    attach_evidence(
                         name="Клик с использованием JavaScript",
-                        body=log,
+                        body=build_js_log,
                         attachment_type=allure.attachment_type.TEXT
                     )
                     return True
@@ -243,13 +315,11 @@ class BasePage:
             text_to_enter (str): Текст для ввода.
             timeout (int): Таймаут ожидания
         """
-        try:
-            current_url = self.driver.current_url
-        except Exception:
-            current_url = "Нового окна браузера"
-        if self.wait_utils.wait_for_element_to_be_visible(
-                locator_type, locator_value, timeout=timeout) is True:
-            element = self.get_element(locator_type, locator_value)
+        element = self.wait_utils.wait_for_element_to_be_visible(
+            locator_type, locator_value, timeout=timeout, return_elem=True)
+        if element:
+            # URL фиксируется до ввода (Enter в тексте может отправить форму и сменить страницу)
+            page_url = self._current_url()
             try:
                 try:
                     # Очистка с помощью JavaScript
@@ -258,16 +328,18 @@ class BasePage:
                     # Очистка с помощью Selenium
                     element.clear()
                 element.send_keys(text_to_enter)
-                log_info = (
-                    f'Введен текст "{text_to_enter}" в элемент: \n'
-                    f'C локатором: "{locator_type}" \n'
-                    f'И значением: "{locator_value}" \n'
-                    f'На странице: "{current_url}" \n'
-                )
-                logger.info(log_info)
-                allure.attach(
+
+                def build_log() -> str:
+                    return (
+                        f'Введен текст "{text_to_enter}" в элемент: \n'
+                        f'C локатором: "{locator_type}" \n'
+                        f'И значением: "{locator_value}" \n'
+                        f'На странице: "{page_url}" \n'
+                    )
+                log_lazy(build_log)
+                attach_evidence(
                     name="Успешный ввод текста",
-                    body=log_info,
+                    body=build_log,
                     attachment_type=allure.attachment_type.TEXT
                 )
                 return True
@@ -276,7 +348,7 @@ class BasePage:
                     f'Ошибка при вводе текста "{text_to_enter}" в элемент: \n'
                     f'C локатором: "{locator_type}" \n'
                     f'И значением: "{locator_value}" \n'
-                    f'На странице: "{current_url}" \n'
+                    f'На странице: "{page_url}" \n'
                     f"{e}")
                 logger.error(error_message)
                 allure.attach(
@@ -292,11 +364,91 @@ class BasePage:
                 f'При попытке ввода текста: "{text_to_enter}" \n'
                 f'Элемент с локатором: "{locator_type}" \n'
                 f'И значением: "{locator_value}"\n'
-                f'НЕ ВИДЕН странице: "{current_url}" \n'
+                f'НЕ ВИДЕН странице: "{self._current_url()}" \n'
             )
             logger.error(error_message)
             assert False, error_message
 
+    @allure.step('Заполнение полей формы')
+    def fill_form(
+            self,
+            fields: dict[Tuple[str, str], str],
+            keystroke_fields: list[Tuple[str, str]] | None = None,
+            timeout: int = 5,
+    ) -> dict[Tuple[str, str], str | None]:
+        """
+        Заполняет поля формы за несколько вызовов вместо десятков команд на каждое поле:
+        значения устанавливаются одним скриптом с отправкой событий input/change,
+        затем все значения считываются одним вызовом и сверяются с ожидаемыми.
+        Прежний поэлементный ввод стоил 6 команд WebDriver на поле, fill_form - 4 команды на форму
+        плюс send_keys на каждое поле с вводом с клавиатуры (замер: benchmarks/bench_fill_form.py).
+
+        Args:
+            fields (dict): Словарь (тип локатора, значение локатора) -> текст для ввода.
+                           Поля со значением None пропускаются.
+            keystroke_fields (list): Локаторы полей, которым нужен настоящий ввод с клавиатуры
+                                     через send_keys (например, поля дат или поля с масками ввода).
+            timeout (int): Таймаут ожидания видимости первого поля формы.
+        Returns:
+            dict: Считанные значения полей (локатор -> value).
+        """
+        keystroke_fields = set(keystroke_fields or [])
+        fields = {locator: text for locator, text in fields.items() if text is not None}
+        if not fields:
+            return {}
+        payload = [
+            {
+                "by": self.get_locator(*locator)[0],
+                "value": locator[1],
+                "text": str(text),
+                "keystrokes": locator in keystroke_fields,
+            }
+            for locator, text in fields.items()
+        ]
+
+        with CommandCounter(self.driver) as counter:
+            # Форма отрисовывается целиком - достаточно дождаться первого поля
+            self.wait_utils.wait_for_element_to_be_visible(*next(iter(fields)), timeout=timeout)
+            result = self.driver.execute_script(FILL_FORM_JS, payload)
+            if result["missing"]:
+                error_message = (
+                    f"Поля формы НЕ НАЙДЕНЫ на странице: \n"
+                    f"{result['missing']} \n"
+                )
+                logger.error(error_message)
+                self.take_screenshot_when_error_and_scroll()
+                assert False, error_message
+
+            keystroke_items = [item for item in payload if item["keystrokes"]]
+            for item, element in zip(keystroke_items, result["keystroke_elements"]):
+                element.send_keys(item["text"])
+
+            values = self.driver.execute_script(READ_FORM_JS, payload)
+
+        read_back = dict(zip(fields, values))
+        mismatches = [
+            f'Поле "{locator[1]}": ожидалось "{fields[locator]}", фактически "{value}"'
+            for locator, value in read_back.items()
+            if locator not in keystroke_fields and value != str(fields[locator])
+        ]
+        report = "\n".join(f'{locator[1]}: "{value}"' for locator, value in read_back.items())
+        commands_log = (
+            f"Команд WebDriver: {counter.count} \n"
+            f"По типам: {dict(counter.commands)} \n"
+        )
+        logger.info(f"Заполнено полей формы: {len(fields)}. {commands_log}")
+        attach_evidence(
+            name="Заполнение формы",
+            body=f"{report}\n\n{commands_log}",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        if mismatches:
+            error_message = "Значения полей формы НЕ СООТВЕТСТВУЮТ ожидаемым: \n" + "\n".join(mismatches)
+            logger.error(error_message)
+            self.take_screenshot_when_error_and_scroll()
+            assert False, error_message
+        return read_back
+
     def navigate_to_url(
             self,
             base_url: str | None = None,
@@ -335,12 +487,12 @@ class BasePage:
         # Метод 1: JavaScript scrollIntoView
         try:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            logger.info(
+            log_lazy(lambda: (
                 f'Успешная прокрутка к элементу через JS скрипт scrollIntoView: \n'
                 f'Элемент с локатором: "{locator_type}" \n'
                 f'И значением: "{locator_value}"\n'
                 f'Стал успешно ВИДЕН'
-            )
+            ))
             success = True
         except Exception as js_e:
             logger.warning(
@@ -352,12 +504,12 @@ class BasePage:
         if not success:
             try:
                 self.actions.move_to_element(element).perform()
-                logger.info(
+                log_lazy(lambda: (
                     f"\nУспешная прокрутка к элементу через ActionChains: \n"
                     f'Элемент с локатором: "{locator_type}" \n'
                     f'И значением: "{locator_value}"\n'
                     f'Стал успешно ВИДЕН'
-                )
+                ))
                 success = True
             except Exception as actions_e:
                 logger.warning(
@@ -373,12 +525,12 @@ class BasePage:
                     "window.scrollTo(arguments[0], arguments[1]);",
                     element_location['x'], element_location['y']
                 )
-                logger.info(
+                log_lazy(lambda: (
                     f"\nУспешная прокрутка к элементу по координатам через JavaScript: \n"
                     f'Элемент с локатором: "{locator_type}" \n'
                     f'И значением: "{locator_value}"\n'
                     f'Стал успешно ВИДЕН'
-                )
+                ))
                 success = True
             except Exception as coords_e:
                 logger.warning(
@@ -435,7 +587,7 @@ class BasePage:
                         f'Из выпадающего списка'
                     )
                     logger.info(log_first)
-                    allure.attach(
+                    attach_evidence(
                         name="Успешный выбор элемента из выпадающего списка",
                         body=log_first,
                         attachment_type=allure.attachment_type.TEXT
@@ -457,7 +609,7 @@ class BasePage:
                             f'Из выпадающего списка \n'
                         )
                         logger.info(log_second)
-                        allure.attach(
+                        attach_evidence(
                             name="Успешный выбор элемента по тексту применением метода strip()",
                             body=log_second,
                             attachment_type=allure.attachment_type.TEXT
@@ -476,7 +628,7 @@ class BasePage:
                             throw 'Option not found';
                             """
                         self.driver.execute_script(script, dropdown_element)
-                        allure.attach(
+                        attach_evidence(
                             name='Выбор элемента с нормализованным текстом с использованием JavaScript',
                             body=f'Выбран элемент: "{normalized_text}" \n'
                                  f'Из выпадающего списка с использованием JavaScript',
@@ -547,7 +699,7 @@ class BasePage:
                             f'Повторная попытка его получения...'
                         )
                         logger.warning(msg)
-                        allure.attach(
+                        attach_evidence(
                             name="Повторная попытка получения текста элемента. \n",
                             body=msg
                         )
@@ -560,7 +712,7 @@ class BasePage:
                             f"Текст элемента пуст. \n"
                             f"Попытка № {attempt + 1} из оставшихся {retry_attempts}."
                         )
-                        allure.attach(
+                        attach_evidence(
                             name=f"Неуспешная попытка № {attempt + 1} получения текста элемента",
                             body=f"Текст элемента ПУСТ. \n"
                                  f"Ожидание {retry_delay} секунд и повторяем попытку...",
@@ -594,7 +746,7 @@ class BasePage:
                         f'Соответствует ожидаемому: "{expected_full_text or at_least_text}" \n'
                     )
                     logger.info(log)
-                    allure.attach(
+                    attach_evidence(
                         name="Успешная проверка текста элемента",
                         body=log,
                         attachment_type=allure.attachment_type.TEXT
@@ -659,7 +811,7 @@ class BasePage:
                             f'Соответствует ожидаемому: "{expected_text}"'
                         )
                         logger.info(log)
-                        allure.attach(
+                        attach_evidence(
                             name='Успешная проверка текста элемента',
                             body=log,
                             attachment_type=allure.attachment_type.TEXT
@@ -680,7 +832,7 @@ class BasePage:
                         f'Соответствует ожидаемому: "{expected_text}"'
                     )
                     logger.info(log)
-                    allure.attach(
+                    attach_evidence(
                         name='Успешная проверка текста элемента',
                         body=log,
                         attachment_type=allure.attachment_type.TEXT
@@ -699,7 +851,7 @@ class BasePage:
                             f'Соответствует ожидаемому: "{expected_text}"'
                         )
                         logger.info(log)
-                        allure.attach(
+                        attach_evidence(
                             name='Успешная проверка текста элемента',
                             body=log,
                             attachment_type=allure.attachment_type.TEXT
@@ -734,8 +886,8 @@ class BasePage:
             bool: True, если чекбокс отмечен, False в противном случае.
         """
         try:
-            element = self.get_element(locator_type, locator_value)
-            checkbox_selected: bool = element.is_selected()
+            element_state = inspect_existing_element(self.driver, self.get_locator(locator_type, locator_value))
+            checkbox_selected: bool = element_state["checked"]
             if checkbox_selected:
                 body = "ЧЕКБОКС - ОТМЕЧЕН"
             else:
@@ -746,7 +898,7 @@ class BasePage:
                 f'{body} \n'
             )
             logger.info(log)
-            allure.attach(
+            attach_evidence(
                 name="Проверка состояния чекбокса",
                 body=log,
                 attachment_type=allure.attachment_type.TEXT
@@ -803,7 +955,9 @@ class BasePage:
             self,
             locator_type: str,
             locator_value: str,
-            file_name: str
+            file_name: str,
+            verify_download: bool = False,
+            download_timeout: int = 60
     ) -> bool:
         """
         Проверка наличия и возможности скачивания прикрепленного PDF файла с электронной версией книги.
@@ -811,6 +965,8 @@ class BasePage:
         :param locator_type: Тип локатора элемента (например, 'xpath', 'css', 'id' и т.д.)
         :param locator_value: Значение локатора элемента
         :param file_name: Ожидаемое имя файла (без размера и других дополнительных данных)
+        :param verify_download: Дождаться завершения скачивания и сверить размер файла с Content-Length
+        :param download_timeout: Максимальное время ожидания завершения скачивания в секундах
         :return: True, если файл найден и может быть скачан, иначе False
         """
         try:
@@ -818,8 +974,8 @@ class BasePage:
             element = self.driver.find_element(getattr(By, locator_type.upper()), locator_value)
             displayed_file_name = element.text
             logger.info(f'Отображаемое имя файла: "{displayed_file_name}" \n')
-            allure.attach(name="Отображаемое имя файла", body=displayed_file_name,
-                          attachment_type=allure.attachment_type.TEXT)
+            attach_evidence(name="Отображаемое имя файла", body=displayed_file_name,
+                            attachment_type=allure.attachment_type.TEXT)
 
             # Удаляем все дополнительные данные из имени файла
             cleaned_displayed_file_name = re.sub(r'\s*\(\d+,\d+ МБ\)', '', displayed_file_name)
@@ -841,7 +997,7 @@ class BasePage:
             logger.info(f"URL файла: '{file_url}' \n")
 
             # Проверка доступности файла по URL
-            response = requests.head(file_url)
+            response = self.http_client.head(file_url)
             if response.status_code != 200:
                 error_message = (f"Файл не доступен для скачивания. \n"
                                  f'HTTP статус код: "{response.status_code}" \n')
@@ -849,51 +1005,54 @@ class BasePage:
                 allure.attach(name="Ошибка доступности файла", body=error_message,
                               attachment_type=allure.attachment_type.TEXT)
                 assert False, error_message
-            # Клик по элементу
-            self.click_on_element(locator_type, locator_value)
-            # Определение пути к директории загрузок
-            if platform.system() == "Windows":
-                download_dir = os.path.join(os.path.expanduser('~'), 'Downloads')
-            else:
-                download_dir = os.getcwd()  # Используем текущую директорию на Unix-подобных системах
-
-            # Проверка существования директории
-            if not os.path.exists(download_dir):
-                error_message = f'Директория "{download_dir}" НЕ СУЩЕСТВУЕТ. \n'
+            # Загрузка отслеживается в директории загрузок воркера (задается браузеру при создании драйвера)
+            with DownloadTracker() as tracker:
+                # Клик по элементу
+                self.click_on_element(locator_type, locator_value)
+                logger.info(f'\n Ожидание начала загрузки в директории: "{tracker.download_dir}" \n')
+                download_path = tracker.wait_for_start(file_name)
+                if download_path and verify_download:
+                    download_path = tracker.wait_for_complete(file_name, timeout=download_timeout)
+                if download_path and not verify_download:
+                    # Загрузка только началась: файл удаляется сразу (как и после полной проверки),
+                    # иначе повторное скачивание в этом воркере получит имя с номером дубликата
+                    tracker.remove_downloads(file_name)
+
+            if not download_path:
+                error_message = ("\n Ошибка при попытке скачивания файла: \n"
+                                 f"Загрузка НЕ {'завершилась' if verify_download else 'началась'} \n")
                 logger.error(error_message)
-                allure.attach(
-                    name="Ошибка директории",
-                    body=error_message,
-                    attachment_type=allure.attachment_type.TEXT
-                )
+                allure.attach(name="Ошибка загрузки",
+                              body=error_message, attachment_type=allure.attachment_type.TEXT)
                 assert False, error_message
 
-            logger.info(f'\n Ожидание начала загрузки в директории: "{download_dir}" \n')
-            download_started = self.wait_utils.wait_for_download_to_start(download_dir, file_name)
-
-            if download_started:
-                allure.attach(
+            if not verify_download:
+                attach_evidence(
                     name="Статус загрузки файла",
                     body=f'Файл: "{file_name}" скачивается ...',
                     attachment_type=allure.attachment_type.TEXT
                 )
                 logger.info(f'\n Файл: "{file_name}" успешно скачивается. \n')
-
-                # Удаление файла после успешного скачивания
-                file_path = os.path.join(download_dir, file_name)
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f'\n Файл: "{file_name}" успешно удален. \n')
-                else:
-                    logger.warning(f'\n Файл: "{file_name}" НЕ найден для удаления. \n')
                 return True
-            else:
-                error_message = ("\n Ошибка при попытке скачивания файла: \n"
-                                 "Загрузка НЕ началась \n")
-                logger.error(error_message)
-                allure.attach(name="Ошибка загрузки",
-                              body=error_message, attachment_type=allure.attachment_type.TEXT)
-                assert False, error_message
+
+            # Размер сверяется с Content-Length, если сервер отдает файл без сжатия
+            content_length = response.headers.get("Content-Length")
+            expected_size = int(content_length) if content_length and not response.headers.get(
+                "Content-Encoding") else None
+            try:
+                download_info = DownloadTracker.verify(download_path, expected_size=expected_size)
+            finally:
+                # Файл удаляется и при несовпадении размера: директория загрузок воркера общая для всех тестов
+                os.remove(download_path)
+                logger.info(f'\n Файл: "{file_name}" успешно удален. \n')
+            attach_evidence(
+                name="Статус загрузки файла",
+                body=f'Файл: "{file_name}" скачан. \n'
+                     f'Размер: {download_info.size} байт, sha256: {download_info.sha256}',
+                attachment_type=allure.attachment_type.TEXT
+            )
+            logger.info(f'\n Файл: "{file_name}" успешно скачан. \n')
+            return True
         except Exception as e:
             error_message = f"Неожиданная ошибка: {str(e)}"
             logger.error(error_message)
@@ -918,7 +1077,7 @@ class BasePage:
 
         if check_only_part_of_url:
             comparison = expected_url in current_url
-            allure.attach(
+            attach_evidence(
                 name="Проверка только статичной ЧАСТИ URL",
                 body=f"В связи с динамически изменяемым текущим URL, -->\n"
                      f"производится проверка лишь его статичной части: \n"
@@ -937,7 +1096,7 @@ class BasePage:
                 f'Фактическому URL: "{current_url}" \n')
 
         logger.info(message)
-        allure.attach(
+        attach_evidence(
             name="Сравнение URL",
             body=message,
             attachment_type=allure.attachment_type.TEXT
@@ -966,7 +1125,7 @@ class BasePage:
                 action = "Окно отклонено."
 
             # Добавляем отчет Allure
-            allure.attach(
+            attach_evidence(
                 name="Результат действия с всплывающем окном на странице.",
                 body=action,
                 attachment_type=allure.attachment_type.TEXT
@@ -1001,22 +1160,28 @@ class BasePage:
             locator_value: str | None = None
     ) -> None:
         """
-        Делает скриншот текущего окна браузера и прикрепляет его к отчету Allure.
+        Делает скриншот текущего окна браузера и передает его сервису скриншотов: без сжатия скриншот
+        прикрепляется к отчету Allure сразу, при сжатии (секция [screenshots]) - кодируется в фоне
+        и прикрепляется по окончании этапа теста.
+        При включенной опции crop_to_element (секция [screenshots]) скриншот обрезается по области элемента.
         """
+        element = None
         if locator_type and locator_value:
             try:
                 self.scroll_to_element(locator_type, locator_value)
+                if config_registry.get_bool(category="screenshots", key="crop_to_element", default=False):
+                    found = self.driver.find_elements(*self.get_locator(locator_type, locator_value))
+                    element = found[0] if found else None
             except Exception:
                 pass
 
-        screenshot = self.driver.get_screenshot_as_png()
-        logger.info("\n Создан скриншот во время ошибки \n")
-        with allure.step("Прикрепление скриншота во время ошибке"):
-            allure.attach(
+        if get_screenshot_service().capture(
+                self.driver,
                 name="Error Screenshot",
-                body=screenshot,
-                attachment_type=allure.attachment_type.PNG
-            )
+                step_title="Прикрепление скриншота во время ошибки",
+                element=element
+        ):
+            logger.info("\n Создан скриншот во время ошибки \n")
 
     @allure.step(
         'Проверка выбранного параметра: "{text_to_check}" в выпадающем списке элемента с локатором: "{locator_type}" и значением: "{locator_value}"')
@@ -1093,7 +1258,7 @@ class BasePage:
                 f'Доступные опции в выпадающем списке: \n {options}'
             )
             logger.info(log_options)
-            allure.attach(
+            attach_evidence(
                 name="Все опции в текущем активном выпадающем списке:",
                 body=log_options,
                 attachment_type=allure.attachment_type.TEXT
@@ -1140,8 +1305,9 @@ class BasePage:
         :param attribute: Имя атрибута, значение которого нужно получить
         :return: Значение атрибута элемента
         """
-        element = self.get_element(locator_type, locator_value)
-        return element.get_attribute(name=attribute)
+        element_state = inspect_existing_element(
+            self.driver, self.get_locator(locator_type, locator_value), attributes=[attribute])
+        return element_state["attributes"][attribute]
 
     def assert_attribute_status_in_element(
             self,
@@ -1161,7 +1327,9 @@ class BasePage:
         :param positive: Если True, проверяет наличие значения; если False, отсутствие.
         :return: True, если проверка успешна.
         """
-        status: str = self.get_element_attribute(locator_type, locator_value, attribute)
+        element_state = inspect_existing_element(
+            self.driver, self.get_locator(locator_type, locator_value), attributes=[attribute])
+        status: str = element_state["attributes"][attribute] or ""
         condition_met = (attr_value in status) if positive else (attr_value not in status)
 
         log_message = (
@@ -1174,11 +1342,14 @@ class BasePage:
         if condition_met:
             logger.info(log_message)
         else:
-            error_message = f'Ожидаемое {"наличие" if positive else "отсутствие"} значения атрибута "{attr_value}" не выполнено.'
+            error_message = (
+                f'Ожидаемое {"наличие" if positive else "отсутствие"} значения атрибута "{attr_value}" не выполнено. \n'
+                f'Состояние элемента: \n{format_element_state(element_state)}'
+            )
             logger.error(error_message)
             assert False, error_message
 
-        allure.attach(
+        attach_evidence(
             name="Статус атрибута",
             body=f'Для локатора: "{locator_type}" \n'
                  f'И значения: "{locator_value}" \n'
@@ -1224,6 +1395,52 @@ class BasePage:
                 )
             self.click_on_element(*locator_elem_to_close_slider)
 
+    @allure.step('Проверка доступности всех ссылок на странице')
+    def check_all_links_on_page(
+            self,
+            include_sources: bool = True,
+            ignore_urls: List[str] | None = None
+    ) -> List[LinkCheckResult]:
+        """
+        Собирает все ссылки (href) и ресурсы (src) текущей страницы одним скриптом и проверяет их
+        параллельно с cookies браузера. Статусы кэшируются по URL на всю сессию.
+        Результат прикрепляется к отчету одной таблицей.
+
+        :param include_sources: Проверять также ресурсы страницы (изображения, скрипты, стили, iframe).
+        :param ignore_urls: Префиксы URL, которые не проверяются.
+        :return: Результаты проверки.
+        :raises CustomAssertionError: Если найдена хотя бы одна недоступная ссылка.
+        """
+        links = self.driver.execute_script(COLLECT_LINKS_JS, include_sources) or []
+        if ignore_urls:
+            links = [link for link in links if not link["url"].startswith(tuple(ignore_urls))]
+
+        results = get_link_checker().check_links(links, client=self.http_client)
+        broken = [result for result in results if not result.ok]
+        log_message = (
+            f'Проверено ссылок на странице "{self._current_url()}": {len(results)}, '
+            f"недоступных: {len(broken)}"
+        )
+        if not broken:
+            logger.info(log_message)
+            attach_evidence(
+                name="Результаты проверки ссылок",
+                body=lambda: format_results_table(results),
+                attachment_type=allure.attachment_type.CSV
+            )
+            return results
+
+        log_message += "\n" + "\n".join(
+            f'"{result.url}" - {result.error or result.status}' for result in broken
+        )
+        logger.error(log_message)
+        allure.attach(
+            name="ОШИБКА: Недоступные ссылки на странице",
+            body=format_results_table(broken),
+            attachment_type=allure.attachment_type.CSV
+        )
+        raise CustomAssertionError(log_message)
+
     @allure.step('Поиск элементов в блоке по тексту: "{text_assert}"')
     def search_all_elems_contains_text(
             self,
@@ -1344,7 +1561,7 @@ class BasePage:
             else:
                 log_by_locator = f'Текст "{expected_absence_text}" отсутствует, как и ожидалось.'
                 logger.info(log_by_locator)
-                allure.attach(
+                attach_evidence(
                     name="Успешная проверка ОТСУТСТВИЯ текста на странице.",
                     body=log_by_locator
                 )
@@ -1363,24 +1580,72 @@ class BasePage:
                 raise CustomAssertionError(log_message)
             else:
                 log_full_page = f'Текст "{expected_absence_text}" отсутствует на странице, как и ожидалось.'
-                allure.attach(
+                attach_evidence(
                     name="Успешная проверка ОТСУТСТВИЯ текста на странице.",
                     body=log_full_page
                 )
                 logger.info(log_full_page)
                 return True
 
-    def try_to_find_errors_words(self):
+    @allure.step('Поиск критических слов в тексте страницы')
+    def try_to_find_errors_words(
+            self,
+            error_words: list[str] | None = None,
+            project_dir: str | None = None
+    ) -> bool:
         """
-        Ищет критические слова на странице из предустановленного списка и логирует их при нахождении, не прерывая выполнение.
+        Ищет критические слова на странице за один проход: текст страницы запрашивается один раз,
+        все слова ищутся одним скомпилированным выражением, все вхождения с контекстом
+        прикрепляются к отчету одним вложением.
+
+        Список слов и параметры поиска берутся из секции [page checks] config.ini проекта
+        (если указан project_dir и секция в нем есть), иначе - из общего config.ini.
+
+        Args:
+            error_words (list[str]): Явный список слов (переопределяет config.ini).
+            project_dir (str): Директория проекта для чтения его config.ini.
+        Returns:
+            bool: True, если критические слова не найдены.
+        Raises:
+            CustomAssertionError: Если найдено хотя бы одно критическое слово.
         """
-        error_words = [
-            "Error", "Timeout", "Abort",
-            "Fail", "Failure", "Invalid",
-            "Rejected", "Overflow", "Exception",
-            "TypeError", "SystemException", "unknown",
-        ]
-        for error_word in error_words:
-            self.absence_check(expected_absence_text=error_word)
+        # Секция проекта используется целиком, если она есть; иначе - общий config.ini
+        checks_dir = None
+        if project_dir and config_registry.get(
+                category="page checks", key="error_words", project_dir=project_dir, default=None) is not None:
+            checks_dir = project_dir
+
+        if error_words is None:
+            error_words = config_registry.get_list(category="page checks", key="error_words", project_dir=checks_dir)
+        scanner = PageTextScanner(
+            words=error_words,
+            whole_word=config_registry.get_bool(
+                category="page checks", key="whole_word", project_dir=checks_dir, default=False),
+            case_sensitive=config_registry.get_bool(
+                category="page checks", key="case_sensitive", project_dir=checks_dir, default=True),
+        )
 
+        page_text = self.driver.execute_script("return document.body.innerText;") or ""
+        hits = scanner.scan(page_text)
+        if not hits:
+            log_full_page = f"Критические слова {scanner.words} отсутствуют на странице, как и ожидалось."
+            logger.info(log_full_page)
+            attach_evidence(
+                name="Успешная проверка ОТСУТСТВИЯ критических слов на странице.",
+                body=log_full_page,
+                attachment_type=allure.attachment_type.TEXT
+            )
+            return True
 
+        self.take_screenshot_when_error_and_scroll()
+        log_message = (
+            f"На странице НАЙДЕНЫ критические слова ({len(hits)}), хотя их не должно быть: \n"
+            f"{PageTextScanner.format_hits(hits)}"
+        )
+        logger.error(log_message)
+        allure.attach(
+            name='ОШИБКА: Найдены запрещенные слова на странице!',
+            body=log_message,
+            attachment_type=allure.attachment_type.TEXT
+        )
+        raise CustomAssertionError(log_message)
@@ -1,5 +1,12 @@
+import time
+
 import allure
 from BaseUtils.pages.base_page import BasePage
+from BaseUtils.pages.page_context import PageContext
+from BaseUtils.utils.attachment_policy import attach_evidence
+from BaseUtils.utils.logger import logger
+from BaseUtils.utils.session_cache import get_session_cache
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
 
@@ -9,12 +16,14 @@ class LoginPage(BasePage):
     Наследуется от BasePage.
     """
 
-    def __init__(self, driver: WebDriver):
+    __slots__ = ()
+
+    def __init__(self, driver: WebDriver | PageContext):
         """
         Инициализирует объект LoginPage.
 
         Args:
-            driver (WebDriver): Экземпляр WebDriver для взаимодействия с браузером.
+            driver (WebDriver | PageContext): Экземпляр WebDriver или общий контекст страниц.
         """
         super().__init__(driver)
 
@@ -90,3 +99,82 @@ class LoginPage(BasePage):
         self.enter_login_username(login=username)
         self.enter_password(password=password)
         self.click_login_button()
+
+    def is_logged_in(self) -> bool:
+        """
+        Быстрая проверка (без ожиданий), что текущая сессия авторизована:
+        на странице есть меню пользователя.
+
+        Returns:
+            bool: True, если пользователь авторизован.
+        """
+        return bool(self.driver.find_elements(By.CSS_SELECTOR, "#fat-menu"))
+
+    def wait_until_logged_in(self, timeout: float = 10) -> bool:
+        """
+        Ожидает авторизации после отправки формы входа (появления меню пользователя).
+
+        Args:
+            timeout (float): Максимальное время ожидания в секундах.
+
+        Returns:
+            bool: True, если пользователь авторизован до истечения таймаута.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.is_logged_in():
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.2)
+
+    @allure.step("Авторизация с логином: {username} (с восстановлением сохраненной сессии)")
+    def login_with_session_cache(self, username: str, password: str) -> None:
+        """
+        Выполняет авторизацию, восстанавливая сохраненную сессию (cookies + localStorage).
+        Вход через UI выполняется, только если снимка сессии нет, он устарел или сервер его отклонил;
+        после такого входа сессия сохраняется для следующих тестов.
+
+        Args:
+            username (str): Логин пользователя.
+            password (str): Пароль пользователя.
+        """
+        cache = get_session_cache()
+        if cache is None:
+            self.login(username, password)
+            return
+
+        snapshot = cache.get(self.base_url, username, password)
+        if snapshot is not None:
+            start_time = time.perf_counter()
+            try:
+                cache.restore(self.driver, self.base_url, snapshot)
+                restored = self.is_logged_in()
+            except Exception as e:
+                logger.warning(f"Ошибка восстановления сессии: {e}")
+                restored = False
+            if restored:
+                cache.stats["hits"] += 1
+                cache.stats["restore_time"] += time.perf_counter() - start_time
+                attach_evidence(
+                    name="Восстановление сессии",
+                    body=f'Сессия пользователя "{username}" восстановлена без входа через UI',
+                    attachment_type=allure.attachment_type.TEXT
+                )
+                return
+            cache.stats["rejected"] += 1
+            cache.invalidate(self.base_url, username)
+            logger.warning(f'Сохраненная сессия пользователя "{username}" отклонена, вход через UI')
+        else:
+            cache.stats["misses"] += 1
+
+        start_time = time.perf_counter()
+        self.login(username, password)
+        cache.stats["ui_logins"] += 1
+        cache.stats["ui_login_time"] += time.perf_counter() - start_time
+        # login() возвращается сразу после нажатия кнопки: сохраняем только подтвержденную авторизацию,
+        # иначе снимок может содержать cookies до входа
+        if self.wait_until_logged_in():
+            cache.save(self.driver, self.base_url, username, password)
+        else:
+            logger.warning(f'Авторизация пользователя "{username}" не подтверждена, сессия не сохранена')
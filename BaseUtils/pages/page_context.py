@@ -0,0 +1,219 @@
+from typing import Tuple, List, Callable
+
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from BaseUtils.configurations.config_reader import config_registry, ConfigRegistry
+from BaseUtils.utils.http_client import BrowserHttpClient, create_http_client
+from BaseUtils.utils.logger import logger
+from BaseUtils.utils.wait_utils import WaitUtils
+
+# Карта типов локаторов, общая для всех страниц
+LOCATOR_MAP = {
+    "id": By.ID,
+    "name": By.NAME,
+    "class_name": By.CLASS_NAME,
+    "link_text": By.LINK_TEXT,
+    "xpath": By.XPATH,
+    "css": By.CSS_SELECTOR
+}
+
+
+class PageContext:
+    """
+    Общий контекст страниц одного драйвера: драйвер, конфигурация, ожидания, карта локаторов
+    и счетчики. Создается один раз на драйвер, объекты страниц только ссылаются на него.
+    """
+
+    __slots__ = (
+        "driver", "config", "base_url", "locator_map", "wait_utils",
+        "stats", "_actions", "_http_client", "_root_page",
+    )
+
+    def __init__(self, driver: WebDriver) -> None:
+        """
+        Args:
+            driver (WebDriver): Экземпляр WebDriver для Selenium.
+        """
+        self.driver = driver
+        self.config: ConfigRegistry = config_registry
+        self.base_url: str = config_registry.get(category="basic info", key="base_url")
+        self.locator_map = LOCATOR_MAP
+        self.stats = {"pages_created": 0}
+        self._actions: ActionChains | None = None
+        self._http_client: BrowserHttpClient | None = None
+        self._root_page = None
+        self.wait_utils = WaitUtils(
+            driver,
+            self.get_locator,
+            self.get_element,
+            self.take_screenshot_when_error_and_scroll
+        )
+
+    @property
+    def actions(self) -> ActionChains:
+        """
+        ActionChains драйвера, создается при первом обращении.
+        """
+        if self._actions is None:
+            self._actions = ActionChains(self.driver)
+        return self._actions
+
+    @property
+    def http_client(self) -> BrowserHttpClient:
+        """
+        HTTP-клиент драйвера с пулом соединений и cookies браузера, создается при первом обращении.
+        """
+        if self._http_client is None:
+            self._http_client = create_http_client(self.driver)
+        return self._http_client
+
+    def close(self) -> None:
+        """
+        Освобождает ресурсы контекста: закрывает HTTP-клиент (пул соединений requests.Session).
+        """
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def get_locator(self, locator_type: str, locator_value: str) -> Tuple[str, str]:
+        """
+        Получение кортежа с локатором для поиска элемента в Selenium.
+
+        Args:
+            locator_type (str): Тип локатора (например, "id", "xpath").
+            locator_value (str): Значение локатора.
+
+        Returns:
+            Tuple[str, str]: Кортеж с типом и значением локатора.
+        """
+        try:
+            return self.locator_map[locator_type], locator_value
+        except KeyError:
+            error = ValueError(f"Неподдерживаемый Тип Локатора: {locator_type}")
+            logger.error(f"Ошибка при получении локатора: {error}")
+            raise error
+
+    def get_element(
+            self,
+            locator_type: str,
+            locator_value: str,
+            list_of_elements: bool = False,
+    ) -> WebElement | List[WebElement]:
+        """
+        Находит и возвращает элемент на странице по заданному локатору и его значению.
+
+        Args:
+            locator_type (str): Тип локатора (например, "id", "xpath").
+            locator_value (str): Значение локатора.
+            list_of_elements (bool): Нужно ли вернуть СПИСОК всех элементов?
+
+        Returns:
+            WebElement или List[WebElement]: Элемент веб-страницы или список элементов.
+
+        Raises:
+            NoSuchElementException: Если элемент не найден на странице.
+            ValueError: Если тип локатора не поддерживается.
+        """
+        try:
+            element_locator: Tuple[str, str] = self.get_locator(locator_type, locator_value)
+            if list_of_elements:
+                # Возвращаем список элементов
+                return self.driver.find_elements(*element_locator)
+            else:
+                # Возвращаем один элемент
+                return self.driver.find_element(*element_locator)
+        except (NoSuchElementException, TimeoutException, Exception) as e:
+            error_message = (
+                f'Элемент с локатором: "{locator_type}" \n'
+                f'И значением: "{locator_value}" \n'
+                f"НЕ НАЙДЕН на странице с помощью метода find_element-s: \n\n"
+                f"{e}"
+            )
+            logger.error(error_message)
+            raise e
+
+    def take_screenshot_when_error_and_scroll(
+            self,
+            locator_type: str | None = None,
+            locator_value: str | None = None
+    ) -> None:
+        """
+        Скриншот при ошибке (с прокруткой к элементу) через базовую страницу контекста.
+        """
+        if self._root_page is None:
+            from BaseUtils.pages.base_page import BasePage  # Отложенный импорт: base_page импортирует этот модуль
+            self._root_page = BasePage(self)
+        self._root_page.take_screenshot_when_error_and_scroll(locator_type, locator_value)
+
+
+# Атрибут драйвера, в котором хранится его контекст: контекст живет ровно столько же, сколько драйвер
+# (слабый словарь драйвер -> контекст не освобождался бы - контекст сам ссылается на драйвер)
+CONTEXT_ATTRIBUTE = "_page_context"
+
+
+def get_page_context(driver: WebDriver) -> PageContext:
+    """
+    Возвращает общий контекст страниц для драйвера (создает при первом обращении).
+
+    Args:
+        driver (WebDriver): Экземпляр WebDriver для Selenium.
+    Returns:
+        PageContext: Контекст страниц драйвера.
+    """
+    context = getattr(driver, CONTEXT_ATTRIBUTE, None)
+    if context is None:
+        context = PageContext(driver)
+        setattr(driver, CONTEXT_ATTRIBUTE, context)
+    return context
+
+
+def release_page_context(driver: WebDriver) -> None:
+    """
+    Отвязывает контекст страниц от драйвера и закрывает его ресурсы.
+    Вызывается при завершении сценария: браузер из пула следующий тест получает с новым контекстом.
+
+    Args:
+        driver (WebDriver): Экземпляр WebDriver для Selenium.
+    """
+    context = getattr(driver, CONTEXT_ATTRIBUTE, None)
+    if context is not None:
+        delattr(driver, CONTEXT_ATTRIBUTE)
+        context.close()
+
+
+class LazyPage:
+    """
+    Дескриптор вложенного объекта страницы, создаваемого при первом обращении
+    с тем же контекстом, что и у владельца. Значение хранится в слоте "_<имя атрибута>",
+    который должен быть объявлен в __slots__ класса-владельца.
+
+    Пример:
+        class CreatingUser(BasePage):
+            __slots__ = ("_login_page",)
+            login_page = LazyPage(LoginPage)
+    """
+
+    def __init__(self, factory: Callable) -> None:
+        """
+        Args:
+            factory (Callable): Класс страницы или функция, принимающая PageContext.
+        """
+        self.factory = factory
+        self.slot_name = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.slot_name = f"_{name}"
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        try:
+            return getattr(page, self.slot_name)
+        except AttributeError:
+            nested_page = self.factory(page.context)
+            setattr(page, self.slot_name, nested_page)
+            return nested_page
@@ -1,13 +1,16 @@
 import allure
 
 from BaseUtils.pages.base_page import BasePage
+from BaseUtils.pages.page_context import PageContext
 from selenium.webdriver.remote.webdriver import WebDriver
 from BaseUtils.configurations.config_reader import read_configuration
 
 
 class SetUncompletedPrograms(BasePage):
 
-    def __init__(self, driver: WebDriver):
+    __slots__ = ("corp_university_settings_endpoint",)
+
+    def __init__(self, driver: WebDriver | PageContext):
         super().__init__(driver)
         self.corp_university_settings_endpoint = read_configuration(
             category="basic info",
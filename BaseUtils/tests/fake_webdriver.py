@@ -0,0 +1,113 @@
+"""
+Драйвер без браузера для тестов и бенчмарков команд WebDriver.
+
+Настоящий selenium WebDriver подключается к исполнителю команд FakeFormBrowser, который хранит
+значения полей формы и отвечает на команды, используемые при вводе текста и заполнении форм:
+поиск элементов, ожидания (скрипты условий), FILL_FORM_JS/READ_FORM_JS, очистка и send_keys.
+Все команды проходят через WebDriver.execute, поэтому их можно считать CommandCounter.
+"""
+import base64
+import re
+import time
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from BaseUtils.pages.base_page import FILL_FORM_JS, READ_FORM_JS
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Прозрачное изображение 1x1 для команды скриншота
+PIXEL_PNG = base64.b64encode(bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)).decode()
+
+
+class FakeFormBrowser:
+    """
+    Исполнитель команд WebDriver со страницей из полей ввода: значение локатора -> текущее значение поля.
+    """
+
+    def __init__(self, fields: dict[str, str], url: str = "http://form.test/page", latency: float = 0.0) -> None:
+        """
+        :param fields: Значение локатора поля -> начальное значение поля.
+        :param url: URL страницы.
+        :param latency: Задержка ответа на каждую команду (время обращения к драйверу браузера), сек.
+        """
+        self.fields = dict(fields)
+        self.url = url
+        self.latency = latency
+        # Поля, которые браузер "не принимает" через сеттер (значение после FILL_FORM_JS остается прежним)
+        self.read_only: set[str] = set()
+
+    def execute(self, command: str, params: dict) -> dict:
+        if self.latency:
+            time.sleep(self.latency)
+        if command == Command.NEW_SESSION:
+            return {"value": {"sessionId": "fake", "capabilities": {"browserName": "fake"}}}
+        if command == Command.GET_CURRENT_URL:
+            return {"value": self.url}
+        if command in (Command.FIND_ELEMENT, Command.FIND_ELEMENTS):
+            # Selenium передает локаторы id и name как CSS-селекторы [id="..."] / [name="..."]
+            match = re.fullmatch(r'\[(?:id|name)="(.*)"\]', params["value"])
+            name = match.group(1) if match else params["value"]
+            found = [self._ref(name)] if name in self.fields else []
+            if command == Command.FIND_ELEMENTS:
+                return {"value": found}
+            if not found:
+                return {"status": "no such element", "value": {"message": f"{name} not found"}}
+            return {"value": found[0]}
+        if command == Command.SEND_KEYS_TO_ELEMENT:
+            self.fields[params["id"]] += params["text"]
+            return {"value": None}
+        if command == Command.CLEAR_ELEMENT:
+            self.fields[params["id"]] = ""
+            return {"value": None}
+        if command == Command.SCREENSHOT:
+            return {"value": PIXEL_PNG}
+        if command in (Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC):
+            return {"value": self._script(params["script"], params["args"])}
+        return {"value": None}
+
+    def _ref(self, name: str) -> dict:
+        return {ELEMENT_KEY: name}
+
+    def _script(self, script: str, args: list):
+        if script == FILL_FORM_JS:
+            missing, keystroke_elements = [], []
+            for field in args[0]:
+                name = field["value"]
+                if name not in self.fields:
+                    missing.append(name)
+                elif field["keystrokes"]:
+                    self.fields[name] = ""
+                    keystroke_elements.append(self._ref(name))
+                elif name not in self.read_only:
+                    self.fields[name] = field["text"]
+            return {"missing": missing, "keystroke_elements": keystroke_elements}
+        if script == READ_FORM_JS:
+            return [self.fields.get(field["value"]) for field in args[0]]
+        if "checkCondition" in script:
+            name = args[1]
+            if name not in self.fields:
+                return {"state": "missing", "element": None, "value": None}
+            return {"state": "ok", "element": self._ref(name), "value": self.fields[name], "polls": 1}
+        if script.strip() == "arguments[0].value = '';":
+            self.fields[args[0][ELEMENT_KEY]] = ""
+            return None
+        # Прочие скрипты (проверка видимости Selenium, прокрутка): элемент видим
+        return True
+
+
+def create_fake_driver(fields: dict[str, str], latency: float = 0.0) -> tuple[WebDriver, FakeFormBrowser]:
+    """
+    Создает WebDriver, подключенный к FakeFormBrowser с указанными полями.
+
+    :param fields: Значение локатора поля -> начальное значение поля.
+    :param latency: Задержка ответа на каждую команду, сек.
+    :return: Драйвер и исполнитель команд (для проверки состояния полей).
+    """
+    browser = FakeFormBrowser(fields, latency=latency)
+    return WebDriver(command_executor=browser, options=ArgOptions()), browser
@@ -0,0 +1,34 @@
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.download_cache import INDEX_FILE, DownloadCache
+
+
+def use_entries(cache_dir: str, worker_id: int, count: int) -> None:
+    """
+    Воркер: отмечает использование своих файлов кэша (каждый раз чтение, изменение и запись индекса).
+    """
+    cache = DownloadCache(cache_dir=cache_dir)
+    for index in range(count):
+        entry = {"path": f"/cache/{worker_id}/{index}", "size": 1, "content_type": None, "fetched_at": 0.0}
+        cache._use(f"http://example.test/{worker_id}/{index}", entry, revalidated=False)
+
+
+def test_index_updates_from_parallel_processes(tmp_path) -> None:
+    """
+    Изменения индекса из нескольких процессов не теряются: каждый процесс изменяет индекс под блокировкой файла.
+    """
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(use_entries, str(tmp_path), worker_id, 25) for worker_id in range(4)]:
+            future.result()
+
+    with open(tmp_path / INDEX_FILE, encoding="utf-8") as file:
+        index = json.load(file)
+    assert len(index) == 100
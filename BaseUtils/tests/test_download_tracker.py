@@ -0,0 +1,104 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils import download_tracker
+from BaseUtils.utils.download_tracker import DownloadTracker, _PollingWatcher
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def make_tracker(request, monkeypatch, tmp_path):
+    """
+    Фикстура создания трекера во временной директории: через inotify (на Linux) и через опрос директории.
+    """
+    if request.param == "polling":
+        monkeypatch.setattr(download_tracker, "_create_watcher", lambda path: _PollingWatcher(path))
+    elif not sys.platform.startswith("linux"):
+        pytest.skip("inotify доступен только на Linux")
+
+    def make(**kwargs) -> DownloadTracker:
+        return DownloadTracker(str(tmp_path), **kwargs)
+    return make
+
+
+def write_later(path: str, data: bytes, delay: float = 0.1) -> threading.Thread:
+    """
+    Имитация браузера: запись в незавершенный файл и переименование в итоговый через delay секунд.
+    """
+    def download() -> None:
+        time.sleep(delay)
+        with open(path + ".crdownload", "wb") as file:
+            file.write(data)
+        time.sleep(delay)
+        os.replace(path + ".crdownload", path)
+    thread = threading.Thread(target=download)
+    thread.start()
+    return thread
+
+
+def test_wait_for_start_and_complete(make_tracker, tmp_path) -> None:
+    """
+    Начало загрузки обнаруживается по незавершенному файлу, завершение - по переименованию в итоговый.
+    """
+    with make_tracker() as tracker:
+        thread = write_later(str(tmp_path / "report.pdf"), b"data")
+        started = tracker.wait_for_start("report.pdf", timeout=5)
+        completed = tracker.wait_for_complete("report.pdf", timeout=5)
+        thread.join()
+
+    assert started is not None and started.startswith(str(tmp_path / "report.pdf"))
+    assert completed == str(tmp_path / "report.pdf")
+
+
+def test_duplicate_names_and_foreign_downloads(make_tracker, tmp_path) -> None:
+    """
+    Файл с номером дубликата ("report (1).pdf") считается загрузкой report.pdf,
+    файлы до создания трекера и загрузки других файлов - нет.
+    """
+    (tmp_path / "report.pdf").write_bytes(b"old")
+    with make_tracker() as tracker:
+        (tmp_path / "other.pdf").write_bytes(b"other")
+        assert tracker.wait_for_complete("report.pdf", timeout=0.2) is None
+
+        (tmp_path / "report (1).pdf").write_bytes(b"new")
+        assert tracker.wait_for_complete("report.pdf", timeout=1) == str(tmp_path / "report (1).pdf")
+
+        assert tracker.remove_downloads("report.pdf") == ["report (1).pdf"]
+    assert sorted(os.listdir(tmp_path)) == ["other.pdf", "report.pdf"]
+
+
+def test_unconfirmed_download_only_when_single(make_tracker, tmp_path) -> None:
+    """
+    Незавершенная загрузка без имени (Chrome "Unconfirmed") учитывается, только если других новых файлов нет.
+    """
+    with make_tracker() as tracker:
+        (tmp_path / "Unconfirmed 123.crdownload").write_bytes(b"")
+        assert tracker.wait_for_start("report.pdf", timeout=0.2) is not None
+
+        (tmp_path / "other.pdf").write_bytes(b"other")
+        assert tracker.wait_for_start("report.pdf", timeout=0.2) is None
+
+
+def test_verify(tmp_path) -> None:
+    """
+    Проверка размера и контрольной суммы скачанного файла.
+    """
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"x" * 1000)
+    sha256 = hashlib.sha256(b"x" * 1000).hexdigest()
+
+    info = DownloadTracker.verify(str(path), expected_size=1000, expected_sha256=sha256.upper(), chunk_size=64)
+    assert (info.size, info.sha256) == (1000, sha256)
+    with pytest.raises(AssertionError, match="Размер файла"):
+        DownloadTracker.verify(str(path), expected_size=999)
+    with pytest.raises(AssertionError, match="Контрольная сумма"):
+        DownloadTracker.verify(str(path), expected_sha256="0" * 64)
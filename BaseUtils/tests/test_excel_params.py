@@ -0,0 +1,91 @@
+import os
+import sys
+
+import openpyxl
+import pytest
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.excel_params import load_cases, shard_index
+from BaseUtils.utils.excel_reader import ExcelReader
+from BaseUtils.utils.parallel_runner import split_longest_first
+
+
+@pytest.fixture(scope="module")
+def project_dir(tmp_path_factory) -> str:
+    """
+    Фикстура проекта с книгой users.xlsx (50 строк, повторяющийся логин в последней строке).
+    """
+    directory = tmp_path_factory.mktemp("project")
+    os.makedirs(directory / "credentials")
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Users"
+    sheet.append(["login", "age"])
+    for index in range(49):
+        sheet.append([f"user {index}", index])
+    sheet.append(["user 0", 100])
+    workbook.save(directory / "credentials" / "users.xlsx")
+    return str(directory)
+
+
+def test_cases_have_stable_ids(project_dir: str) -> None:
+    """
+    Идентификаторы случаев берутся из столбца id_column (повторы получают суффикс) или из номера строки.
+    """
+    cases = load_cases("users.xlsx", project_dir, sheet_name="Users", id_column="login",
+                       schema={"login": "str", "age": "int"}, worker=(0, 1))
+    assert [case.id for case in cases[:2]] == ["user_0", "user_1"]
+    assert cases[-1].id == "user_0-2"
+    assert cases[-1].data == {"login": "user 0", "age": 100}
+
+    by_row = load_cases("users.xlsx", project_dir, worker=(0, 1))
+    assert [case.id for case in by_row[:2]] == ["row1", "row2"]
+
+
+def test_shards_cover_all_rows_once(project_dir: str) -> None:
+    """
+    Шарды воркеров не пересекаются, вместе содержат все строки и повторяются при повторном чтении.
+    """
+    all_ids = [case.id for case in load_cases("users.xlsx", project_dir, id_column="login", worker=(0, 1))]
+    shards = [[case.id for case in load_cases("users.xlsx", project_dir, id_column="login", worker=(worker_id, 3))]
+              for worker_id in range(3)]
+
+    assert sorted(sum(shards, [])) == sorted(all_ids)
+    assert all(shards)
+    assert [case.id for case in load_cases("users.xlsx", project_dir, id_column="login", worker=(1, 3))] == shards[1]
+
+
+def test_worker_converts_only_its_rows(project_dir: str, monkeypatch) -> None:
+    """
+    Строки распределяются по исходному значению id_column: воркер преобразует только свои строки.
+    """
+    converted = []
+    process_cell_value = ExcelReader._process_cell_value
+
+    def counting_process(cell_value):
+        converted.append(cell_value)
+        return process_cell_value(cell_value)
+
+    monkeypatch.setattr(ExcelReader, "_process_cell_value", staticmethod(counting_process))
+    cases = load_cases("users.xlsx", project_dir, sheet_name="Users", id_column="login", worker=(2, 4))
+
+    assert cases and len(cases) < 50
+    assert all(shard_index(case.shard_key, 4) == 2 for case in cases)
+    # Два столбца на каждую строку воркера, строки других воркеров не преобразуются
+    assert len(converted) == 2 * len(cases)
+
+
+def test_pinned_tests_stay_on_their_worker() -> None:
+    """
+    Раннер отдает закрепленные случаи Excel их воркерам и учитывает их нагрузку при распределении остальных тестов.
+    """
+    tests = ["a", "b", "case[1]", "case[2]"]
+    history = {"a": 10.0, "b": 1.0, "case[1]": 5.0, "case[2]": 5.0}
+    shards, makespan = split_longest_first(tests, 2, history, pinned={"case[1]": 0, "case[2]": 0})
+
+    assert shards == [["case[1]", "case[2]", "b"], ["a"]]
+    assert makespan == 11.0
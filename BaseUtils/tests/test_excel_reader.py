@@ -0,0 +1,150 @@
+import datetime
+import os
+import sys
+
+import openpyxl
+import pytest
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.excel_reader import ExcelReader, ExcelSchemaError
+
+
+def write_workbook(path: str, rows: list[tuple], headers: tuple = ("login", "age")) -> None:
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(list(headers))
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def make_reader(project_dir: str, cache_dir: str, **kwargs) -> ExcelReader:
+    reader = ExcelReader(project_dir, "users.xlsx", use_cache=True, **kwargs)
+    reader.cache_dir = cache_dir
+    return reader
+
+
+def test_cache_hit_returns_same_data_as_miss(tmp_path) -> None:
+    """
+    Чтение из кэша (в том числе lazy=True) возвращает те же данные, что и чтение книги;
+    изменение списков в строках вызывающим кодом не попадает в кэш.
+    """
+    os.makedirs(tmp_path / "credentials")
+    cache_dir = str(tmp_path / "cache")
+    write_workbook(str(tmp_path / "credentials" / "users.xlsx"),
+                   [("admin;editor", 1.0), ("https://example.com", None), (None, None), ("viewer", 2.5)])
+    expected = [
+        {"login": ["admin", "editor"], "age": "1"},
+        {"login": ["https://example.com"], "age": None},
+        {"login": "viewer", "age": "2.5"},
+    ]
+
+    rows = make_reader(str(tmp_path), cache_dir).get_data(lazy=True)
+    assert not isinstance(rows, list)
+    first = next(rows)
+    assert first == expected[0]
+    # Изменение строки до окончания чтения (кэш еще записывается)
+    first["login"].append("changed")
+    assert list(rows) == expected[1:]
+
+    assert os.listdir(cache_dir)
+    assert make_reader(str(tmp_path), cache_dir).get_data() == expected
+    assert list(make_reader(str(tmp_path), cache_dir).get_data(lazy=True)) == expected
+    assert ExcelReader(str(tmp_path), "users.xlsx", use_cache=False).get_data() == expected
+
+
+def test_cache_of_changed_workbook_is_pruned(tmp_path) -> None:
+    """
+    После изменения книги кэши ее предыдущей версии (для всех листов и схем) удаляются при записи нового кэша.
+    """
+    os.makedirs(tmp_path / "credentials")
+    workbook_path = str(tmp_path / "credentials" / "users.xlsx")
+    cache_dir = str(tmp_path / "cache")
+    write_workbook(workbook_path, [("user", 1)])
+
+    assert make_reader(str(tmp_path), cache_dir).get_data() == [{"login": "user", "age": "1"}]
+    make_reader(str(tmp_path), cache_dir, schema={"age": "int"}).get_data()
+    assert len(os.listdir(cache_dir)) == 2
+
+    write_workbook(workbook_path, [("user", 2), ("other", 3)])
+    os.utime(workbook_path, ns=(os.stat(workbook_path).st_atime_ns, os.stat(workbook_path).st_mtime_ns + 10 ** 9))
+
+    reader = make_reader(str(tmp_path), cache_dir)
+    assert reader.get_data() == [{"login": "user", "age": "2"}, {"login": "other", "age": "3"}]
+    assert os.listdir(cache_dir) == [os.path.basename(reader._cache_path(None))]
+    # Повторное чтение - из кэша текущей версии
+    assert make_reader(str(tmp_path), cache_dir).get_data()[1] == {"login": "other", "age": "3"}
+
+
+SCHEMA_HEADERS = ("age", "name", "roles", "tags", "links", "born", "expires")
+SCHEMA = {"age": "int", "name": "str", "roles": "list", "tags": "list:,", "links": "url_list",
+          "born": "date", "expires": "date:%d.%m.%Y"}
+
+
+def read_with_schema(tmp_path, rows: list[tuple], schema: dict = SCHEMA) -> list[dict]:
+    os.makedirs(tmp_path / "credentials", exist_ok=True)
+    write_workbook(str(tmp_path / "credentials" / "users.xlsx"), rows, headers=SCHEMA_HEADERS)
+    return ExcelReader(str(tmp_path), "users.xlsx", use_cache=False, schema=schema).get_data()
+
+
+def test_schema_converts_each_type(tmp_path) -> None:
+    """
+    Каждый тип схемы преобразует значения ячеек по своим правилам; пустые ячейки остаются None.
+    """
+    rows = [
+        (1.0, 42, "admin;editor", "a,b", "https://a.test;http://b.test", datetime.datetime(2000, 1, 31), "31.12.2030"),
+        ("7", "Иван", "viewer", 5, "https://c.test", "15.06.1999", None),
+        (None, None, None, None, None, "2001-02-03", "01.01.2031"),
+    ]
+
+    assert read_with_schema(tmp_path, rows) == [
+        {"age": 1, "name": "42", "roles": ["admin", "editor"], "tags": ["a", "b"],
+         "links": ["https://a.test", "http://b.test"], "born": datetime.date(2000, 1, 31),
+         "expires": datetime.date(2030, 12, 31)},
+        {"age": 7, "name": "Иван", "roles": ["viewer"], "tags": ["5"], "links": ["https://c.test"],
+         "born": datetime.date(1999, 6, 15), "expires": None},
+        {"age": None, "name": None, "roles": None, "tags": None, "links": None,
+         "born": datetime.date(2001, 2, 3), "expires": datetime.date(2031, 1, 1)},
+    ]
+
+
+@pytest.mark.parametrize("column, value", [
+    ("age", "семь"),
+    ("age", 2.5),
+    ("links", "https://a.test;ftp://b.test"),
+    ("born", "31/01/2000"),
+    ("expires", "2030-12-31"),
+])
+def test_schema_bad_cell_reports_excel_position(tmp_path, column: str, value) -> None:
+    """
+    Значение, не соответствующее типу, вызывает ExcelSchemaError с номером строки Excel и именем столбца.
+    """
+    good = (1, "user", "viewer", "a", "https://a.test", "2000-01-31", "31.12.2030")
+    bad = tuple(value if header == column else cell for header, cell in zip(SCHEMA_HEADERS, good))
+
+    with pytest.raises(ExcelSchemaError) as error:
+        read_with_schema(tmp_path, [good, (None,) * len(good), good, bad])
+    # Заголовки - строка 1, пустая строка 3 пропускается, но учитывается в нумерации
+    assert (error.value.row, error.value.column) == (5, column)
+    assert column in str(error.value)
+
+
+def test_schema_missing_columns(tmp_path) -> None:
+    """
+    Столбцы схемы, которых нет на листе, обнаруживаются при чтении заголовков (строка 1).
+    """
+    with pytest.raises(ExcelSchemaError) as error:
+        read_with_schema(tmp_path, [(1, "user")], schema={"age": "int", "email": "str"})
+    assert (error.value.row, error.value.column) == (1, "email")
+
+
+def test_schema_unknown_type_fails_at_construction(tmp_path) -> None:
+    """
+    Неизвестный тип столбца обнаруживается при создании ExcelReader, до открытия файла.
+    """
+    with pytest.raises(ExcelSchemaError, match="Неизвестный тип столбца"):
+        ExcelReader(str(tmp_path), "missing.xlsx", use_cache=False, schema={"age": "float"})
@@ -0,0 +1,70 @@
+import os
+import sys
+
+import pytest
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.pages.base_page import BasePage
+from BaseUtils.tests.fake_webdriver import create_fake_driver
+from BaseUtils.utils.command_counter import CommandCounter
+
+
+def test_command_counter_nested_and_restored() -> None:
+    """
+    Вложенные счетчики считают свои команды, после выхода метод execute драйвера восстанавливается.
+    """
+    driver, _ = create_fake_driver({"login": ""})
+    original_execute = driver.execute
+
+    with CommandCounter(driver) as outer:
+        _ = driver.current_url
+        with CommandCounter(driver) as inner:
+            driver.execute_script("return 1;")
+        _ = driver.current_url
+
+    assert (outer.count, inner.count) == (3, 1)
+    assert outer.commands == {"getCurrentUrl": 2, "w3cExecuteScript": 1}
+    assert "execute" not in vars(driver) and driver.execute == original_execute
+
+
+def test_fill_form_sets_and_reads_back_values() -> None:
+    """
+    Поля заполняются одним скриптом, поля с масками - через send_keys; значения None пропускаются.
+    """
+    driver, browser = create_fake_driver({"login": "old", "password": "", "birthday": "", "comment": "keep"})
+    fields = {("id", "login"): "user", ("name", "password"): "secret", ("id", "birthday"): "01.01.2000",
+              ("id", "comment"): None}
+
+    with CommandCounter(driver) as counter:
+        values = BasePage(driver).fill_form(fields, keystroke_fields=[("id", "birthday")])
+
+    assert values == {("id", "login"): "user", ("name", "password"): "secret", ("id", "birthday"): "01.01.2000"}
+    assert browser.fields["comment"] == "keep"
+    assert counter.commands["sendKeysToElement"] == 1
+    assert counter.count == 5
+
+
+def test_fill_form_missing_fields() -> None:
+    """
+    Отсутствующие на странице поля перечисляются в ошибке.
+    """
+    driver, _ = create_fake_driver({"login": ""})
+
+    with pytest.raises(AssertionError, match="НЕ НАЙДЕНЫ") as error:
+        BasePage(driver).fill_form({("id", "login"): "user", ("id", "email"): "a@b.c"})
+    assert "email" in str(error.value)
+
+
+def test_fill_form_value_mismatch() -> None:
+    """
+    Значение, не принятое полем, обнаруживается при чтении значений после заполнения.
+    """
+    driver, browser = create_fake_driver({"login": "", "code": "0000"})
+    browser.read_only.add("code")
+
+    with pytest.raises(AssertionError, match='Поле "code": ожидалось "1234", фактически "0000"'):
+        BasePage(driver).fill_form({("id", "login"): "user", ("id", "code"): "1234"})
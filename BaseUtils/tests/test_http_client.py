@@ -0,0 +1,56 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.http_client import BrowserHttpClient
+
+
+class CookiesDriver:
+    """
+    Драйвер с минимальным набором команд, нужных HTTP-клиенту: текущий URL, cookies и User-Agent.
+    """
+
+    def __init__(self) -> None:
+        self.current_url = "http://example.test/page1"
+        self.cookies = [{"name": "session", "value": "1", "domain": "example.test", "path": "/"}]
+        self.get_cookies_calls = 0
+
+    def get_cookies(self) -> list[dict]:
+        self.get_cookies_calls += 1
+        return list(self.cookies)
+
+    def execute_script(self, script: str) -> str:
+        return "test-agent"
+
+
+def test_cookies_synced_once_per_page() -> None:
+    """
+    Cookies запрашиваются у браузера только при смене страницы (или принудительно), в том числе из нескольких потоков.
+    """
+    driver = CookiesDriver()
+    client = BrowserHttpClient(driver)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: client.sync_cookies(), range(32)))
+    assert driver.get_cookies_calls == 1
+    assert client.session.cookies.get("session") == "1"
+    assert client.session.headers["User-Agent"] == "test-agent"
+
+    driver.cookies = [{"name": "session", "value": "2", "domain": "example.test", "path": "/"}]
+    client.sync_cookies()
+    assert client.session.cookies.get("session") == "1"
+
+    client.sync_cookies(force=True)
+    assert client.session.cookies.get("session") == "2"
+
+    driver.current_url = "http://example.test/page2"
+    driver.cookies = []
+    client.sync_cookies()
+    assert driver.get_cookies_calls == 3
+    assert client.session.cookies.get("session") is None
+    client.close()
@@ -0,0 +1,191 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.http_client import BrowserHttpClient, http_stats
+from BaseUtils.utils.link_checker import LinkChecker, format_results_table
+
+
+class LinksHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик локального сервера: /ok - 200, /missing - 404, /error - 503, /no-head - HEAD не поддерживается.
+    """
+    requests_count: dict[str, int] = {}
+
+    def _respond(self, with_body: bool) -> None:
+        LinksHandler.requests_count[self.path] = LinksHandler.requests_count.get(self.path, 0) + 1
+        if self.path == "/missing":
+            status = 404
+        elif self.path == "/error":
+            status = 503
+        elif self.path == "/no-head" and not with_body:
+            status = 405
+        else:
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        if with_body:
+            self.wfile.write(b"ok")
+
+    def do_HEAD(self) -> None:
+        self._respond(with_body=False)
+
+    def do_GET(self) -> None:
+        self._respond(with_body=True)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    """
+    Фикстура локального HTTP-сервера на свободном порту.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LinksHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_link_checker_statuses(server_url: str) -> None:
+    """
+    Доступные, недоступные и не поддерживающие HEAD ссылки определяются корректно.
+    """
+    checker = LinkChecker(max_workers=4, timeout=5)
+    results = checker.check([f"{server_url}/ok", f"{server_url}/missing", f"{server_url}/no-head", f"{server_url}/ok"])
+
+    statuses = {result.url.rsplit("/", 1)[1]: result.status for result in results}
+    assert statuses == {"ok": 200, "missing": 404, "no-head": 200}
+    assert [result.ok for result in results] == [True, False, True]
+    assert checker.stats["broken"] == 1
+
+
+def test_link_checker_session_cache(server_url: str) -> None:
+    """
+    Повторная проверка URL берется из кэша без запроса к серверу.
+    """
+    checker = LinkChecker(max_workers=2, timeout=5)
+    url = f"{server_url}/cached"
+    checker.check([url])
+    result = checker.check_links([{"url": url, "tag": "a"}])[0]
+
+    assert result.cached
+    assert result.tags == {"a"}
+    assert LinksHandler.requests_count["/cached"] == 1
+    assert checker.stats["cache_hits"] == 1
+
+    # Теги одной страницы не попадают в кэш и в результаты следующих страниц
+    assert checker.check_links([{"url": url, "tag": "img"}])[0].tags == {"img"}
+
+
+def test_link_checker_does_not_cache_transient_errors(server_url: str) -> None:
+    """
+    Ответы 5xx не кэшируются: следующая проверка снова обращается к серверу.
+    """
+    checker = LinkChecker(max_workers=1, timeout=5)
+    url = f"{server_url}/error"
+    LinksHandler.requests_count.pop("/error", None)
+    first, second = checker.check([url])[0], checker.check([url])[0]
+
+    assert (first.status, second.status) == (503, 503)
+    assert not second.cached
+    assert LinksHandler.requests_count["/error"] == 2
+    assert checker.stats["cache_hits"] == 0
+
+
+class PageDriver:
+    """
+    Драйвер с минимальным набором команд, нужных HTTP-клиенту: текущий URL, cookies и User-Agent.
+    """
+
+    def __init__(self, cookies: list[dict] | None = None) -> None:
+        self.current_url = "http://example.test/page"
+        self.cookies = cookies or []
+
+    def get_cookies(self) -> list[dict]:
+        return self.cookies
+
+    def execute_script(self, script: str) -> str:
+        return "test-agent"
+
+
+def test_link_checker_uses_http_client(server_url: str) -> None:
+    """
+    Запросы проверки выполняются через HTTP-клиент драйвера и учитываются в его статистике.
+    """
+    client = BrowserHttpClient(PageDriver(), retries=0)
+    requests_before = http_stats["requests"]
+    results = LinkChecker(max_workers=2, timeout=5).check([f"{server_url}/ok", f"{server_url}/missing"], client=client)
+    client.close()
+
+    assert [result.status for result in results] == [200, 404]
+    assert http_stats["requests"] - requests_before == 2
+    assert http_stats["cookie_syncs"] >= 1
+
+
+def test_link_checker_connection_error() -> None:
+    """
+    Ошибка соединения отражается в результате, а не прерывает проверку.
+    """
+    checker = LinkChecker(max_workers=1, timeout=1)
+    result = checker.check(["http://127.0.0.1:9/unreachable"])[0]
+
+    assert not result.ok
+    assert result.status is None
+    assert "ConnectionError" in result.error
+    assert "unreachable" in format_results_table([result])
+
+
+def test_link_checker_cache_is_separate_for_each_user(server_url: str) -> None:
+    """
+    Результат, полученный с cookies одного пользователя, не используется для проверки без клиента
+    и с cookies другого пользователя; с теми же cookies - берется из кэша.
+    """
+    checker = LinkChecker(max_workers=1, timeout=5)
+    url = f"{server_url}/private"
+    admin = BrowserHttpClient(PageDriver([{"name": "session", "value": "admin", "domain": "127.0.0.1"}]), retries=0)
+    user = BrowserHttpClient(PageDriver([{"name": "session", "value": "user", "domain": "127.0.0.1"}]), retries=0)
+
+    assert not checker.check([url], client=admin)[0].cached
+    assert not checker.check([url])[0].cached
+    assert not checker.check([url], client=user)[0].cached
+    assert checker.check([url], client=admin)[0].cached
+    assert LinksHandler.requests_count["/private"] == 3
+
+    # После выхода пользователя (переход на страницу входа) набор cookies другой
+    admin.driver.cookies = []
+    admin.driver.current_url = "http://example.test/login"
+    assert not checker.check([url], client=admin)[0].cached
+    admin.close()
+    user.close()
+
+
+def test_link_checker_session_created_only_without_client(server_url: str) -> None:
+    """
+    Собственная сессия создается при первой проверке без клиента и закрывается методом close.
+    """
+    checker = LinkChecker(max_workers=1, timeout=5)
+    client = BrowserHttpClient(PageDriver(), retries=0)
+    checker.check([f"{server_url}/ok"], client=client)
+    client.close()
+    assert checker._session is None
+
+    checker.check([f"{server_url}/missing"])
+    assert checker._session is not None
+    checker.close()
+    assert checker._session is None
+    # После закрытия проверки без клиента снова возможны (новая сессия)
+    assert checker.check([f"{server_url}/no-head"])[0].ok
+    checker.close()
@@ -0,0 +1,35 @@
+import os
+import sys
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.parallel_runner import run_shards, worker_args
+
+
+def test_worker_args_drop_selection_only() -> None:
+    """
+    Воркерам передаются все аргументы pytest, кроме отбора тестов и --alluredir.
+    """
+    args = ["Task_UserAuto/tests", "-k", "user", "-x", "--maxfail", "2", "-p", "no:cacheprovider",
+            "-o", "log_cli=true", "-m=smoke", "--alluredir", "./other", "--tb=short"]
+
+    assert worker_args(args) == ["-x", "--maxfail", "2", "-p", "no:cacheprovider", "-o", "log_cli=true", "--tb=short"]
+
+
+def test_run_shards_passes_args_and_nodeids_file(tmp_path) -> None:
+    """
+    Воркер получает nodeid из файла и дополнительные аргументы: с -x запуск останавливается на первом падении.
+    """
+    test_file = tmp_path / "test_sample.py"
+    test_file.write_text("def test_fail():\n    assert False\n\n\ndef test_pass():\n    pass\n", encoding="utf-8")
+    tests = [f"{test_file}::test_fail", f"{test_file}::test_pass"]
+
+    results = run_shards([tests], str(tmp_path / "report"), ["-x", "-p", "no:cacheprovider"])
+
+    log = open(results[0].log_path, encoding="utf-8").read()
+    assert results[0].exit_code == 1
+    assert "1 failed" in log and "passed" not in log
+    assert not os.path.exists(results[0].tests_path)
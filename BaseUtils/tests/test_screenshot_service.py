@@ -0,0 +1,57 @@
+import os
+import sys
+
+import allure
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.tests.fake_webdriver import create_fake_driver
+from BaseUtils.utils import screenshot_service
+from BaseUtils.utils.screenshot_service import ScreenshotService
+
+
+def record_attachments(monkeypatch) -> list[str]:
+    attached = []
+    monkeypatch.setattr(allure, "attach", lambda body, name, **kwargs: attached.append(name))
+    return attached
+
+
+def test_png_without_resize_is_attached_inline(monkeypatch) -> None:
+    """
+    Скриншот, который нечего перекодировать, прикрепляется сразу, без пула кодирования;
+    повторный одинаковый кадр не прикрепляется.
+    """
+    attached = record_attachments(monkeypatch)
+    service = ScreenshotService(image_format="png", max_width=0)
+    driver, _ = create_fake_driver({})
+
+    assert service.capture(driver, name="Ошибка", step_title="Скриншот во время ошибки")
+    assert attached == ["Ошибка"]
+    assert not service._pending
+    assert not service.capture(driver, name="Повтор")
+    service.shutdown()
+
+    assert attached == ["Ошибка"]
+    # Снято два кадра, прикреплен один
+    assert service.stats["attached_bytes"] * 2 == service.stats["raw_bytes"]
+    assert "без перекодирования" in service.summary()
+
+
+def test_compression_without_pillow_falls_back_to_inline_png(monkeypatch) -> None:
+    """
+    Без Pillow сжатие выключается: скриншоты прикрепляются сразу в исходном PNG.
+    """
+    attached = record_attachments(monkeypatch)
+    monkeypatch.setattr(screenshot_service, "Image", None)
+    service = ScreenshotService(image_format="jpeg", max_width=800)
+    driver, _ = create_fake_driver({})
+
+    service.capture(driver, name="Ошибка")
+    service.shutdown()
+
+    assert (service.image_format, service.max_width, service.encodes) == ("png", 0, False)
+    assert attached == ["Ошибка"]
+    assert service.stats["attached_bytes"] == service.stats["raw_bytes"]
@@ -0,0 +1,159 @@
+import hashlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+import allure
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.logger import logger
+
+# Тело вложения: строка/байты или функция, которая сформирует их только при прикреплении.
+# Функция вызывается позже (при падении теста, когда драйвер может быть уже закрыт), поэтому она
+# должна только форматировать заранее собранные значения и не обращаться к драйверу
+AttachmentBody = str | bytes | Callable[[], str | bytes]
+
+ATTACHMENT_MODES = ("always", "on-failure", "never")
+
+
+@dataclass
+class BufferedAttachment:
+    """
+    Вложение об успешном шаге, ожидающее решения о прикреплении к отчету.
+    """
+    body: AttachmentBody
+    name: str | None
+    attachment_type: object
+    extension: str | None
+
+
+class AttachmentPolicy:
+    """
+    Политика прикрепления вложений об успешных шагах (логи, состояние элементов, скриншоты) к Allure.
+
+    - always: вложение прикрепляется сразу;
+    - on-failure: последние вложения теста хранятся в кольцевом буфере и прикрепляются, только если тест упал;
+    - never: вложения об успешных шагах не прикрепляются.
+
+    Одинаковые тела вложений в рамках одного теста прикрепляются один раз (сравнение по хэшу).
+    Вложения об ошибках прикрепляются напрямую через allure.attach и политикой не ограничиваются.
+    """
+
+    def __init__(self, mode: str = "on-failure", buffer_size: int = 50) -> None:
+        """
+        :param mode: Режим прикрепления: always, on-failure или never.
+        :param buffer_size: Максимальное количество вложений в буфере на тест.
+        """
+        if mode not in ATTACHMENT_MODES:
+            raise ValueError(f'Неизвестный режим вложений: "{mode}". Допустимые значения: {ATTACHMENT_MODES}')
+        self.mode = mode
+        self._buffer: deque[BufferedAttachment] = deque(maxlen=buffer_size)
+        self._digests: set[str] = set()
+        self.stats = {
+            "attached": 0,  # Прикреплено к отчету
+            "buffered": 0,  # Поступило в буфер
+            "discarded": 0,  # Отброшено (тест прошел, переполнение буфера или режим never)
+            "duplicates": 0,  # Пропущено как дубликат
+        }
+
+    def attach(
+            self,
+            body: AttachmentBody,
+            name: str | None = None,
+            attachment_type=allure.attachment_type.TEXT,
+            extension: str | None = None
+    ) -> None:
+        """
+        Прикрепляет вложение об успешном шаге в соответствии с режимом политики.
+        Параметры совпадают с allure.attach, тело может быть функцией для отложенного формирования.
+        """
+        if self.mode == "never":
+            self.stats["discarded"] += 1
+            return
+        attachment = BufferedAttachment(body, name, attachment_type, extension)
+        if self.mode == "always":
+            self._attach_to_report(attachment)
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            self.stats["discarded"] += 1
+        self._buffer.append(attachment)
+        self.stats["buffered"] += 1
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def start_test(self) -> None:
+        """
+        Начало нового теста: очищает буфер и историю хэшей предыдущего теста.
+        """
+        self.discard()
+        self._digests.clear()
+
+    def flush(self) -> None:
+        """
+        Прикрепляет к отчету все вложения из буфера (вызывается при падении теста).
+        """
+        while self._buffer:
+            self._attach_to_report(self._buffer.popleft())
+
+    def discard(self) -> None:
+        """
+        Отбрасывает вложения из буфера (тест прошел).
+        """
+        self.stats["discarded"] += len(self._buffer)
+        self._buffer.clear()
+
+    def _attach_to_report(self, attachment: BufferedAttachment) -> None:
+        body = attachment.body() if callable(attachment.body) else attachment.body
+        data = body if isinstance(body, bytes) else str(body).encode("utf-8")
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        if digest in self._digests:
+            self.stats["duplicates"] += 1
+            return
+        self._digests.add(digest)
+        allure.attach(body, name=attachment.name, attachment_type=attachment.attachment_type,
+                      extension=attachment.extension)
+        self.stats["attached"] += 1
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка по вложениям для вывода в конце сессии.
+        """
+        return (
+            f"Вложения Allure (режим {self.mode}): прикреплено: {self.stats['attached']}, "
+            f"отброшено: {self.stats['discarded']}, дубликатов: {self.stats['duplicates']}"
+        )
+
+
+_attachment_policy: AttachmentPolicy | None = None
+
+
+def get_attachment_policy() -> AttachmentPolicy:
+    """
+    Возвращает политику вложений процесса по секции [allure] config.ini.
+
+    :return: Экземпляр AttachmentPolicy.
+    """
+    global _attachment_policy
+    if _attachment_policy is None:
+        mode = config_registry.get(category="allure", key="attachments", default="on-failure").strip().lower()
+        buffer_size = config_registry.get_int(category="allure", key="buffer_size", default=50)
+        try:
+            _attachment_policy = AttachmentPolicy(mode=mode, buffer_size=buffer_size)
+        except ValueError as e:
+            logger.warning(f"{e}. Используется режим always.")
+            _attachment_policy = AttachmentPolicy(mode="always", buffer_size=buffer_size)
+    return _attachment_policy
+
+
+def attach_evidence(
+        body: AttachmentBody,
+        name: str | None = None,
+        attachment_type=allure.attachment_type.TEXT,
+        extension: str | None = None
+) -> None:
+    """
+    Прикрепляет вложение об успешном шаге через политику вложений процесса.
+    Используется вместо allure.attach для вложений, которые нужны только для разбора падений.
+    """
+    get_attachment_policy().attach(body, name=name, attachment_type=attachment_type, extension=extension)
@@ -0,0 +1,41 @@
+from collections import Counter
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CommandCounter:
+    """
+    Контекстный менеджер для подсчета команд WebDriver (HTTP-запросов к драйверу),
+    выполненных внутри блока with.
+
+    Пример:
+        with CommandCounter(driver) as counter:
+            page.fill_form(...)
+        print(counter.count, counter.commands)
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        self.driver = driver
+        self.count = 0
+        self.commands: Counter = Counter()
+        self._had_own_execute = False
+        self._previous_execute = None
+
+    def __enter__(self) -> 'CommandCounter':
+        # Метод execute подменяется только у экземпляра драйвера; вложенные счетчики поддерживаются
+        self._had_own_execute = "execute" in vars(self.driver)
+        self._previous_execute = self.driver.execute
+
+        def counting_execute(driver_command, params=None):
+            self.count += 1
+            self.commands[driver_command] += 1
+            return self._previous_execute(driver_command, params)
+
+        self.driver.execute = counting_execute
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._had_own_execute:
+            self.driver.execute = self._previous_execute
+        else:
+            del self.driver.execute
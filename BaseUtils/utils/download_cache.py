@@ -0,0 +1,301 @@
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+import requests
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.logger import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировка файла через msvcrt
+    fcntl = None
+    import msvcrt
+
+# Директория кэша по умолчанию (в корне репозитория)
+DEFAULT_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '.download_cache'))
+
+INDEX_FILE = "index.json"
+# Файл межпроцессной блокировки индекса (кэш общий для параллельных воркеров)
+LOCK_FILE = "index.lock"
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """
+    Эксклюзивная блокировка файла между процессами (ожидает освобождения блокировки другим процессом).
+    """
+    with open(path, "a+b") as file:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK ждет освобождения около 10 секунд, затем ожидание повторяется
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@dataclass
+class CachedFile:
+    """
+    Файл, полученный через кэш загрузок.
+    """
+    path: str
+    content_type: str | None
+    size: int
+    from_cache: bool  # Файл взят из кэша без скачивания тела
+    revalidated: bool = False  # Актуальность подтверждена сервером (304 Not Modified)
+
+
+def _file_name_from_response(url: str, response: requests.Response) -> str:
+    """
+    Имя файла из Content-Disposition, пути URL или по типу содержимого.
+    """
+    disposition = response.headers.get("Content-Disposition", "")
+    match = re.search(r"filename\*=(?:UTF-8'')?([^;]+)|filename=\"?([^\";]+)\"?", disposition, re.IGNORECASE)
+    if match:
+        name = urllib.parse.unquote((match.group(1) or match.group(2)).strip())
+    else:
+        name = urllib.parse.unquote(os.path.basename(urllib.parse.urlparse(url).path))
+    name = os.path.basename(name.replace("\\", "/"))
+    if not name:
+        content_type = (response.headers.get("Content-Type") or "").split(";")[0].strip()
+        name = "download" + (mimetypes.guess_extension(content_type) or "")
+    return name
+
+
+class DownloadCache:
+    """
+    Кэш скачанных файлов с адресацией по содержимому.
+
+    - тело ответа скачивается потоково частями прямо на диск (память ограничена размером части);
+    - файл хранится в директории по sha256 содержимого: одинаковые файлы с разных URL хранятся один раз;
+    - индекс URL -> файл хранит ETag/Last-Modified: в пределах окна свежести файл берется из кэша
+      без обращения к сети, после него - условным запросом (304 - без скачивания тела);
+    - при превышении максимального размера удаляются давно не использованные файлы;
+    - чтение и изменение индекса выполняются под блокировкой файла, поэтому директорию кэша
+      могут одновременно использовать параллельные воркеры.
+    """
+
+    def __init__(
+            self,
+            cache_dir: str = DEFAULT_CACHE_DIR,
+            max_bytes: int = 500 * 1024 * 1024,
+            freshness: float = 3600.0,
+            chunk_size: int = 64 * 1024
+    ) -> None:
+        """
+        :param cache_dir: Директория кэша.
+        :param max_bytes: Максимальный суммарный размер файлов кэша, байт.
+        :param freshness: Время, в течение которого файл используется без обращения к серверу, сек.
+        :param chunk_size: Размер части при потоковом скачивании, байт.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.freshness = freshness
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,  # Без обращения к сети
+            "revalidated": 0,  # Ответ 304 Not Modified
+            "downloads": 0,
+            "downloaded_bytes": 0,
+            "evicted": 0,
+        }
+
+    @property
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, INDEX_FILE)
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """
+        Блокировка индекса между потоками процесса и между процессами (чтение - изменение - запись).
+        """
+        with self._lock, _file_lock(os.path.join(self.cache_dir, LOCK_FILE)):
+            yield
+
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            with open(self._index_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict[str, dict]) -> None:
+        # Атомарная запись: чтение индекса без блокировки не увидит частично записанный файл
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(index, file, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self._index_path)
+
+    def fetch(
+            self,
+            url: str,
+            request: Callable[..., requests.Response] = requests.get,
+            timeout: float | tuple[float, float] | None = None
+    ) -> CachedFile:
+        """
+        Возвращает локальный файл для URL, скачивая его только при необходимости.
+
+        :param url: URL файла.
+        :param request: Функция GET-запроса (например, BrowserHttpClient.get с cookies браузера).
+        :param timeout: Таймаут запроса (по умолчанию - таймаут функции запроса).
+        :return: Описание локального файла.
+        :raises requests.RequestException: При ошибке запроса или HTTP-статусе ошибки.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self._index_lock():
+            index = self._load_index()
+            entry = index.get(url)
+        if entry and not os.path.exists(entry["path"]):
+            entry = None
+
+        kwargs = {"stream": True}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        if entry:
+            if time.time() - entry["fetched_at"] < self.freshness:
+                self.stats["hits"] += 1
+                return self._use(url, entry, revalidated=False)
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            kwargs["headers"] = headers
+
+        with request(url, **kwargs) as response:
+            if entry and response.status_code == 304:
+                self.stats["revalidated"] += 1
+                entry["fetched_at"] = time.time()
+                return self._use(url, entry, revalidated=True)
+            response.raise_for_status()
+            entry = self._store(url, response)
+        self.stats["downloads"] += 1
+        self.stats["downloaded_bytes"] += entry["size"]
+        return CachedFile(entry["path"], entry["content_type"], entry["size"], from_cache=False)
+
+    def _store(self, url: str, response: requests.Response) -> dict:
+        """
+        Потоково сохраняет тело ответа в кэш и обновляет индекс.
+        """
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    file.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            blob_dir = os.path.join(self.cache_dir, digest.hexdigest())
+            os.makedirs(blob_dir, exist_ok=True)
+            path = os.path.join(blob_dir, _file_name_from_response(url, response))
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        entry = {
+            "path": path,
+            "sha256": digest.hexdigest(),
+            "size": size,
+            "content_type": response.headers.get("Content-Type"),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "last_used": time.time(),
+        }
+        with self._index_lock():
+            index = self._load_index()
+            index[url] = entry
+            self._evict(index, keep=path)
+            self._save_index(index)
+        return entry
+
+    def _use(self, url: str, entry: dict, revalidated: bool) -> CachedFile:
+        entry["last_used"] = time.time()
+        with self._index_lock():
+            index = self._load_index()
+            index[url] = entry
+            self._save_index(index)
+        return CachedFile(entry["path"], entry["content_type"], entry["size"], from_cache=True, revalidated=revalidated)
+
+    def _evict(self, index: dict[str, dict], keep: str) -> None:
+        """
+        Удаляет давно не использованные файлы, пока суммарный размер кэша превышает максимальный.
+        """
+        files: dict[str, dict] = {}
+        for entry in index.values():
+            current = files.setdefault(entry["path"], {"size": entry["size"], "last_used": 0.0})
+            current["last_used"] = max(current["last_used"], entry["last_used"])
+        total = sum(item["size"] for item in files.values())
+        for path, item in sorted(files.items(), key=lambda pair: pair[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+            for url in [url for url, entry in index.items() if entry["path"] == path]:
+                del index[url]
+            total -= item["size"]
+            self.stats["evicted"] += 1
+            logger.info(f'Файл "{path}" удален из кэша загрузок (превышен размер кэша)')
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка по кэшу загрузок для вывода в конце сессии.
+        """
+        return (
+            f"Кэш загрузок: из кэша: {self.stats['hits']}, подтверждено сервером (304): {self.stats['revalidated']}, "
+            f"скачано: {self.stats['downloads']} ({self.stats['downloaded_bytes'] / 1024:.0f} КБ), "
+            f"удалено из кэша: {self.stats['evicted']}"
+        )
+
+
+_download_cache: DownloadCache | None = None
+
+
+def get_download_cache() -> DownloadCache | None:
+    """
+    Возвращает кэш загрузок процесса, если он включен в config.ini (секция [download cache]).
+
+    :return: Экземпляр DownloadCache или None, если кэш выключен.
+    """
+    global _download_cache
+    if _download_cache is None:
+        if not config_registry.get_bool(category="download cache", key="enabled", default=False):
+            return None
+        _download_cache = DownloadCache(
+            cache_dir=config_registry.get(category="download cache", key="directory", default="") or DEFAULT_CACHE_DIR,
+            max_bytes=config_registry.get_int(category="download cache", key="max_size_mb", default=500) * 1024 * 1024,
+            freshness=config_registry.get_float(category="download cache", key="freshness", default=3600.0),
+            chunk_size=config_registry.get_int(category="download cache", key="chunk_size", default=64 * 1024)
+        )
+    return _download_cache
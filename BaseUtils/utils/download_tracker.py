@@ -0,0 +1,284 @@
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import re
+import select
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+
+from BaseUtils.utils.logger import logger
+
+# Корневая директория загрузок браузеров (у каждого воркера своя поддиректория)
+DOWNLOADS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'downloads'))
+
+# Суффиксы незавершенных загрузок: Chrome/Edge - .crdownload, Firefox - .part
+PARTIAL_SUFFIXES = (".crdownload", ".part")
+
+# Номер, который браузер добавляет к имени уже существующего файла: "report (1).pdf" (Chrome), "report(1).pdf" (Firefox)
+DUPLICATE_SUFFIX = re.compile(r"\s?\(\d+\)$")
+
+# События inotify: создание, переименование, удаление файла и завершение записи
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_download_dir_prepared = False
+
+
+def get_download_dir() -> str:
+    """
+    Директория загрузок текущего воркера (downloads/worker_<TEST_WORKER_ID>): параллельные воркеры
+    не видят файлы друг друга. При первом обращении в процессе директория очищается от файлов прошлых запусков.
+
+    :return: Абсолютный путь к директории загрузок.
+    """
+    global _download_dir_prepared
+    download_dir = os.path.join(DOWNLOADS_ROOT, f"worker_{os.environ.get('TEST_WORKER_ID', 'main')}")
+    if not _download_dir_prepared:
+        shutil.rmtree(download_dir, ignore_errors=True)
+        _download_dir_prepared = True
+    os.makedirs(download_dir, exist_ok=True)
+    return download_dir
+
+
+class _InotifyWatcher:
+    """
+    Ожидание изменений директории через inotify (Linux): wait() возвращается сразу после события.
+    """
+
+    def __init__(self, path: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        if libc.inotify_add_watch(fd, os.fsencode(path), WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, "inotify_add_watch")
+        self._fd = fd
+
+    def wait(self, timeout: float) -> None:
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if ready:
+            try:
+                # Содержимое событий не нужно: после события директория сканируется заново
+                while os.read(self._fd, 64 * 1024):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """
+    Запасной вариант без inotify: короткие паузы между сканированиями директории.
+    """
+
+    def __init__(self, path: str, interval: float = 0.05) -> None:
+        self.interval = interval
+
+    def wait(self, timeout: float) -> None:
+        time.sleep(max(0.0, min(self.interval, timeout)))
+
+    def close(self) -> None:
+        pass
+
+
+def _create_watcher(path: str) -> _InotifyWatcher | _PollingWatcher:
+    if sys.platform.startswith("linux"):
+        try:
+            return _InotifyWatcher(path)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify недоступен, используется опрос директории загрузок: {e}")
+    return _PollingWatcher(path)
+
+
+@dataclass
+class DownloadInfo:
+    """
+    Результат проверки скачанного файла.
+    """
+    path: str
+    size: int
+    sha256: str
+
+
+class DownloadTracker:
+    """
+    Отслеживание загрузок в директории: новые файлы (появившиеся после создания трекера) обнаруживаются
+    по событиям inotify за миллисекунды, незавершенные загрузки (.crdownload/.part) отслеживаются до завершения.
+
+    Использование:
+        with DownloadTracker(download_dir) as tracker:
+            # действие, запускающее скачивание
+            path = tracker.wait_for_complete("report.pdf")
+    """
+
+    def __init__(self, download_dir: str | None = None, ignore_existing: bool = True) -> None:
+        """
+        :param download_dir: Директория загрузок. По умолчанию - директория загрузок текущего воркера.
+        :param ignore_existing: Не учитывать файлы, которые уже были в директории при создании трекера.
+        """
+        self.download_dir = download_dir or get_download_dir()
+        self._watcher = _create_watcher(self.download_dir)
+        self._baseline = set(self._scan()) if ignore_existing else set()
+        self.started_at = time.perf_counter()
+
+    def __enter__(self) -> 'DownloadTracker':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._watcher.close()
+
+    def _scan(self) -> dict[str, int]:
+        """
+        Файлы директории загрузок с размерами (один вызов scandir).
+        """
+        files = {}
+        with os.scandir(self.download_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        files[entry.name] = entry.stat().st_size
+                except FileNotFoundError:  # Файл переименован браузером между чтением и stat
+                    continue
+        return files
+
+    @staticmethod
+    def _normalize(name: str) -> str:
+        """
+        Имя файла без суффикса незавершенной загрузки и без номера дубликата: "report (1).pdf" -> "report.pdf".
+        """
+        if name.endswith(PARTIAL_SUFFIXES):
+            name = name.rsplit(".", 1)[0]
+        stem, dot, extension = name.rpartition(".")
+        if not dot:
+            stem, extension = name, ""
+        return DUPLICATE_SUFFIX.sub("", stem) + dot + extension
+
+    def _new_files(self, file_name: str) -> tuple[list[str], list[str]]:
+        """
+        Новые файлы, имя которых (без номера дубликата) содержит file_name: (завершенные, незавершенные).
+        Незавершенная загрузка Chrome без имени ("Unconfirmed NNN.crdownload") учитывается,
+        только если это единственный новый файл директории.
+        """
+        completed, partial = [], []
+        new_names = [name for name in self._scan() if name not in self._baseline]
+        for name in new_names:
+            is_partial = name.endswith(PARTIAL_SUFFIXES)
+            if file_name in self._normalize(name) or (
+                    is_partial and name.startswith("Unconfirmed") and len(new_names) == 1):
+                (partial if is_partial else completed).append(name)
+        return completed, partial
+
+    def _wait(self, file_name: str, timeout: float, until_complete: bool) -> str | None:
+        deadline = time.monotonic() + timeout
+        while True:
+            completed, partial = self._new_files(file_name)
+            # Firefox создает пустой файл с итоговым именем сразу, данные пишет в .part
+            completed = [name for name in completed
+                         if not any(part.startswith(name) for part in partial)]
+            if completed:
+                return os.path.join(self.download_dir, completed[0])
+            if partial and not until_complete:
+                return os.path.join(self.download_dir, partial[0])
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self._watcher.wait(remaining)
+
+    def wait_for_start(self, file_name: str, timeout: float = 10) -> str | None:
+        """
+        Ожидает начала скачивания файла (появления итогового или незавершенного файла).
+
+        :param file_name: Ожидаемое имя файла (или его часть).
+        :param timeout: Максимальное время ожидания в секундах.
+        :return: Путь к файлу или None, если скачивание не началось.
+        """
+        path = self._wait(file_name, timeout, until_complete=False)
+        if path:
+            logger.info(
+                f'Скачивание файла "{file_name}" началось через '
+                f'{(time.perf_counter() - self.started_at) * 1000:.0f} мс: "{path}"'
+            )
+        return path
+
+    def wait_for_complete(self, file_name: str, timeout: float = 60) -> str | None:
+        """
+        Ожидает завершения скачивания файла (незавершенный файл переименован в итоговый).
+
+        :param file_name: Ожидаемое имя файла (или его часть).
+        :param timeout: Максимальное время ожидания в секундах.
+        :return: Путь к скачанному файлу или None, если скачивание не завершилось.
+        """
+        path = self._wait(file_name, timeout, until_complete=True)
+        if path:
+            logger.info(
+                f'Скачивание файла "{file_name}" завершено через '
+                f'{(time.perf_counter() - self.started_at) * 1000:.0f} мс: "{path}"'
+            )
+        return path
+
+    def remove_downloads(self, file_name: str) -> list[str]:
+        """
+        Удаляет новые файлы загрузки file_name (завершенные и незавершенные), чтобы повторное
+        скачивание того же файла в этом процессе не получило номер дубликата.
+
+        :param file_name: Имя файла (или его часть).
+        :return: Имена удаленных файлов.
+        """
+        completed, partial = self._new_files(file_name)
+        removed = []
+        for name in completed + partial:
+            try:
+                os.remove(os.path.join(self.download_dir, name))
+                removed.append(name)
+            except FileNotFoundError:  # Браузер уже переименовал незавершенный файл
+                continue
+        if removed:
+            logger.info(f'Удалены файлы загрузки: {removed}')
+        return removed
+
+    @staticmethod
+    def verify(
+            path: str,
+            expected_size: int | None = None,
+            expected_sha256: str | None = None,
+            chunk_size: int = 1024 * 1024
+    ) -> DownloadInfo:
+        """
+        Проверяет размер и контрольную сумму файла, читая его частями (без загрузки в память целиком).
+
+        :param path: Путь к файлу.
+        :param expected_size: Ожидаемый размер в байтах.
+        :param expected_sha256: Ожидаемая контрольная сумма sha256 (hex).
+        :param chunk_size: Размер части при чтении, байт.
+        :return: Размер и контрольная сумма файла.
+        :raises AssertionError: Если размер или контрольная сумма не совпадают с ожидаемыми.
+        """
+        size = os.path.getsize(path)
+        if expected_size is not None and size != expected_size:
+            raise AssertionError(
+                f'Размер файла "{path}": {size} байт НЕ СООТВЕТСТВУЕТ ожидаемому: {expected_size} байт'
+            )
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+        if expected_sha256 is not None and sha256 != expected_sha256.lower():
+            raise AssertionError(
+                f'Контрольная сумма файла "{path}": {sha256} НЕ СООТВЕТСТВУЕТ ожидаемой: {expected_sha256}'
+            )
+        return DownloadInfo(path, size, sha256)
@@ -0,0 +1,134 @@
+from typing import Tuple
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from BaseUtils.utils.wait_engine import ELEMENT_CONDITION_JS
+
+# Снимок состояния элемента за один вызов execute_script:
+# геометрия, видимость, доступность, текст, value, отмеченность, запрошенные атрибуты
+# и элемент, находящийся в точке центра (для обнаружения перекрывающих оверлеев).
+INSPECT_ELEMENT_JS = ELEMENT_CONDITION_JS + """
+function describe(el) {
+    if (!el) {
+        return null;
+    }
+    var html = el.outerHTML || '';
+    return {
+        tag_name: el.tagName.toLowerCase(),
+        id: el.id || null,
+        class_name: typeof el.className === 'string' ? el.className : null,
+        html: html.length > 300 ? html.substring(0, 300) + '...' : html
+    };
+}
+function readAttribute(el, name) {
+    // Поведение близко к WebElement.get_attribute: сначала свойство, затем атрибут
+    var property = {'class': 'className', 'for': 'htmlFor', 'readonly': 'readOnly'}[name] || name;
+    var prop = el[property];
+    if (typeof prop === 'boolean') {
+        return prop ? 'true' : null;
+    }
+    if (typeof prop === 'string' || typeof prop === 'number') {
+        return String(prop);
+    }
+    return el.getAttribute(name);
+}
+function inspectElement(el, attributes) {
+    if (!el) {
+        return {found: false};
+    }
+    var rect = el.getBoundingClientRect();
+    var centerX = rect.left + rect.width / 2, centerY = rect.top + rect.height / 2;
+    var inViewport = centerX >= 0 && centerY >= 0 && centerX <= window.innerWidth && centerY <= window.innerHeight;
+    var top = inViewport ? document.elementFromPoint(centerX, centerY) : null;
+    var attrs = {};
+    if (attributes) {
+        for (var i = 0; i < attributes.length; i++) {
+            attrs[attributes[i]] = readAttribute(el, attributes[i]);
+        }
+    } else {
+        for (var j = 0; j < el.attributes.length; j++) {
+            attrs[el.attributes[j].name] = el.attributes[j].value;
+        }
+    }
+    var tag = el.tagName.toLowerCase();
+    return {
+        found: true,
+        tag_name: tag,
+        text: (el.innerText || '').trim(),
+        value: el.value === undefined ? null : String(el.value),
+        displayed: isVisible(el),
+        enabled: !el.disabled,
+        checked: tag === 'option' ? !!el.selected : !!el.checked,
+        rect: {x: rect.left, y: rect.top, width: rect.width, height: rect.height},
+        in_viewport: inViewport,
+        covered: !!top && top !== el && !el.contains(top) && !(top.control && top.control === el),
+        element_at_center: describe(top),
+        attributes: attrs
+    };
+}
+var target = arguments[0] && arguments[0].nodeType ? arguments[0] : findElement(arguments[0], arguments[1]);
+return inspectElement(target, arguments[2]);
+"""
+
+
+def inspect_element(
+        driver: WebDriver,
+        target: WebElement | Tuple[str, str],
+        attributes: list[str] | None = None
+) -> dict:
+    """
+    Собирает состояние элемента за один вызов execute_script.
+
+    :param driver: Экземпляр WebDriver.
+    :param target: Элемент или кортеж (By.*, значение локатора).
+    :param attributes: Имена атрибутов для чтения; если не переданы - все атрибуты элемента.
+    :return: Словарь состояния; при отсутствии элемента - {"found": False}.
+    """
+    if isinstance(target, WebElement):
+        return driver.execute_script(INSPECT_ELEMENT_JS, target, None, attributes)
+    return driver.execute_script(INSPECT_ELEMENT_JS, target[0], target[1], attributes)
+
+
+def inspect_existing_element(
+        driver: WebDriver,
+        locator: Tuple[str, str],
+        attributes: list[str] | None = None
+) -> dict:
+    """
+    То же, что inspect_element, но бросает NoSuchElementException, если элемент не найден.
+
+    :param driver: Экземпляр WebDriver.
+    :param locator: Кортеж (By.*, значение локатора).
+    :param attributes: Имена атрибутов для чтения.
+    :return: Словарь состояния элемента.
+    """
+    state = inspect_element(driver, locator, attributes)
+    if not state or not state.get("found"):
+        raise NoSuchElementException(f'Элемент с локатором: "{locator[0]}" и значением: "{locator[1]}" НЕ НАЙДЕН')
+    return state
+
+
+def format_element_state(state: dict) -> str:
+    """
+    Форматирует состояние элемента для логов и отчета Allure.
+
+    :param state: Результат inspect_element.
+    :return: Многострочное текстовое описание.
+    """
+    if not state.get("found"):
+        return "Элемент НЕ НАЙДЕН на странице"
+    rect = state["rect"]
+    lines = [
+        f"Тег: {state['tag_name']}",
+        f"Отображается: {state['displayed']}, доступен: {state['enabled']}, отмечен: {state['checked']}",
+        f"Текст: {state['text']!r}",
+        f"Value: {state['value']!r}",
+        f"Координаты: x={rect['x']:.0f}, y={rect['y']:.0f}, ширина={rect['width']:.0f}, высота={rect['height']:.0f}",
+        f"В видимой области: {state['in_viewport']}",
+        f"Атрибуты: {state['attributes']}",
+    ]
+    if state["covered"]:
+        lines.append(f"ПЕРЕКРЫТ элементом: {state['element_at_center']}")
+    return "\n".join(lines)
@@ -0,0 +1,210 @@
+"""
+Плагин pytest для параметризации тестов строками Excel.
+
+Тест с маркером excel_data запускается отдельно для каждой строки листа:
+
+    @pytest.mark.excel_data("users.xlsx", sheet_name="Users", id_column="login", schema={"age": "int"})
+    def test_user(self, excel_row):
+        ...
+
+- лист читается один раз за сессию (общий для всех тестов с тем же файлом, листом и схемой);
+- идентификатор случая стабилен: значение столбца id_column или номер строки данных (row1, row2, ...);
+- при параллельном запуске (TEST_WORKER_ID/TEST_WORKER_COUNT) строки распределяются по воркерам
+  по crc32 ключа случая. Ключ строится из исходного значения ячейки id_column (или номера строки данных)
+  до преобразования: каждый воркер разбирает лист, но преобразует и хранит в памяти только свои строки
+  (кэш разобранных листов [excel] здесь не используется - в нем хранятся уже преобразованные строки);
+- при сборе тестов раннером (переменная TEST_SHARD_PLAN_FILE) плагин записывает план:
+  nodeid -> ключ случая, чтобы раннер отдал каждый случай тому воркеру, который его сгенерирует.
+
+Подключается в conftest.py проекта: config.pluginmanager.import_plugin("BaseUtils.utils.excel_params").
+"""
+import json
+import os
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Dict
+
+import pytest
+
+from BaseUtils.utils.excel_reader import ExcelReader
+from BaseUtils.utils.logger import logger
+
+SHARD_PLAN_FILE_ENV = "TEST_SHARD_PLAN_FILE"
+
+# Корневая директория репозитория: проект по умолчанию - первая папка пути к файлу теста
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Статистика чтения данных Excel за сессию процесса
+excel_data_stats = {"sheets": 0, "rows": 0, "cases": 0}
+
+_loaded_cases: dict[tuple, list['ExcelCase']] = {}
+
+
+@dataclass
+class ExcelCase:
+    """
+    Тестовый случай из строки Excel.
+    """
+    id: str
+    shard_key: str
+    data: Dict[str, object]
+
+
+def shard_index(shard_key: str, worker_count: int) -> int:
+    """
+    Номер воркера для случая: одинаков во всех процессах и запусках (в отличие от hash()).
+    """
+    return zlib.crc32(shard_key.encode("utf-8")) % worker_count
+
+
+def current_worker() -> tuple[int, int]:
+    """
+    Номер текущего воркера и количество воркеров из окружения, (0, 1) - без параллельного запуска.
+    """
+    try:
+        worker_id = int(os.environ.get("TEST_WORKER_ID", "0"))
+        worker_count = int(os.environ.get("TEST_WORKER_COUNT", "1"))
+    except ValueError:
+        return 0, 1
+    if worker_count < 1 or not 0 <= worker_id < worker_count:
+        return 0, 1
+    return worker_id, worker_count
+
+
+def _case_id(value: object) -> str:
+    return re.sub(r"\s+", "_", str(value).strip()) or "empty"
+
+
+def load_cases(
+        file_name: str,
+        project_dir: str,
+        sheet_name: str | None = None,
+        id_column: str | None = None,
+        schema: Dict[str, str] | None = None,
+        worker: tuple[int, int] | None = None
+) -> list[ExcelCase]:
+    """
+    Читает случаи текущего воркера из листа Excel (один раз за сессию для одинаковых параметров).
+    Строки отбираются по исходным значениям ячеек, преобразуются только строки текущего воркера.
+
+    :param file_name: Имя файла Excel в папке credentials проекта.
+    :param project_dir: Папка проекта.
+    :param sheet_name: Имя листа (по умолчанию - первый лист).
+    :param id_column: Столбец с идентификатором случая (по умолчанию - номер строки данных).
+    :param schema: Схема столбцов для ExcelReader.
+    :param worker: Номер воркера и количество воркеров (по умолчанию - из окружения).
+    :return: Случаи текущего воркера в порядке строк листа.
+    """
+    worker_id, worker_count = worker or current_worker()
+    key = (project_dir, file_name, sheet_name, id_column,
+           tuple(sorted(schema.items())) if schema else None, worker_id, worker_count)
+    if key in _loaded_cases:
+        return _loaded_cases[key]
+
+    reader = ExcelReader(project_dir, file_name, schema=schema)
+    convert_row, rows = reader.iter_raw(sheet_name, key_column=id_column)
+    cases: list[ExcelCase] = []
+    seen: dict[str, int] = {}
+    rows_count = 0
+    for rows_count, (row_number, raw_id, row) in enumerate(rows, start=1):
+        case_id = _case_id(raw_id) if id_column is not None else f"row{rows_count}"
+        # Повторяющиеся идентификаторы получают порядковый суффикс
+        seen[case_id] = seen.get(case_id, 0) + 1
+        if seen[case_id] > 1:
+            case_id = f"{case_id}-{seen[case_id]}"
+        shard_key = f"{file_name}:{sheet_name or ''}:{case_id}"
+        if worker_count == 1 or shard_index(shard_key, worker_count) == worker_id:
+            cases.append(ExcelCase(case_id, shard_key, convert_row(row_number, row)))
+
+    excel_data_stats["sheets"] += 1
+    excel_data_stats["rows"] += rows_count
+    excel_data_stats["cases"] += len(cases)
+    logger.info(
+        f'Данные Excel "{file_name}": строк: {rows_count}, случаев воркера {worker_id}/{worker_count}: {len(cases)}'
+    )
+    _loaded_cases[key] = cases
+    return cases
+
+
+def _marker_options(
+        file_name: str,
+        sheet_name: str | None = None,
+        project_dir: str | None = None,
+        id_column: str | None = None,
+        schema: Dict[str, str] | None = None,
+        argname: str = "excel_row"
+) -> dict:
+    return dict(file_name=file_name, sheet_name=sheet_name, project_dir=project_dir,
+                id_column=id_column, schema=schema, argname=argname)
+
+
+def _default_project_dir(test_path: str) -> str:
+    relative = os.path.relpath(os.path.abspath(test_path), PROJECT_ROOT)
+    return relative.split(os.sep)[0]
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "excel_data(file_name, sheet_name=None, project_dir=None, id_column=None, schema=None, argname='excel_row'): "
+        "параметризация теста строками листа Excel"
+    )
+    config.addinivalue_line("markers", "excel_shard(key): ключ распределения случая Excel по воркерам")
+
+
+def pytest_generate_tests(metafunc) -> None:
+    """
+    Параметризация тестов с маркером excel_data строками листа текущего воркера.
+    """
+    marker = metafunc.definition.get_closest_marker("excel_data")
+    if marker is None:
+        return
+    options = _marker_options(*marker.args, **marker.kwargs)
+    argname = options.pop("argname")
+    options["project_dir"] = options["project_dir"] or _default_project_dir(str(metafunc.definition.path))
+    metafunc.parametrize(argname, [
+        pytest.param(case.data, id=case.id, marks=pytest.mark.excel_shard(case.shard_key))
+        for case in load_cases(**options)
+    ])
+
+
+def pytest_collection_finish(session) -> None:
+    """
+    Запись плана распределения случаев Excel для параллельного раннера (только при сборе раннером).
+    """
+    plan_file = os.environ.get(SHARD_PLAN_FILE_ENV)
+    if not plan_file:
+        return
+    plan = {}
+    for item in session.items:
+        marker = item.get_closest_marker("excel_shard")
+        if marker is not None:
+            plan[item.nodeid] = marker.args[0]
+    with open(plan_file, "w", encoding="utf-8") as file:
+        json.dump(plan, file, ensure_ascii=False, indent=2)
+
+
+def load_shard_plan(path: str) -> dict[str, str]:
+    """
+    Читает план распределения случаев Excel.
+
+    :param path: Путь к файлу плана.
+    :return: Словарь nodeid -> ключ случая (пустой, если файла нет или он поврежден).
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return {nodeid: str(key) for nodeid, key in json.load(file).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def excel_data_summary() -> str:
+    """
+    Текстовая сводка по данным Excel для вывода в конце сессии.
+    """
+    worker_id, worker_count = current_worker()
+    return (
+        f"Данные Excel: прочитано листов: {excel_data_stats['sheets']}, строк: {excel_data_stats['rows']}, "
+        f"случаев воркера {worker_id}/{worker_count}: {excel_data_stats['cases']}"
+    )
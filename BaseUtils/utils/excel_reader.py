@@ -1,6 +1,128 @@
+import datetime
+import hashlib
 import openpyxl
 import os
-from typing import List, Dict
+import pickle
+import sys
+import tempfile
+from typing import List, Dict, Iterator, Callable
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.logger import logger
+
+# Директория кэша разобранных листов по умолчанию (в корне репозитория)
+DEFAULT_CACHE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '.excel_cache'))
+
+# Версия формата кэша: меняется при изменении правил преобразования ячеек
+CACHE_VERSION = 3
+
+# Количество строк в одной записи кэша: память ограничена пачкой, а не листом целиком
+CACHE_BATCH_ROWS = 1024
+
+# Форматы дат в текстовых ячейках для типа "date" без явно указанного формата
+DEFAULT_DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y")
+
+
+class ExcelSchemaError(ValueError):
+    """
+    Значение ячейки не соответствует типу столбца в схеме.
+    """
+
+    def __init__(self, message: str, row: int | None = None, column: str | None = None) -> None:
+        super().__init__(message)
+        self.row = row
+        self.column = column
+
+
+def _to_int(value):
+    if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    raise ValueError(f"ожидалось целое число, получено: {value!r}")
+
+
+def _to_str(value):
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _list_converter(separator: str) -> Callable:
+    def convert(value):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return value.split(separator)
+        return [_to_str(value)]
+    return convert
+
+
+def _to_url_list(value):
+    if value is None:
+        return None
+    urls = str(value).split(";")
+    for url in urls:
+        if not url.startswith(("http://", "https://")):
+            raise ValueError(f"ожидалась ссылка http(s), получено: {url!r}")
+    return urls
+
+
+def _date_converter(date_format: str | None) -> Callable:
+    formats = (date_format,) if date_format else DEFAULT_DATE_FORMATS
+
+    def convert(value):
+        if value is None:
+            return None
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        if isinstance(value, str):
+            if not date_format:
+                try:
+                    # Быстрый путь для ISO-формата (в разы быстрее strptime)
+                    return datetime.date.fromisoformat(value.strip())
+                except ValueError:
+                    pass
+            for candidate in formats:
+                try:
+                    return datetime.datetime.strptime(value.strip(), candidate).date()
+                except ValueError:
+                    continue
+        raise ValueError(f"ожидалась дата в формате {' или '.join(formats)}, получено: {value!r}")
+    return convert
+
+
+def compile_column_type(column_type: str) -> Callable:
+    """
+    Создает функцию преобразования значения ячейки по типу столбца из схемы.
+
+    Типы: "int", "str", "list" (разделитель ';'), "list:<разделитель>", "url_list",
+    "date" (форматы DEFAULT_DATE_FORMATS), "date:<формат strptime>", "auto" (правила _process_cell_value).
+
+    :param column_type: Тип столбца.
+    :return: Функция преобразования значения.
+    :raises ExcelSchemaError: Если тип неизвестен.
+    """
+    name, _, argument = column_type.partition(":")
+    if name == "int":
+        return _to_int
+    if name == "str":
+        return _to_str
+    if name == "list":
+        return _list_converter(argument or ";")
+    if name == "url_list":
+        return _to_url_list
+    if name == "date":
+        return _date_converter(argument or None)
+    if name == "auto":
+        return ExcelReader._process_cell_value
+    raise ExcelSchemaError(f'Неизвестный тип столбца в схеме: "{column_type}"')
 
 
 class ExcelReader:
@@ -8,15 +130,23 @@ class ExcelReader:
             self,
             project_dir: str,
             file_name: str,
-            column_names: Dict[str, int] | None = None
+            column_names: Dict[str, int] | None = None,
+            read_only: bool | None = None,
+            use_cache: bool | None = None,
+            schema: Dict[str, str] | None = None
     ):
         """
         Инициализация класса для чтения данных из Excel.
+        Файл открывается только при чтении данных, если их нет в кэше.
 
         :param project_dir: Путь к корневой директории проекта.
         :param file_name: Имя файла Excel.
         :param column_names: Словарь, где ключи - имена столбцов, значения - номера столбцов (0-based).
                             Если не передан, заголовки будут взяты из первой строки Excel.
+        :param read_only: Потоковое чтение строк (режим read-only openpyxl). По умолчанию - из секции [excel].
+        :param use_cache: Использовать кэш разобранных листов на диске. По умолчанию - из секции [excel].
+        :param schema: Схема столбцов: имя столбца -> тип (см. compile_column_type). Если передана, читаются
+                       только столбцы схемы, каждый со своей функцией преобразования, собранной один раз.
         """
         self.file_path = os.path.abspath(
             os.path.join(
@@ -28,50 +158,287 @@ class ExcelReader:
                 file_name  # Имя файла Excel
             )
         )
-        self.workbook = openpyxl.load_workbook(self.file_path)
         self.column_names: Dict[str, int] | None = column_names
+        self.schema: Dict[str, str] | None = schema
+        # Функции преобразования собираются сразу: ошибка в схеме обнаруживается до чтения файла
+        self._schema_converters = (
+            {column: compile_column_type(column_type) for column, column_type in schema.items()} if schema else None
+        )
+        self.read_only = read_only if read_only is not None else config_registry.get_bool(
+            category="excel", key="read_only", default=True)
+        self.use_cache = use_cache if use_cache is not None else config_registry.get_bool(
+            category="excel", key="cache", default=True)
+        self.cache_dir = config_registry.get(category="excel", key="cache_dir", default="") or DEFAULT_CACHE_DIR
+        self._workbook = None
+
+    @property
+    def workbook(self) -> openpyxl.Workbook:
+        """
+        Книга Excel, открывается при первом обращении.
+        """
+        if self._workbook is None:
+            self._workbook = openpyxl.load_workbook(self.file_path, read_only=self.read_only)
+        return self._workbook
+
+    def close(self) -> None:
+        """
+        Закрывает книгу (в режиме read-only openpyxl держит файл открытым).
+        """
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
 
     def get_data(
             self,
-            sheet_name: str | None = None
-    ) -> List[Dict[str, str | list[str]]]:
+            sheet_name: str | None = None,
+            lazy: bool = False
+    ) -> List[Dict[str, str | list[str]]] | Iterator[Dict[str, str | list[str]]]:
         """
         Чтение данных из указанного листа Excel и автоматическое преобразование
         ячеек с разделителем ';' в списки, если это необходимо.
 
         :param sheet_name: Имя листа в Excel.
-        :return: Список словарей с данными.
+        :param lazy: Вернуть генератор строк вместо списка (строки читаются по мере обхода).
+        :return: Список словарей с данными (или генератор словарей при lazy=True).
         """
-        sheet = self.workbook[sheet_name] if sheet_name else self.workbook.worksheets[0]
-        data = []
+        rows = self.iter_data(sheet_name)
+        return rows if lazy else list(rows)
+
+    def iter_data(self, sheet_name: str | None = None) -> Iterator[Dict[str, str | list[str]]]:
+        """
+        Построчное чтение листа: строки берутся из кэша на диске, а при его отсутствии читаются
+        из книги и одновременно записываются в кэш (кэш сохраняется, только если лист прочитан до конца).
+
+        :param sheet_name: Имя листа в Excel.
+        :return: Генератор словарей с данными строк.
+        """
+        if not self.use_cache:
+            yield from self._to_dicts(*self._read_sheet(sheet_name))
+            return
+
+        cache_path = self._cache_path(sheet_name)
+        try:
+            cache_file = open(cache_path, "rb")
+        except FileNotFoundError:
+            cache_file = None
+        if cache_file is not None:
+            with cache_file:
+                unpickler = pickle.Unpickler(cache_file)
+                columns = unpickler.load()
+                yield from self._to_dicts(columns, self._load_rows(unpickler))
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        completed = False
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                pickler = pickle.Pickler(tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+                columns, rows = self._read_sheet(sheet_name)
+                pickler.dump(columns)
+                batch = []
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) == CACHE_BATCH_ROWS:
+                        yield from self._dump_batch(pickler, columns, batch)
+                        batch = []
+                if batch:
+                    yield from self._dump_batch(pickler, columns, batch)
+            # Атомарная замена: параллельные воркеры не увидят частично записанный кэш
+            os.replace(tmp_path, cache_path)
+            completed = True
+            self._prune_cache(cache_path)
+        finally:
+            if not completed and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _dump_batch(pickler: pickle.Pickler, columns: tuple, batch: list[tuple]) -> Iterator[Dict[str, str | list[str]]]:
+        """
+        Записывает пачку строк в кэш и только затем отдает ее строки: изменения списков в строках
+        вызывающим кодом не попадают в кэш. Память pickler очищается - объекты пачки не удерживаются.
+        """
+        pickler.dump(batch)
+        pickler.clear_memo()
+        for row in batch:
+            yield dict(zip(columns, row))
+
+    @staticmethod
+    def _load_rows(unpickler: pickle.Unpickler) -> Iterator[tuple]:
+        while True:
+            try:
+                batch = unpickler.load()
+            except EOFError:
+                return
+            yield from batch
+
+    @staticmethod
+    def _to_dicts(columns: tuple, rows: Iterator[tuple]) -> Iterator[Dict[str, str | list[str]]]:
+        for row in rows:
+            yield dict(zip(columns, row))
 
-        headers = None  # Инициализируем переменную headers как None
+    def _cache_prefix(self) -> str:
+        """
+        Общее начало имен файлов кэша этой книги (имя файла и хэш полного пути).
+        """
+        path_digest = hashlib.sha1(self.file_path.encode("utf-8")).hexdigest()[:12]
+        return f"{os.path.basename(self.file_path)}.{path_digest}."
+
+    def _source_digest(self) -> str:
+        """
+        Хэш версии книги (время изменения, размер) и формата кэша: меняется при изменении файла.
+        """
+        stat = os.stat(self.file_path)
+        key = repr((CACHE_VERSION, sys.version_info[:2], stat.st_mtime_ns, stat.st_size))
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+    def _cache_path(self, sheet_name: str | None) -> str:
+        """
+        Путь к файлу кэша листа: <имя книги>.<хэш пути>.<хэш версии книги>.<хэш листа и столбцов>.pickle.
+        """
+        key = repr((
+            sheet_name, sorted(self.column_names.items()) if self.column_names else None,
+            sorted(self.schema.items()) if self.schema else None
+        ))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{self._cache_prefix()}{self._source_digest()}.{digest}.pickle")
+
+    def _prune_cache(self, cache_path: str) -> None:
+        """
+        Удаляет файлы кэша этой книги, записанные для ее предыдущих версий (другое время изменения или размер).
+        """
+        prefix = self._cache_prefix()
+        current = os.path.basename(cache_path)[len(prefix):].split(".", 1)[0]
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(prefix) and name.endswith(".pickle") and not name[len(prefix):].startswith(current + "."):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:  # Файл уже удален другим воркером или еще открыт на чтение (Windows)
+                    pass
+
+    def _open_sheet(self, sheet_name: str | None) -> tuple[Iterator[tuple], dict, tuple, tuple]:
+        """
+        Открывает лист: генератор исходных строк данных (после заголовков), позиции столбцов,
+        имена выходных столбцов и функции преобразования (определяются один раз на лист, а не на каждую строку).
+        """
+        sheet = self.workbook[sheet_name] if sheet_name else self.workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
 
         # Если column_names не передан, используем заголовки из первой строки
-        if self.column_names is None:
-            headers = [cell.value for cell in sheet[1]]
-
-        # Пропускаем первую строку (заголовки)
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if all(cell is None for cell in row):
-                continue  # Пропускаем пустую строку
-
-            row_data = {}
-
-            if self.column_names:
-                # Используем переданный column_names
-                for col_name, col_index in self.column_names.items():
-                    cell_value = row[col_index]
-                    row_data[col_name] = self._process_cell_value(cell_value)
-            else:
-                # Используем заголовки из первой строки
-                for col_index, cell_value in enumerate(row):
-                    header = headers[col_index]
-                    row_data[header] = self._process_cell_value(cell_value)
-
-            data.append(row_data)
-
-        return data
+        headers = next(rows, ())
+        if self.column_names:
+            positions = dict(self.column_names)
+        else:
+            positions = {header: index for index, header in enumerate(headers)}
+
+        if self._schema_converters:
+            missing = [column for column in self._schema_converters if column not in positions]
+            if missing:
+                self.close()
+                raise ExcelSchemaError(
+                    f'Столбцы схемы {missing} не найдены на листе "{sheet.title}" файла "{self.file_path}"',
+                    row=1, column=missing[0]
+                )
+            columns = tuple(self._schema_converters)
+            converters = tuple((positions[column], self._schema_converters[column]) for column in columns)
+        else:
+            columns = tuple(positions)
+            converters = tuple((index, self._process_cell_value) for index in positions.values())
+        logger.info(f'Чтение листа "{sheet.title}" из файла "{self.file_path}"')
+        return rows, positions, columns, converters
+
+    def _read_sheet(self, sheet_name: str | None) -> tuple[tuple, Iterator[tuple]]:
+        """
+        Открывает лист и возвращает имена столбцов и генератор обработанных строк (значения в порядке столбцов).
+        """
+        rows, _, columns, converters = self._open_sheet(sheet_name)
+        return columns, self._process_rows(rows, columns, converters)
+
+    def iter_raw(
+            self,
+            sheet_name: str | None = None,
+            key_column: str | None = None
+    ) -> tuple[Callable[[int, tuple], Dict[str, object]], Iterator[tuple[int, object, tuple]]]:
+        """
+        Чтение листа без преобразования ячеек: вызывающий код отбирает строки по исходным значениям
+        и преобразует только нужные. Кэш на диске не используется (в нем хранятся уже преобразованные строки).
+
+        :param sheet_name: Имя листа в Excel.
+        :param key_column: Столбец, исходное значение которого возвращается вместе со строкой.
+        :return: Функция преобразования (номер строки, исходная строка) -> словарь и генератор
+                 (номер строки в Excel, исходное значение key_column или None, исходная строка).
+        :raises KeyError: Если столбца key_column нет на листе.
+        """
+        rows, positions, columns, converters = self._open_sheet(sheet_name)
+        if key_column is not None and key_column not in positions:
+            self.close()
+            raise KeyError(f'Столбец "{key_column}" не найден в файле "{self.file_path}"')
+        key_index = positions[key_column] if key_column is not None else None
+        width = max([index for index, _ in converters] + [key_index if key_index is not None else -1]) + 1
+
+        def convert_row(row_number: int, row: tuple) -> Dict[str, object]:
+            try:
+                return dict(zip(columns, [convert(row[index]) for index, convert in converters]))
+            except (ValueError, TypeError):
+                raise self._conversion_error(row_number, row, columns, converters) from None
+
+        def raw_rows() -> Iterator[tuple[int, object, tuple]]:
+            try:
+                # Первая строка (заголовки) уже прочитана, нумерация строк - как в Excel
+                for row_number, row in enumerate(rows, start=2):
+                    if all(cell is None for cell in row):
+                        continue  # Пропускаем пустую строку
+                    if len(row) < width:
+                        row = row + (None,) * (width - len(row))
+                    yield row_number, row[key_index] if key_index is not None else None, row
+            finally:
+                if self.read_only:
+                    self.close()
+
+        return convert_row, raw_rows()
+
+    def _process_rows(
+            self,
+            rows: Iterator[tuple],
+            columns: tuple,
+            converters: tuple[tuple[int, Callable], ...]
+    ) -> Iterator[tuple]:
+        width = max((index for index, _ in converters), default=-1) + 1
+        try:
+            # Первая строка (заголовки) уже прочитана, нумерация строк - как в Excel
+            for row_number, row in enumerate(rows, start=2):
+                if all(cell is None for cell in row):
+                    continue  # Пропускаем пустую строку
+                if len(row) < width:
+                    row = row + (None,) * (width - len(row))
+                try:
+                    yield tuple([convert(row[index]) for index, convert in converters])
+                except (ValueError, TypeError):
+                    raise self._conversion_error(row_number, row, columns, converters) from None
+        finally:
+            if self.read_only:
+                self.close()
+
+    def _conversion_error(
+            self,
+            row_number: int,
+            row: tuple,
+            columns: tuple,
+            converters: tuple[tuple[int, Callable], ...]
+    ) -> ExcelSchemaError:
+        """
+        Определяет столбец, значение которого не удалось преобразовать (выполняется только при ошибке).
+        """
+        for column, (index, convert) in zip(columns, converters):
+            try:
+                convert(row[index])
+            except (ValueError, TypeError) as e:
+                return ExcelSchemaError(
+                    f'Файл "{self.file_path}", строка {row_number}, столбец "{column}": {e}',
+                    row=row_number, column=column
+                )
+        return ExcelSchemaError(f'Файл "{self.file_path}", строка {row_number}: ошибка преобразования',
+                                row=row_number)
 
     @staticmethod
     def _process_cell_value(cell_value: str) -> int | str | None:
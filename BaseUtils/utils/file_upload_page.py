@@ -3,13 +3,14 @@ import tempfile
 import time
 import urllib.parse
 import allure
-import requests
 from requests import RequestException
 
 from BaseUtils.pages.base_page import BasePage
+from BaseUtils.pages.page_context import PageContext
 from selenium.webdriver.remote.webdriver import WebDriver
 import os
 
+from BaseUtils.utils.download_cache import get_download_cache
 from BaseUtils.utils.logger import logger
 
 
@@ -18,7 +19,9 @@ class FileUploadPage(BasePage):
     Класс для страницы с функционалом загрузки файлов.
     """
 
-    def __init__(self, driver: WebDriver, project_dir: str) -> None:
+    __slots__ = ("project_dir",)
+
+    def __init__(self, driver: WebDriver | PageContext, project_dir: str) -> None:
         super().__init__(driver)
         self.project_dir = project_dir
 
@@ -116,25 +119,37 @@ class FileUploadPage(BasePage):
 
             logger.info(f"Проверка ссылки: {link}")
 
-            logger.info(f"Скачивание файла по ссылке: {link}")
+            cache = get_download_cache()
+            if cache is not None:
+                # Файл берется из кэша загрузок, скачивается только при изменении на сервере
+                cached_file = cache.fetch(link, request=self.http_client.get)
+                file_path = cached_file.path
+                if cached_file.from_cache:
+                    logger.info(f"Файл взят из кэша загрузок: {file_path}")
+                else:
+                    logger.info(f"Файл успешно скачан в кэш загрузок: {file_path}")
+            else:
+                logger.info(f"Скачивание файла по ссылке: {link}")
 
-            # Скачиваем файл по ссылке
-            response = requests.get(link)
-            response.raise_for_status()  # Проверка на успешность запроса
+                # Скачиваем файл по ссылке частями, не загружая его целиком в память
+                with self.http_client.get(link, stream=True) as response:
+                    response.raise_for_status()  # Проверка на успешность запроса
 
-            # Определяем тип файла и расширение
-            content_type = response.headers.get('Content-Type')
-            extension = mimetypes.guess_extension(content_type) or ''
+                    # Определяем тип файла и расширение
+                    content_type = (response.headers.get('Content-Type') or '').split(';')[0].strip()
+                    extension = mimetypes.guess_extension(content_type) or ''
 
-            # Создаем временный файл с динамическим расширением
-            with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp_file:
-                tmp_file.write(response.content)
-                temp_file_name = tmp_file.name  # Получаем имя временного файла
+                    # Создаем временный файл с динамическим расширением
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp_file:
+                        temp_file_name = tmp_file.name  # Получаем имя временного файла
+                        for chunk in response.iter_content(chunk_size=64 * 1024):
+                            tmp_file.write(chunk)
+                file_path = temp_file_name
 
-            logger.info(f"Файл успешно скачан и сохранен как временный файл: {temp_file_name}")
+                logger.info(f"Файл успешно скачан и сохранен как временный файл: {temp_file_name}")
 
             # Используем метод drop_file_into_field для загрузки файла
-            self.drop_file_into_field(locator_type, locator_value, temp_file_name)
+            self.drop_file_into_field(locator_type, locator_value, file_path)
 
         except ValueError as ve:
             logger.error(f"Ошибка при проверке URL: {ve}")
@@ -0,0 +1,178 @@
+import threading
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from selenium.webdriver.remote.webdriver import WebDriver
+from urllib3.util.retry import Retry
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.logger import logger
+
+# Статистика HTTP-запросов всех клиентов процесса
+http_stats = {
+    "requests": 0,
+    "new_connections": 0,  # Открыто новых TCP/TLS-соединений
+    "cookie_syncs": 0,  # Синхронизаций cookies с браузером
+}
+_stats_lock = threading.Lock()
+
+
+class BrowserHttpClient:
+    """
+    HTTP-клиент драйвера для проверок на стороне HTTP (доступность файлов, скачивание по ссылке и т.п.).
+
+    Построен на requests.Session с пулом соединений: соединения с одним хостом переиспользуются
+    между запросами, повторные попытки выполняются адаптером. Cookies сессии приводятся к cookies браузера
+    при смене страницы браузера, поэтому запросы выполняются от имени авторизованного пользователя.
+    Клиент можно использовать из нескольких потоков (например, пулом проверки ссылок).
+    """
+
+    def __init__(
+            self,
+            driver: WebDriver,
+            connect_timeout: float = 5.0,
+            read_timeout: float = 30.0,
+            retries: int = 2,
+            backoff_factor: float = 0.3,
+            pool_size: int = 10
+    ) -> None:
+        """
+        :param driver: Экземпляр WebDriver, cookies которого используются в запросах.
+        :param connect_timeout: Таймаут установки соединения, сек.
+        :param read_timeout: Таймаут чтения ответа, сек.
+        :param retries: Количество повторных попыток при ошибках соединения и ответах 502/503/504.
+        :param backoff_factor: Коэффициент экспоненциальной паузы между повторными попытками.
+        :param pool_size: Максимальное количество соединений с одним хостом.
+        """
+        self.driver = driver
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"HEAD", "GET", "OPTIONS"}),
+            raise_on_status=False
+        )
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        self._user_agent_synced = False
+        # URL страницы браузера, для которой cookies сессии были синхронизированы в последний раз
+        self._synced_url: str | None = None
+        self._sync_lock = threading.Lock()
+        # Количество соединений пула на момент последнего запроса (для подсчета новых соединений)
+        self._opened_connections: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def sync_cookies(self, force: bool = False) -> None:
+        """
+        Приводит cookies и User-Agent сессии к текущему состоянию браузера.
+        Cookies запрашиваются у браузера, только если с прошлой синхронизации сменилась страница браузера.
+        Набор cookies сессии заменяется целиком, поэтому параллельные запросы не видят его частично заполненным.
+
+        :param force: Синхронизировать, даже если страница браузера не сменилась
+            (например, после входа или выхода без перехода на другую страницу).
+        """
+        with self._sync_lock:
+            try:
+                current_url = self.driver.current_url
+                if not force and current_url == self._synced_url:
+                    return
+                cookies = self.driver.get_cookies()
+                if not self._user_agent_synced:
+                    self.session.headers["User-Agent"] = self.driver.execute_script("return navigator.userAgent;")
+                    self._user_agent_synced = True
+            except Exception as e:
+                logger.warning(f"Не удалось получить cookies браузера для HTTP-запроса: {e}")
+                return
+            jar = RequestsCookieJar()
+            for cookie in cookies:
+                jar.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                    secure=cookie.get("secure", False)
+                )
+            self.session.cookies = jar
+            self._synced_url = current_url
+        with _stats_lock:
+            http_stats["cookie_syncs"] += 1
+
+    def request(self, method: str, url: str, refresh_cookies: bool = True, **kwargs) -> requests.Response:
+        """
+        Выполняет HTTP-запрос с cookies браузера через пул соединений.
+
+        :param method: HTTP-метод.
+        :param url: URL запроса.
+        :param refresh_cookies: Проверить перед запросом, не сменилась ли страница браузера (и синхронизировать cookies).
+            False - для серии запросов после явного вызова sync_cookies(), чтобы не обращаться к браузеру из каждого потока.
+        :param kwargs: Параметры requests.Session.request (timeout по умолчанию - из config.ini).
+        :return: Ответ сервера.
+        """
+        if refresh_cookies:
+            self.sync_cookies()
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, url, **kwargs)
+        self._record_connection(response.url)
+        return response
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def _record_connection(self, url: str) -> None:
+        """
+        Учитывает, было ли для запроса открыто новое соединение или переиспользовано существующее.
+        """
+        try:
+            pool = self._adapter.poolmanager.connection_from_url(url)
+        except Exception:
+            return
+        with _stats_lock:
+            opened = pool.num_connections
+            new_connections = max(0, opened - self._opened_connections.get(pool, 0))
+            self._opened_connections[pool] = opened
+            http_stats["requests"] += 1
+            http_stats["new_connections"] += new_connections
+
+    def close(self) -> None:
+        """
+        Закрывает соединения пула.
+        """
+        self.session.close()
+
+
+def create_http_client(driver: WebDriver) -> BrowserHttpClient:
+    """
+    Создает HTTP-клиент драйвера с параметрами из секции [http] config.ini.
+
+    :param driver: Экземпляр WebDriver.
+    :return: Экземпляр BrowserHttpClient.
+    """
+    return BrowserHttpClient(
+        driver,
+        connect_timeout=config_registry.get_float(category="http", key="connect_timeout", default=5.0),
+        read_timeout=config_registry.get_float(category="http", key="read_timeout", default=30.0),
+        retries=config_registry.get_int(category="http", key="retries", default=2),
+        backoff_factor=config_registry.get_float(category="http", key="backoff_factor", default=0.3),
+        pool_size=config_registry.get_int(category="http", key="pool_size", default=10)
+    )
+
+
+def http_summary() -> str:
+    """
+    Текстовая сводка по HTTP-запросам для вывода в конце сессии.
+    """
+    requests_count = http_stats["requests"]
+    reused = max(0, requests_count - http_stats["new_connections"])
+    reuse_rate = reused / requests_count * 100 if requests_count else 0.0
+    return (
+        f"HTTP-клиент: запросов: {requests_count}, новых соединений: {http_stats['new_connections']}, "
+        f"переиспользовано соединений: {reused} ({reuse_rate:.0f}%), "
+        f"синхронизаций cookies: {http_stats['cookie_syncs']}"
+    )
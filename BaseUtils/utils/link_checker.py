@@ -0,0 +1,232 @@
+import csv
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+
+import requests
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.http_client import BrowserHttpClient
+
+# Сбор всех ссылок (href) и ресурсов (src) страницы за один вызов.
+# Свойства href/src возвращают абсолютные URL, поэтому относительные ссылки разрешаются браузером.
+COLLECT_LINKS_JS = """
+var include_sources = arguments[0];
+var selector = include_sources
+    ? 'a[href], link[href], area[href], img[src], script[src], iframe[src], source[src], video[src], audio[src], embed[src]'
+    : 'a[href], area[href]';
+var links = [];
+var nodes = document.querySelectorAll(selector);
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i];
+    var url = node.hasAttribute('href') ? node.href : node.src;
+    if (typeof url === 'string' && /^https?:/i.test(url)) {
+        links.push({url: url.split('#')[0], tag: node.tagName.toLowerCase()});
+    }
+}
+return links;
+"""
+
+# Сервер не поддерживает HEAD - проверка повторяется запросом GET
+HEAD_NOT_SUPPORTED = (405, 501)
+
+# Ответы 5xx считаются временными: такие результаты (как и ошибки соединения) не кэшируются
+TRANSIENT_STATUS = 500
+
+
+@dataclass
+class LinkCheckResult:
+    """
+    Результат проверки одного URL.
+    """
+    url: str
+    status: int | None
+    elapsed: float
+    error: str | None = None
+    tags: set[str] = field(default_factory=set)
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and self.status < 400
+
+    @property
+    def final(self) -> bool:
+        """
+        Окончательный результат (не ошибка соединения и не ответ 5xx), который можно кэшировать.
+        """
+        return self.error is None and self.status is not None and self.status < TRANSIENT_STATUS
+
+
+class LinkChecker:
+    """
+    Параллельная проверка доступности URL ограниченным пулом потоков.
+    Окончательные результаты кэшируются по URL и набору cookies запросов на всю сессию: повторные ссылки
+    (меню, логотипы, скрипты) на следующих страницах не запрашиваются повторно, а результат, полученный
+    с cookies одного пользователя, не используется для проверок без cookies или с cookies другого.
+    Ошибки соединения и ответы 5xx проверяются заново.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = 8,
+            timeout: float | tuple[float, float] = (5.0, 15.0)
+    ) -> None:
+        """
+        :param max_workers: Максимальное количество одновременных запросов.
+        :param timeout: Таймаут запроса (соединение, чтение), сек.
+        """
+        # Собственная сессия для проверок без HTTP-клиента драйвера (создается при первой такой проверке)
+        self._session: requests.Session | None = None
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # (набор cookies запросов или None без клиента, URL) -> результат
+        self._cache: dict[tuple[frozenset | None, str], LinkCheckResult] = {}
+        self._lock = threading.Lock()
+        self.stats = {"checked": 0, "cache_hits": 0, "broken": 0}
+
+    def check(self, urls: list[str], client: BrowserHttpClient | None = None) -> list[LinkCheckResult]:
+        """
+        Проверяет список URL (дубликаты проверяются один раз).
+
+        :param urls: Список URL.
+        :param client: HTTP-клиент драйвера (cookies браузера, пул соединений, повторные попытки, статистика).
+            Cookies синхронизируются один раз перед проверкой, кэш результатов - отдельный для каждого набора cookies.
+            По умолчанию - собственная сессия без cookies.
+        :return: Результаты проверки в порядке первого появления URL (копии, их можно изменять).
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        results: dict[str, LinkCheckResult] = {}
+        to_check = []
+        if client is not None:
+            client.sync_cookies()
+        identity = self._client_identity(client)
+        with self._lock:
+            for url in unique_urls:
+                cached = self._cache.get((identity, url))
+                if cached is not None:
+                    results[url] = replace(cached, tags=set(), cached=True)
+                    self.stats["cache_hits"] += 1
+                else:
+                    to_check.append(url)
+
+        if to_check:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(to_check))) as executor:
+                for result in executor.map(lambda url: self._check_url(client, url), to_check):
+                    results[result.url] = result
+
+        with self._lock:
+            for url in to_check:
+                if results[url].final:
+                    self._cache[(identity, url)] = replace(results[url], tags=set())
+            self.stats["checked"] += len(to_check)
+            self.stats["broken"] += sum(1 for url in to_check if not results[url].ok)
+        return [results[url] for url in unique_urls]
+
+    def check_links(self, links: list[dict], client: BrowserHttpClient | None = None) -> list[LinkCheckResult]:
+        """
+        Проверяет ссылки, собранные скриптом COLLECT_LINKS_JS, с указанием тегов, в которых они найдены.
+
+        :param links: Список словарей {"url": ..., "tag": ...}.
+        :param client: HTTP-клиент драйвера для запросов.
+        :return: Результаты проверки.
+        """
+        results = self.check([link["url"] for link in links], client=client)
+        by_url = {result.url: result for result in results}
+        for link in links:
+            by_url[link["url"]].tags.add(link["tag"])
+        return results
+
+    def close(self) -> None:
+        """
+        Закрывает соединения собственной сессии (кэш результатов сохраняется).
+        """
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    @staticmethod
+    def _client_identity(client: BrowserHttpClient | None) -> frozenset | None:
+        """
+        Ключ кэша для запросов клиента: набор его cookies (после синхронизации с браузером).
+        """
+        if client is None:
+            return None
+        return frozenset((cookie.domain, cookie.path, cookie.name, cookie.value) for cookie in client.session.cookies)
+
+    def _get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+            return self._session
+
+    def _request(self, client: BrowserHttpClient | None, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.update(timeout=self.timeout, allow_redirects=True)
+        if client is None:
+            return self._get_session().request(method, url, **kwargs)
+        # Cookies уже синхронизированы в check(): потоки пула не обращаются к браузеру
+        return client.request(method, url, refresh_cookies=False, **kwargs)
+
+    def _check_url(self, client: BrowserHttpClient | None, url: str) -> LinkCheckResult:
+        start_time = time.perf_counter()
+        try:
+            response = self._request(client, "HEAD", url)
+            if response.status_code in HEAD_NOT_SUPPORTED:
+                with self._request(client, "GET", url, stream=True) as response:
+                    pass
+            return LinkCheckResult(url, response.status_code, time.perf_counter() - start_time)
+        except requests.RequestException as e:
+            return LinkCheckResult(url, None, time.perf_counter() - start_time, error=f"{type(e).__name__}: {e}")
+
+
+def format_results_table(results: list[LinkCheckResult]) -> str:
+    """
+    Таблица результатов в формате CSV (отображается в Allure как таблица).
+
+    :param results: Результаты проверки.
+    :return: Текст CSV.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["URL", "Статус", "Время ответа, мс", "Теги", "Ошибка"])
+    for result in sorted(results, key=lambda item: (item.ok, item.url)):
+        writer.writerow([
+            result.url,
+            result.status if result.status is not None else "-",
+            f"{result.elapsed * 1000:.0f}" + (" (кэш)" if result.cached else ""),
+            ", ".join(sorted(result.tags)),
+            result.error or ""
+        ])
+    return output.getvalue()
+
+
+_link_checker: LinkChecker | None = None
+
+
+def get_link_checker() -> LinkChecker:
+    """
+    Возвращает проверку ссылок процесса (общий кэш статусов на сессию) по секции [link checker] config.ini.
+
+    :return: Экземпляр LinkChecker.
+    """
+    global _link_checker
+    if _link_checker is None:
+        _link_checker = LinkChecker(
+            max_workers=config_registry.get_int(category="link checker", key="workers", default=8),
+            timeout=(
+                config_registry.get_float(category="link checker", key="connect_timeout", default=5.0),
+                config_registry.get_float(category="link checker", key="read_timeout", default=15.0)
+            )
+        )
+    return _link_checker
+
+
+def close_link_checker() -> None:
+    """
+    Закрывает соединения проверки ссылок процесса, если она была создана.
+    """
+    if _link_checker is not None:
+        _link_checker.close()
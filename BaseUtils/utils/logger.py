@@ -1,30 +1,76 @@
 from loguru import logger as loguru_logger
+import os
 import sys
+from typing import Callable
+
+from BaseUtils.configurations.config_reader import config_registry
+
+# Директория файлов логов воркеров
+LOGS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'logs'))
+
+CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD at HH:mm:ss}</green> \n"
+    "| <level>{level}</level> | \n"
+    "<cyan>{message}</cyan> \n"
+    "================================================================================"
+)
 
 
 def setup_logger():
     """
-    Настройка логера с использованием loguru.
+    Настройка логера с использованием loguru по секции [logging] config.ini.
+
+    - level: минимальный уровень сообщений;
+    - enqueue: запись через очередь в фоновом потоке (по умолчанию выключена);
+    - file_sink: файл логов на каждого воркера (logs/worker_<id>.log) с ротацией и сжатием;
+    - json: файл логов в формате JSON Lines (logs/worker_<id>.jsonl).
 
     Returns:
         loguru.Logger: Объект логера.
     """
+    level = config_registry.get(category="logging", key="level", default="INFO").strip().upper()
+    enqueue = config_registry.get_bool(category="logging", key="enqueue", default=False)
+
     # Очищаем любые стандартные обработчики
     loguru_logger.remove()
 
     # Настраиваем вывод в консоль с поддержкой цвета
     loguru_logger.add(
         sys.stdout,
-        format="<green>{time:YYYY-MM-DD at HH:mm:ss}</green> \n"
-               "| <level>{level}</level> | \n"
-               "<cyan>{message}</cyan> \n"
-               "================================================================================",
-        level="INFO",
-        colorize=True
+        format=CONSOLE_FORMAT,
+        level=level,
+        colorize=True,
+        enqueue=enqueue
     )
 
+    if config_registry.get_bool(category="logging", key="file_sink", default=False):
+        worker_id = os.environ.get("TEST_WORKER_ID", "main")
+        serialize = config_registry.get_bool(category="logging", key="json", default=False)
+        extension = "jsonl" if serialize else "log"
+        loguru_logger.add(
+            os.path.join(LOGS_DIR, f"worker_{worker_id}.{extension}"),
+            level=level,
+            rotation=config_registry.get(category="logging", key="rotation", default="10 MB"),
+            compression=config_registry.get(category="logging", key="compression", default="zip") or None,
+            serialize=serialize,
+            enqueue=enqueue,
+            encoding="utf-8"
+        )
+
     return loguru_logger
 
 
+def log_lazy(build_message: Callable[[], str], level: str = "INFO") -> None:
+    """
+    Логирование с отложенным формированием сообщения: build_message вызывается,
+    только если уровень level включен, поэтому сообщения об успешных действиях
+    ничего не стоят при отключенном уровне.
+
+    :param build_message: Функция, возвращающая текст сообщения.
+    :param level: Уровень сообщения.
+    """
+    logger.opt(lazy=True, depth=1).log(level, "{}", build_message)
+
+
 # Настраиваем логгер с использованием loguru
 logger = setup_logger()
@@ -0,0 +1,67 @@
+import re
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TextHit:
+    """
+    Найденное вхождение запрещенного слова.
+    """
+    word: str
+    position: int
+    context: str
+
+
+class PageTextScanner:
+    """
+    Поиск набора слов в тексте за один проход.
+    Все слова компилируются в одно регулярное выражение (более длинные альтернативы первыми,
+    чтобы "TypeError" не распознавался как "Error").
+    """
+
+    def __init__(
+            self,
+            words: list[str],
+            whole_word: bool = False,
+            case_sensitive: bool = True,
+            context_chars: int = 40
+    ) -> None:
+        """
+        :param words: Список искомых слов.
+        :param whole_word: Искать только целые слова.
+        :param case_sensitive: Учитывать регистр.
+        :param context_chars: Количество символов контекста слева и справа от вхождения.
+        """
+        self.words = [word for word in dict.fromkeys(word.strip() for word in words) if word]
+        self.context_chars = context_chars
+        alternatives = "|".join(re.escape(word) for word in sorted(self.words, key=len, reverse=True))
+        if whole_word:
+            alternatives = rf"(?<!\w)(?:{alternatives})(?!\w)"
+        self.pattern = re.compile(alternatives, 0 if case_sensitive else re.IGNORECASE) if self.words else None
+
+    def scan(self, text: str) -> list[TextHit]:
+        """
+        Находит все вхождения слов в тексте.
+
+        :param text: Текст для проверки.
+        :return: Список вхождений с окружающим контекстом.
+        """
+        if self.pattern is None or not text:
+            return []
+        hits = []
+        for match in self.pattern.finditer(text):
+            start = max(0, match.start() - self.context_chars)
+            end = min(len(text), match.end() + self.context_chars)
+            context = " ".join(text[start:end].split())
+            hits.append(TextHit(word=match.group(0), position=match.start(), context=context))
+        return hits
+
+    @staticmethod
+    def format_hits(hits: list[TextHit]) -> str:
+        """
+        Форматирует найденные вхождения для логов и отчета Allure.
+        """
+        return "\n".join(
+            f'{index}. "{hit.word}" (позиция {hit.position}): ...{hit.context}...'
+            for index, hit in enumerate(hits, start=1)
+        )
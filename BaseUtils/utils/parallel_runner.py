@@ -0,0 +1,335 @@
+import heapq
+import os
+import shutil
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.excel_params import SHARD_PLAN_FILE_ENV, load_shard_plan, shard_index
+from BaseUtils.utils.test_timings import DURATIONS_FILE_ENV, load_durations, update_history
+
+# Корневая директория репозитория, нужна воркерам для импорта плагина BaseUtils.utils.test_timings
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Коды завершения pytest
+EXIT_OK = 0
+EXIT_NO_TESTS_COLLECTED = 5
+
+# Аргументы pytest, отбирающие тесты: применяются только при сборе, воркеры получают уже отобранные nodeid
+SELECTION_OPTIONS = {"-k", "-m", "--deselect", "--ignore", "--ignore-glob"}
+# Прочие аргументы pytest со значением в следующем аргументе (передаются воркерам вместе со значением)
+VALUE_OPTIONS = {
+    "-p", "-o", "-c", "-W", "--maxfail", "--tb", "--rootdir", "--confcutdir", "--basetemp",
+    "--log-level", "--log-cli-level", "--log-file", "--log-file-level", "--junitxml", "--durations",
+    "--override-ini", "--pythonwarnings", "--capture", "--import-mode", "--alluredir",
+}
+# Аргументы, которые раннер задает воркерам сам
+RUNNER_OPTIONS = {"--alluredir"}
+
+
+@dataclass
+class WorkerResult:
+    """
+    Результат работы одного воркера.
+    """
+    worker_id: int
+    tests: list[str]
+    alluredir: str
+    log_path: str
+    durations_path: str
+    tests_path: str = ""
+    exit_code: int = EXIT_OK
+    duration: float = 0.0
+    process: subprocess.Popen | None = field(default=None, repr=False)
+
+
+def get_workers_count(cli_value: int | None = None) -> int:
+    """
+    Определяет количество воркеров: аргумент командной строки, затем config.ini ([runner] workers),
+    по умолчанию - количество CPU.
+
+    :param cli_value: Значение из командной строки.
+    :return: Количество воркеров (не меньше 1).
+    """
+    if cli_value:
+        return max(1, cli_value)
+    configured = config_registry.get(category="runner", key="workers", default="").strip()
+    if configured:
+        return max(1, int(configured))
+    return os.cpu_count() or 1
+
+
+def collect_tests(pytest_args: list[str], shard_plan_path: str | None = None) -> list[str]:
+    """
+    Собирает идентификаторы тестов (nodeid) без их запуска.
+
+    :param pytest_args: Дополнительные аргументы pytest (пути, -k, -m и т.д.).
+    :param shard_plan_path: Файл, в который плагин excel_params запишет план распределения случаев Excel.
+    :return: Список nodeid.
+    """
+    # Сбор без номера воркера: плагин excel_params должен вернуть все строки Excel
+    env = {key: value for key, value in os.environ.items() if key not in ("TEST_WORKER_ID", "TEST_WORKER_COUNT")}
+    if shard_plan_path:
+        env[SHARD_PLAN_FILE_ENV] = shard_plan_path
+    completed = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if completed.returncode not in (EXIT_OK, EXIT_NO_TESTS_COLLECTED):
+        print(completed.stdout)
+        print(completed.stderr)
+        raise RuntimeError(f"Ошибка сбора тестов, код завершения pytest: {completed.returncode}")
+    return [line.strip() for line in completed.stdout.splitlines() if "::" in line]
+
+
+def worker_args(pytest_args: list[str]) -> list[str]:
+    """
+    Аргументы pytest для воркеров: все, кроме отбора тестов (пути, -k, -m, --deselect, --ignore)
+    и аргументов, которые задает раннер (--alluredir). Например, -x, -s, --maxfail, -p, -o передаются.
+
+    :param pytest_args: Дополнительные аргументы pytest из командной строки раннера.
+    :return: Аргументы для запуска воркеров.
+    """
+    forwarded: list[str] = []
+    args = iter(pytest_args)
+    for arg in args:
+        option = arg.split("=", 1)[0]
+        takes_value = option in SELECTION_OPTIONS | VALUE_OPTIONS and "=" not in arg
+        value = [next(args, "")] if takes_value else []
+        if not arg.startswith("-") or option in SELECTION_OPTIONS | RUNNER_OPTIONS:
+            continue  # Пути к тестам и отбор уже учтены при сборе
+        forwarded += [arg, *value]
+    return forwarded
+
+
+def split_longest_first(
+        tests: list[str],
+        workers: int,
+        history: dict[str, float],
+        pinned: dict[str, int] | None = None
+) -> tuple[list[list[str]], float]:
+    """
+    Распределяет тесты по воркерам по алгоритму LPT (Longest Processing Time first):
+    закрепленные тесты отдаются своим воркерам, остальные тесты с известной длительностью
+    по убыванию отдаются наименее загруженному воркеру, тесты без истории распределяются по кругу.
+
+    :param tests: Список nodeid.
+    :param workers: Количество воркеров.
+    :param history: История длительностей nodeid -> секунды.
+    :param pinned: Закрепленные тесты nodeid -> номер воркера (случаи Excel, которые генерирует только этот воркер).
+    :return: Шарды и прогнозируемое время самого загруженного воркера (makespan), сек.
+    """
+    pinned = pinned or {}
+    shards: list[list[str]] = [[] for _ in range(workers)]
+    known_durations = [history[test] for test in tests if test in history]
+    average = sum(known_durations) / len(known_durations) if known_durations else 0.0
+
+    # Закрепленные тесты задают начальную нагрузку воркеров (без истории - средняя длительность)
+    initial_loads = [0.0] * workers
+    for test in tests:
+        if test in pinned:
+            shards[pinned[test]].append(test)
+            initial_loads[pinned[test]] += history.get(test, average)
+
+    free = [test for test in tests if test not in pinned]
+    known = sorted((test for test in free if test in history), key=lambda test: history[test], reverse=True)
+    unknown = [test for test in free if test not in history]
+
+    # Куча (нагрузка, номер воркера) - всегда берем наименее загруженного
+    loads = [(initial_loads[worker_id], worker_id) for worker_id in range(workers)]
+    heapq.heapify(loads)
+    for test in known:
+        load, worker_id = heapq.heappop(loads)
+        shards[worker_id].append(test)
+        heapq.heappush(loads, (load + history[test], worker_id))
+
+    # Для неизвестных тестов прогноз - средняя известная длительность
+    predicted = {worker_id: load for load, worker_id in loads}
+    for index, test in enumerate(unknown):
+        worker_id = index % workers
+        shards[worker_id].append(test)
+        predicted[worker_id] += average
+
+    return shards, max(predicted.values(), default=0.0)
+
+
+def run_shards(shards: list[list[str]], report_dir: str, extra_args: list[str] | None = None) -> list[WorkerResult]:
+    """
+    Запускает по процессу pytest на каждый непустой шард. У каждого воркера свой браузер
+    и своя директория результатов Allure (report_dir/worker_N). Список nodeid передается
+    файлом (@файл), а не в командной строке: ее длина ограничена (особенно на Windows).
+
+    :param shards: Шарды тестов.
+    :param report_dir: Общая директория результатов Allure.
+    :param extra_args: Дополнительные аргументы pytest для воркеров (см. worker_args).
+    :return: Результаты воркеров.
+    """
+    os.makedirs(report_dir, exist_ok=True)
+    workers_count = len(shards)
+    results: list[WorkerResult] = []
+
+    for worker_id, tests in enumerate(shards):
+        if not tests:
+            continue
+        alluredir = os.path.join(report_dir, f"worker_{worker_id}")
+        shutil.rmtree(alluredir, ignore_errors=True)
+        log_path = os.path.join(report_dir, f"worker_{worker_id}.log")
+        durations_path = os.path.join(report_dir, f"worker_{worker_id}_durations.json")
+        tests_path = os.path.join(report_dir, f"worker_{worker_id}_tests.txt")
+        with open(tests_path, "w", encoding="utf-8") as tests_file:
+            tests_file.write("\n".join(tests) + "\n")
+        python_path = os.pathsep.join(filter(None, [PROJECT_ROOT, os.environ.get("PYTHONPATH")]))
+        env = dict(
+            os.environ,
+            PYTHONPATH=python_path,
+            TEST_WORKER_ID=str(worker_id),
+            TEST_WORKER_COUNT=str(workers_count),
+            **{DURATIONS_FILE_ENV: durations_path},
+            **config_registry.frozen_env(),  # Воркеры получают уже разобранную конфигурацию
+        )
+        result = WorkerResult(
+            worker_id=worker_id,
+            tests=tests,
+            alluredir=alluredir,
+            log_path=log_path,
+            durations_path=durations_path,
+            tests_path=tests_path
+        )
+        log_file = open(log_path, "w", encoding="utf-8")
+        result.duration = time.perf_counter()
+        result.process = subprocess.Popen(
+            [sys.executable, "-m", "pytest", "-p", "BaseUtils.utils.test_timings", f"--alluredir={alluredir}",
+             *(extra_args or []), f"@{tests_path}"],
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            env=env,
+        )
+        log_file.close()  # Дескриптор унаследован дочерним процессом
+        results.append(result)
+
+    pending = list(results)
+    while pending:
+        for result in list(pending):
+            exit_code = result.process.poll()
+            if exit_code is not None:
+                result.exit_code = exit_code
+                result.duration = time.perf_counter() - result.duration
+                pending.remove(result)
+                if os.path.exists(result.tests_path):
+                    os.remove(result.tests_path)
+        time.sleep(0.1)
+    return results
+
+
+def merge_allure_results(results: list[WorkerResult], report_dir: str) -> None:
+    """
+    Объединяет результаты Allure всех воркеров в report_dir.
+    Имена файлов результатов Allure уникальны (uuid), поэтому достаточно перенести их в одну директорию.
+
+    :param results: Результаты воркеров.
+    :param report_dir: Общая директория результатов Allure.
+    """
+    for result in results:
+        if not os.path.isdir(result.alluredir):
+            continue
+        for file_name in os.listdir(result.alluredir):
+            shutil.move(os.path.join(result.alluredir, file_name), os.path.join(report_dir, file_name))
+        shutil.rmtree(result.alluredir, ignore_errors=True)
+
+
+def collect_durations(results: list[WorkerResult]) -> dict[str, float]:
+    """
+    Собирает длительности тестов, записанные воркерами, и удаляет временные файлы.
+
+    :param results: Результаты воркеров.
+    :return: Словарь nodeid -> длительность в секундах.
+    """
+    durations: dict[str, float] = {}
+    for result in results:
+        durations.update(load_durations(result.durations_path))
+        if os.path.exists(result.durations_path):
+            os.remove(result.durations_path)
+    return durations
+
+
+def aggregate_exit_code(results: list[WorkerResult]) -> int:
+    """
+    Общий код завершения: 0, если все воркеры успешны; иначе самый "тяжелый" код
+    (1 - упавшие тесты, 2+ - прерывание/внутренняя ошибка). Воркер без тестов (5) не считается ошибкой.
+
+    :param results: Результаты воркеров.
+    :return: Код завершения.
+    """
+    if not results:
+        return EXIT_NO_TESTS_COLLECTED
+    codes = [result.exit_code for result in results if result.exit_code != EXIT_NO_TESTS_COLLECTED]
+    return max(codes, default=EXIT_OK)
+
+
+def print_worker_timings(results: list[WorkerResult]) -> None:
+    """
+    Выводит время работы и результат каждого воркера.
+    """
+    print("\nВремя работы воркеров:")
+    for result in sorted(results, key=lambda r: r.worker_id):
+        status = "OK" if result.exit_code in (EXIT_OK, EXIT_NO_TESTS_COLLECTED) else f"код {result.exit_code}"
+        print(
+            f"  worker_{result.worker_id}: тестов: {len(result.tests)}, "
+            f"время: {result.duration:.2f} сек, {status}, лог: {result.log_path}"
+        )
+
+
+def run_parallel(
+        workers: int,
+        report_dir: str = "./report",
+        pytest_args: list[str] | None = None,
+        history_path: str = ".test_durations.json"
+) -> int:
+    """
+    Параллельный запуск тестов: сбор, распределение по воркерам с учетом истории длительностей,
+    запуск, объединение отчетов и обновление истории.
+
+    :param workers: Количество воркеров.
+    :param report_dir: Директория результатов Allure.
+    :param history_path: Файл истории длительностей тестов.
+    :param pytest_args: Дополнительные аргументы pytest для отбора тестов (пути, -k, -m).
+    :return: Общий код завершения.
+    """
+    pytest_args = pytest_args or []
+    os.makedirs(report_dir, exist_ok=True)
+    shard_plan_path = os.path.join(report_dir, "excel_shard_plan.json")
+    tests = collect_tests(pytest_args, shard_plan_path)
+    shard_plan = load_shard_plan(shard_plan_path)
+    if os.path.exists(shard_plan_path):
+        os.remove(shard_plan_path)
+    if not tests:
+        print("Тесты не найдены.")
+        return EXIT_NO_TESTS_COLLECTED
+
+    workers = min(workers, len(tests))
+    history = load_durations(history_path)
+    # Случаи Excel закрепляются за воркером, который генерирует их по тому же ключу
+    collected = set(tests)
+    pinned = {test: shard_index(key, workers) for test, key in shard_plan.items() if test in collected}
+    shards, predicted_makespan = split_longest_first(tests, workers, history, pinned)
+    known_count = sum(1 for test in tests if test in history)
+    print(
+        f"Найдено тестов: {len(tests)} (с известной длительностью: {known_count}, "
+        f"случаев Excel: {len(pinned)}), воркеров: {workers}"
+    )
+
+    results = run_shards(shards, report_dir, worker_args(pytest_args))
+    merge_allure_results(results, report_dir)
+    update_history(history_path, collect_durations(results))
+    print_worker_timings(results)
+
+    actual_makespan = max((result.duration for result in results), default=0.0)
+    print(
+        f"Прогноз времени самого загруженного воркера: {predicted_makespan:.2f} сек, "
+        f"фактическое: {actual_makespan:.2f} сек"
+    )
+    return aggregate_exit_code(results)
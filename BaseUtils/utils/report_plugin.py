@@ -0,0 +1,49 @@
+"""
+Плагин pytest для вложений отчета Allure.
+
+- в начале каждого теста очищает буфер вложений (attachment_policy) и историю скриншотов;
+- после каждого этапа теста прикрепляет скриншоты, закодированные в фоне, и вложения об успешных шагах
+  из буфера (только для упавшего теста, по политике [allure] attachments);
+- в конце сессии прикрепляет оставшиеся скриншоты и останавливает пул кодирования.
+
+Подключается в conftest.py проекта: config.pluginmanager.import_plugin("BaseUtils.utils.report_plugin").
+"""
+import allure
+import pytest
+
+from BaseUtils.utils.attachment_policy import get_attachment_policy
+from BaseUtils.utils.screenshot_service import get_screenshot_service, shutdown_screenshot_service
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item) -> None:
+    """
+    Начало теста: буфер вложений и история скриншотов предыдущего теста очищаются.
+    """
+    get_attachment_policy().start_test()
+    get_screenshot_service().start_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Вложения об успешных шагах из буфера прикрепляются к отчету, только если тест упал
+    (на любом этапе: подготовка, выполнение, завершение). Для прошедшего теста буфер отбрасывается.
+    Скриншоты, закодированные в фоне за время этапа, прикрепляются к отчету здесь же.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    get_screenshot_service().drain()
+    policy = get_attachment_policy()
+    if report.failed and len(policy):
+        with allure.step("Последние шаги перед падением теста"):
+            policy.flush()
+    elif report.when == "teardown":
+        policy.discard()
+
+
+def pytest_sessionfinish(session) -> None:
+    """
+    Конец сессии: остановка пула кодирования скриншотов.
+    """
+    shutdown_screenshot_service()
@@ -0,0 +1,253 @@
+import hashlib
+import io
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+import allure
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.logger import logger
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow не установлен: скриншоты прикрепляются в исходном PNG
+    Image = None
+
+# Прямоугольник элемента в пикселях скриншота (с учетом devicePixelRatio) с отступом вокруг
+ELEMENT_REGION_JS = """
+var rect = arguments[0].getBoundingClientRect();
+var ratio = window.devicePixelRatio || 1;
+var padding = arguments[1];
+return [
+    Math.max(0, (rect.left - padding) * ratio),
+    Math.max(0, (rect.top - padding) * ratio),
+    (rect.right + padding) * ratio,
+    (rect.bottom + padding) * ratio
+];
+"""
+
+IMAGE_FORMATS = {
+    "png": ("PNG", allure.attachment_type.PNG),
+    "jpeg": ("JPEG", allure.attachment_type.JPG),
+    "webp": ("WEBP", None),
+}
+
+
+@dataclass
+class PendingScreenshot:
+    """
+    Скриншот, переданный на кодирование и ожидающий прикрепления к отчету.
+    """
+    future: Future
+    name: str
+    step_title: str | None
+
+
+class ScreenshotService:
+    """
+    Сервис скриншотов: снимок делается один раз в потоке теста, уменьшение, обрезка по элементу
+    и перекодирование (PNG/JPEG/WebP) выполняются в пуле потоков. Подряд идущие одинаковые кадры
+    одного драйвера отбрасываются по хэшу.
+
+    Allure хранит контекст теста в потоке теста, поэтому готовые скриншоты прикрепляются
+    методом drain() из потока теста (в хуках pytest по окончании этапа теста).
+    Если кодировать нечего (PNG без уменьшения и обрезки или Pillow не установлен), пул не используется:
+    скриншот прикрепляется сразу, внутри текущего шага.
+    """
+
+    def __init__(
+            self,
+            image_format: str = "png",
+            quality: int = 80,
+            max_width: int = 0,
+            workers: int = 2
+    ) -> None:
+        """
+        :param image_format: Формат вложения: png, jpeg или webp (jpeg/webp требуют Pillow).
+        :param quality: Качество JPEG/WebP (1-100).
+        :param max_width: Максимальная ширина скриншота в пикселях, 0 - без уменьшения.
+        :param workers: Количество потоков кодирования.
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f'Неизвестный формат скриншотов: "{image_format}". Допустимые значения: {tuple(IMAGE_FORMATS)}')
+        if Image is None and (image_format != "png" or max_width):
+            logger.warning("Pillow не установлен: скриншоты прикрепляются в исходном PNG без сжатия и уменьшения.")
+            image_format, max_width = "png", 0
+        self.image_format = image_format
+        self.quality = quality
+        self.max_width = max_width
+        # Перекодирование или уменьшение каждого скриншота (обрезка по элементу - только при наличии области)
+        self.encodes = Image is not None and (image_format != "png" or bool(max_width))
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+        self._pending: list[PendingScreenshot] = []
+        self._last_digests: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.stats = {
+            "captured": 0,
+            "duplicates": 0,  # Подряд идущие одинаковые кадры, не прикрепленные повторно
+            "raw_bytes": 0,  # Размер исходных PNG
+            "attached_bytes": 0,  # Размер прикрепленных к отчету скриншотов
+        }
+
+    def capture(
+            self,
+            driver: WebDriver,
+            name: str = "Screenshot",
+            step_title: str | None = None,
+            element: WebElement | None = None
+    ) -> bool:
+        """
+        Делает скриншот и передает его на кодирование, не дожидаясь результата
+        (без кодирования - сразу прикрепляет к отчету).
+
+        :param driver: Экземпляр WebDriver.
+        :param name: Имя вложения в отчете.
+        :param step_title: Заголовок шага Allure, в который будет прикреплен скриншот.
+        :param element: Элемент, по области которого обрезается скриншот (если Pillow установлен).
+        :return: False, если кадр совпадает с предыдущим кадром драйвера и не будет прикреплен.
+        """
+        png = driver.get_screenshot_as_png()
+        digest = hashlib.blake2b(png, digest_size=16).hexdigest()
+        with self._lock:
+            self.stats["captured"] += 1
+            self.stats["raw_bytes"] += len(png)
+            if self._last_digests.get(driver) == digest:
+                self.stats["duplicates"] += 1
+                logger.info("\n Скриншот совпадает с предыдущим, повторно не прикрепляется \n")
+                return False
+            self._last_digests[driver] = digest
+
+        region = None
+        if element is not None and Image is not None:
+            try:
+                region = tuple(driver.execute_script(ELEMENT_REGION_JS, element, 20))
+            except Exception as e:
+                logger.warning(f"Не удалось определить область элемента для скриншота: {e}")
+
+        if not self.encodes and region is None:
+            self.stats["attached_bytes"] += len(png)
+            self._attach(png, name, step_title)
+            return True
+
+        future = self._executor.submit(self._encode, png, region)
+        with self._lock:
+            self._pending.append(PendingScreenshot(future, name, step_title))
+        return True
+
+    def _encode(self, png: bytes, region: tuple | None) -> bytes:
+        """
+        Обрезка, уменьшение и перекодирование скриншота (выполняется в пуле потоков).
+        """
+        if Image is None or (self.image_format == "png" and not self.max_width and region is None):
+            return png
+        with Image.open(io.BytesIO(png)) as image:
+            if region is not None:
+                image = image.crop(tuple(int(value) for value in region))
+            if self.max_width and image.width > self.max_width:
+                height = round(image.height * self.max_width / image.width)
+                image = image.resize((self.max_width, height), Image.LANCZOS)
+            if self.image_format == "jpeg" and image.mode != "RGB":
+                image = image.convert("RGB")
+            output = io.BytesIO()
+            pil_format = IMAGE_FORMATS[self.image_format][0]
+            if pil_format == "PNG":
+                image.save(output, format=pil_format, optimize=True)
+            else:
+                image.save(output, format=pil_format, quality=self.quality)
+        encoded = output.getvalue()
+        # Перекодирование не всегда уменьшает размер (например, для однотонных страниц)
+        return encoded if len(encoded) < len(png) or region is not None or self.max_width else png
+
+    def start_test(self) -> None:
+        """
+        Начало нового теста: кадры предыдущего теста не считаются дубликатами.
+        """
+        with self._lock:
+            self._last_digests.clear()
+
+    def drain(self) -> None:
+        """
+        Дожидается кодирования переданных скриншотов и прикрепляет их к отчету Allure.
+        Вызывается из потока теста.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for screenshot in pending:
+            try:
+                body = screenshot.future.result()
+            except Exception as e:
+                logger.warning(f'Не удалось подготовить скриншот "{screenshot.name}": {e}')
+                continue
+            self.stats["attached_bytes"] += len(body)
+            self._attach(body, screenshot.name, screenshot.step_title)
+
+    def _attach(self, body: bytes, name: str, step_title: str | None) -> None:
+        if body[:8] == b"\x89PNG\r\n\x1a\n":
+            attachment_type, extension = allure.attachment_type.PNG, None
+        else:
+            attachment_type = IMAGE_FORMATS[self.image_format][1]
+            extension = self.image_format if attachment_type is None else None
+        if step_title:
+            with allure.step(step_title):
+                allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+        else:
+            allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+
+    def shutdown(self) -> None:
+        """
+        Прикрепляет оставшиеся скриншоты и останавливает пул потоков.
+        """
+        self.drain()
+        self._executor.shutdown(wait=True)
+        self._last_digests.clear()
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка по скриншотам для вывода в конце сессии.
+        """
+        text = (
+            f"Скриншоты ({self.image_format}): снято: {self.stats['captured']}, "
+            f"дубликатов: {self.stats['duplicates']}, "
+            f"в отчете: {self.stats['attached_bytes'] / 1024:.0f} КБ"
+        )
+        if not self.encodes:
+            return f"{text} (без перекодирования)"
+        saved = self.stats["raw_bytes"] - self.stats["attached_bytes"]
+        return f"{text}, исходный размер: {self.stats['raw_bytes'] / 1024:.0f} КБ, сэкономлено: {saved / 1024:.0f} КБ"
+
+
+_screenshot_service: ScreenshotService | None = None
+
+
+def get_screenshot_service() -> ScreenshotService:
+    """
+    Возвращает сервис скриншотов процесса по секции [screenshots] config.ini.
+
+    :return: Экземпляр ScreenshotService.
+    """
+    global _screenshot_service
+    if _screenshot_service is None:
+        options = dict(
+            image_format=config_registry.get(category="screenshots", key="format", default="png").strip().lower(),
+            quality=config_registry.get_int(category="screenshots", key="quality", default=80),
+            max_width=config_registry.get_int(category="screenshots", key="max_width", default=0),
+            workers=config_registry.get_int(category="screenshots", key="workers", default=2),
+        )
+        try:
+            _screenshot_service = ScreenshotService(**options)
+        except ValueError as e:
+            logger.warning(f"{e}. Используется формат png.")
+            _screenshot_service = ScreenshotService(**{**options, "image_format": "png"})
+    return _screenshot_service
+
+
+def shutdown_screenshot_service() -> None:
+    """
+    Останавливает сервис скриншотов процесса, если он был создан (статистика сохраняется для сводки).
+    """
+    if _screenshot_service is not None:
+        _screenshot_service.shutdown()
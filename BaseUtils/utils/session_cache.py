@@ -0,0 +1,160 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.logger import logger
+
+
+@dataclass
+class SessionSnapshot:
+    """
+    Снимок авторизованной сессии для base_url.
+    """
+    cookies: list[dict]
+    local_storage: dict[str, str]
+    created_at: float
+    credentials_digest: str = ""  # Хэш пароля: снимок недействителен после смены учетных данных
+
+
+class SessionCache:
+    """
+    Кэш авторизованных сессий: вход через UI выполняется один раз на набор учетных данных,
+    далее cookies и localStorage восстанавливаются в новых браузерах.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """
+        :param ttl: Время жизни снимка сессии в секундах.
+        """
+        self.ttl = ttl
+        self._snapshots: dict[tuple[str, str], SessionSnapshot] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,  # Сессия восстановлена и принята сервером
+            "misses": 0,  # Снимка нет или он устарел - вход через UI
+            "rejected": 0,  # Снимок восстановлен, но сервер его не принял - вход через UI
+            "ui_logins": 0,
+            "ui_login_time": 0.0,  # Суммарное время входа через UI, сек
+            "restore_time": 0.0,  # Суммарное время восстановления сессий, сек
+        }
+
+    @staticmethod
+    def _credentials_digest(username: str, password: str) -> str:
+        return hashlib.blake2b(f"{username}\0{password}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, base_url: str, username: str, password: str) -> SessionSnapshot | None:
+        """
+        Возвращает актуальный снимок сессии или None
+        (снимок устарел или сохранен с другим паролем - он удаляется).
+        """
+        with self._lock:
+            snapshot = self._snapshots.get((base_url, username))
+            if snapshot and (
+                    time.monotonic() - snapshot.created_at > self.ttl
+                    or snapshot.credentials_digest != self._credentials_digest(username, password)
+            ):
+                del self._snapshots[(base_url, username)]
+                snapshot = None
+        return snapshot
+
+    def save(self, driver: WebDriver, base_url: str, username: str, password: str) -> None:
+        """
+        Сохраняет cookies и localStorage текущей страницы как снимок сессии.
+
+        :param driver: Экземпляр WebDriver с авторизованной сессией.
+        :param base_url: Базовый URL приложения.
+        :param username: Логин, под которым выполнен вход.
+        :param password: Пароль (в снимке хранится только его хэш).
+        """
+        try:
+            local_storage = driver.execute_script(
+                "var data = {};"
+                "for (var i = 0; i < window.localStorage.length; i++) {"
+                "    var key = window.localStorage.key(i);"
+                "    data[key] = window.localStorage.getItem(key);"
+                "}"
+                "return data;"
+            ) or {}
+            snapshot = SessionSnapshot(
+                cookies=driver.get_cookies(),
+                local_storage=local_storage,
+                created_at=time.monotonic(),
+                credentials_digest=self._credentials_digest(username, password)
+            )
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить снимок сессии: {e}")
+            return
+        with self._lock:
+            self._snapshots[(base_url, username)] = snapshot
+
+    def invalidate(self, base_url: str, username: str) -> None:
+        """
+        Удаляет снимок сессии (например, если сервер его отклонил).
+        """
+        with self._lock:
+            self._snapshots.pop((base_url, username), None)
+
+    @staticmethod
+    def restore(driver: WebDriver, base_url: str, snapshot: SessionSnapshot) -> None:
+        """
+        Восстанавливает снимок сессии в браузере: открывает base_url (cookies можно установить
+        только для текущего домена), добавляет cookies и localStorage и перезагружает страницу.
+
+        :param driver: Экземпляр WebDriver.
+        :param base_url: Базовый URL приложения.
+        :param snapshot: Снимок сессии.
+        """
+        driver.get(base_url)
+        driver.delete_all_cookies()
+        for cookie in snapshot.cookies:
+            cookie = dict(cookie)
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            driver.add_cookie(cookie)
+        if snapshot.local_storage:
+            driver.execute_script(
+                "var data = arguments[0];"
+                "for (var key in data) { window.localStorage.setItem(key, data[key]); }",
+                snapshot.local_storage
+            )
+        driver.refresh()
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка по кэшу сессий для вывода в конце сессии.
+        """
+        hits = self.stats["hits"]
+        attempts = hits + self.stats["misses"] + self.stats["rejected"]
+        hit_rate = hits / attempts * 100 if attempts else 0.0
+        ui_logins = self.stats["ui_logins"]
+        avg_ui_login = self.stats["ui_login_time"] / ui_logins if ui_logins else 0.0
+        avg_restore = self.stats["restore_time"] / hits if hits else 0.0
+        saved_time = max(0.0, hits * (avg_ui_login - avg_restore))
+        return (
+            f"Кэш сессий: попаданий: {hits} из {attempts} ({hit_rate:.0f}%), "
+            f"отклонено сервером: {self.stats['rejected']}, "
+            f"входов через UI: {ui_logins} (в среднем {avg_ui_login:.2f} сек), "
+            f"сэкономлено: ~{saved_time:.1f} сек"
+        )
+
+
+_session_cache: SessionCache | None = None
+
+
+def get_session_cache() -> SessionCache | None:
+    """
+    Возвращает кэш сессий процесса, если он включен в config.ini (секция [session cache]).
+
+    :return: Экземпляр SessionCache или None, если кэш выключен.
+    """
+    global _session_cache
+    if _session_cache is None:
+        if not config_registry.get_bool(category="session cache", key="enabled", default=False):
+            return None
+        ttl = config_registry.get_float(category="session cache", key="ttl", default=900.0)
+        _session_cache = SessionCache(ttl=ttl)
+    return _session_cache
@@ -1,11 +1,19 @@
+import re
+import threading
+import time
+import urllib.parse
+
 import allure
-from selenium.common.exceptions import NoSuchFrameException, TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchFrameException, StaleElementReferenceException, JavascriptException, WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from typing import Type
+from BaseUtils.utils.attachment_policy import attach_evidence
 from BaseUtils.utils.logger import logger
+from BaseUtils.utils.screenshot_service import get_screenshot_service
+from BaseUtils.utils.wait_engine import FIND_ELEMENT_JS
 
 # Карта типов локаторов для упрощения доступа по строковому ключу
 locator_map = {
@@ -17,41 +25,115 @@ locator_map = {
     "css": By.CSS_SELECTOR
 }
 
+# Проверка наличия элемента в текущем документе и список его дочерних фреймов - за один вызов на уровень.
+# Для отчета каждому фрейму сопоставляется XPath по его тегу: (//iframe)[n] или (//frame)[n] в порядке документа.
+PROBE_FRAME_JS = FIND_ELEMENT_JS + """
+var frames = Array.prototype.slice.call(document.querySelectorAll('iframe, frame'));
+var counters = {};
+return {
+    found: !!findElement(arguments[0], arguments[1]),
+    frames: frames,
+    labels: frames.map(function (frame) {
+        var tag = frame.tagName.toLowerCase();
+        counters[tag] = (counters[tag] || 0) + 1;
+        return '(//' + tag + ')[' + counters[tag] + ']';
+    })
+};
+"""
+
+# Корневой документ в отчетах о найденном пути к iframe
+ROOT_FRAME_LOCATOR = '//*[@id="mainDocument"]'
+
+
+def url_pattern(url: str) -> str:
+    """
+    Шаблон URL для кэша путей к фреймам: без query/fragment, числовые и UUID-сегменты пути заменены на {id},
+    чтобы страницы одного вида (например, карточки разных пользователей) использовали один путь.
+    """
+    parsed = urllib.parse.urlsplit(url)
+    segments = [
+        "{id}" if re.fullmatch(r"\d+|[0-9a-fA-F-]{32,36}", segment) else segment
+        for segment in parsed.path.split("/")
+    ]
+    return f"{parsed.scheme}://{parsed.netloc}{'/'.join(segments)}"
+
+
+class FramePathCache:
+    """
+    Кэш путей к фреймам: (шаблон URL, тип локатора, значение локатора) -> индексы фреймов на каждом уровне.
+    """
+
+    def __init__(self) -> None:
+        self._paths: dict[tuple[str, str, str], tuple[int, ...]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "frames_visited": 0, "search_time": 0.0}
+
+    def get(self, key: tuple[str, str, str]) -> tuple[int, ...] | None:
+        with self._lock:
+            return self._paths.get(key)
+
+    def save(self, key: tuple[str, str, str], path: tuple[int, ...]) -> None:
+        with self._lock:
+            self._paths[key] = path
+
+    def invalidate(self, key: tuple[str, str, str]) -> None:
+        with self._lock:
+            self._paths.pop(key, None)
+
+    def summary(self) -> str:
+        """
+        Текстовая сводка по поиску элементов во фреймах для вывода в конце сессии.
+        """
+        return (
+            f"Поиск во фреймах: путей из кэша: {self.stats['hits']}, полных поисков: {self.stats['misses']}, "
+            f"устаревших путей: {self.stats['stale']}, просмотрено фреймов: {self.stats['frames_visited']}, "
+            f"время поиска: {self.stats['search_time']:.2f} сек"
+        )
+
+
+frame_path_cache = FramePathCache()
+
 
 class SwitchIframeContext:
     def __init__(
             self,
             driver: WebDriver,
             locator_type: str,
-            locator_value: str
+            locator_value: str,
+            timeout: float = 4
     ) -> None:
+        """
+        :param driver: WebDriver для управления браузером.
+        :param locator_type: Тип локатора элемента.
+        :param locator_value: Значение локатора элемента.
+        :param timeout: Общее время ожидания появления элемента во фреймах страницы, сек.
+        """
         if locator_type not in locator_map:
             raise ValueError(f'Неверный тип локатора: "{locator_type}"')
         self.driver = driver
         self.locator_type = locator_type
         self.locator_value = locator_value
         self.locator = locator_map[locator_type]
+        self.timeout = timeout
         self.found_iframe_locator = None
+        self.frame_path: tuple[int, ...] | None = None
+        # XPath фреймов на каждом уровне найденного пути (для отчета)
+        self.frame_labels: list[str] = []
+        self.frames_visited = 0
 
     def __enter__(self) -> 'SwitchIframeContext':
         logger.info(
             f'Начало поиска элемента с локатором: "{self.locator_type}" \n'
             f'и значением: "{self.locator_value}" в iframe'
         )
-        self.found_iframe_locator = self._find_element_in_iframes(
-            driver=self.driver,
-            locator=self.locator,
-            locator_value=self.locator_value,
-            iframe_locator='//*[@id="mainDocument"]'
-        )
-        if not self.found_iframe_locator:
-            screenshot = self.driver.get_screenshot_as_png()
-            with allure.step("Скриншот во время ошибки"):
-                allure.attach(
-                    name="Screenshot",
-                    body=screenshot,
-                    attachment_type=allure.attachment_type.PNG
-                )
+        start_time = time.perf_counter()
+        self.frame_path, from_cache = self._find_frame_path()
+        elapsed = time.perf_counter() - start_time
+        frame_path_cache.stats["frames_visited"] += self.frames_visited
+        frame_path_cache.stats["search_time"] += elapsed
+
+        if self.frame_path is None:
+            get_screenshot_service().capture(self.driver, step_title="Скриншот во время ошибки")
             error = (
                 f"\n Ошибка при поиске элемента внутри <iframe> на странице. \n"
                 f"ВОЗМОЖНАЯ ПРИЧИНА: НЕВЕРНО УКАЗАННЫЙ <iframe> \n"
@@ -60,14 +142,21 @@ class SwitchIframeContext:
                 f'C локатором: "{self.locator_type}" \n'
                 f'B значением: "{self.locator_value}" \n'
                 f"НЕ НАЙДЕН НИ В ОДНОМ <iframe>.\n"
+                f"Просмотрено фреймов: {self.frames_visited}, время поиска: {elapsed:.2f} сек.\n"
             )
             logger.error(error)
             raise AssertionError(error)
-        logger.info(
+
+        self.found_iframe_locator = " -> ".join([ROOT_FRAME_LOCATOR, *self.frame_labels])
+        log = (
             f'Элемент с локатором: "{self.locator_type}" \n'
             f'и значением: "{self.locator_value}" \n'
-            f'НАЙДЕН'
+            f'НАЙДЕН в <iframe> с локатором: {self.found_iframe_locator} \n'
+            f'{"Путь из кэша" if from_cache else "Полный поиск"}: '
+            f'просмотрено фреймов: {self.frames_visited}, время поиска: {elapsed:.2f} сек.'
         )
+        logger.info(log)
+        attach_evidence(name="Поиск элемента во фреймах", body=log, attachment_type=allure.attachment_type.TEXT)
         return self
 
     def __exit__(
@@ -79,52 +168,95 @@ class SwitchIframeContext:
         self.driver.switch_to.default_content()
         logger.info("\n\n Переключение в обычный режим после работы с <iframe>.\n\n")
 
-    def _find_element_in_iframes(
-            self,
-            driver: WebDriver,
-            locator: By,
-            locator_value: str,
-            iframe_locator: str
-    ) -> str | None:
+    def _probe(self) -> dict:
+        """
+        Проверяет наличие элемента в текущем фрейме и возвращает его дочерние фреймы.
         """
-        Рекурсивный поиск элемента в iframes.
+        self.frames_visited += 1
+        return self.driver.execute_script(PROBE_FRAME_JS, self.locator, self.locator_value)
 
-        :param driver: WebDriver для управления браузером.
-        :param locator: Тип локатора.
-        :param locator_value: Значение локатора.
-        :param iframe_locator: Локатор текущего iframe для отчетности.
-        :return: Локатор iframe, если элемент найден, иначе None.
+    def _find_frame_path(self) -> tuple[tuple[int, ...] | None, bool]:
+        """
+        Поиск пути к фрейму с элементом: сначала проверяется путь из кэша, затем дерево фреймов
+        обходится целиком (повторно, пока не истечет таймаут - элемент может появиться позже).
+
+        :return: Путь (индексы фреймов на каждом уровне) или None и признак использования кэша.
         """
         try:
-            # Поиск элемента в текущем iframe
-            WebDriverWait(driver, 4).until(
-                EC.presence_of_element_located((self.locator, self.locator_value))
-            )
-            logger.info(f"Элемент НАЙДЕН в <iframe> с локатором: {iframe_locator}")
-            return iframe_locator
-        except TimeoutException:
+            key = (url_pattern(self.driver.current_url), self.locator_type, self.locator_value)
+        except WebDriverException:
+            key = None
+
+        cached_path = frame_path_cache.get(key) if key else None
+        if cached_path is not None:
+            if self._validate_path(cached_path):
+                frame_path_cache.stats["hits"] += 1
+                return cached_path, True
+            frame_path_cache.stats["stale"] += 1
+            frame_path_cache.invalidate(key)
+            logger.info(f"Сохраненный путь к <iframe> {cached_path} устарел, выполняется полный поиск")
+
+        frame_path_cache.stats["misses"] += 1
+        deadline = time.monotonic() + self.timeout
+        while True:
+            self.driver.switch_to.default_content()
+            self.frame_labels = []
+            path = self._search(())
+            if path is not None:
+                if key:
+                    frame_path_cache.save(key, path)
+                return path, False
+            if time.monotonic() >= deadline:
+                self.driver.switch_to.default_content()
+                return None, False
+            time.sleep(0.1)
+
+    def _validate_path(self, path: tuple[int, ...]) -> bool:
+        """
+        Переходит по сохраненному пути и проверяет, что элемент есть в конечном фрейме.
+        """
+        self.driver.switch_to.default_content()
+        self.frame_labels = []
+        try:
+            for index in path:
+                probe = self._probe()
+                if index >= len(probe["frames"]):
+                    return False
+                self.driver.switch_to.frame(probe["frames"][index])
+                self.frame_labels.append(probe["labels"][index])
+            if self._probe()["found"]:
+                return True
+        except (NoSuchFrameException, StaleElementReferenceException, JavascriptException):
             pass
+        self.driver.switch_to.default_content()
+        return False
 
-        # Поиск в каждом вложенном iframe
-        iframes = driver.find_elements(By.TAG_NAME, 'iframe')
-        for index, iframe in enumerate(iframes):
+    def _search(self, path: tuple[int, ...]) -> tuple[int, ...] | None:
+        """
+        Обход дерева фреймов в глубину из текущего фрейма, один скрипт на фрейм.
+        При успехе драйвер остается в найденном фрейме.
+
+        :param path: Путь к текущему фрейму.
+        :return: Путь к фрейму с элементом или None.
+        """
+        try:
+            probe = self._probe()
+        except JavascriptException as e:
+            logger.warning(f"Не удалось проверить <iframe> {path}: {e.msg}")
+            return None
+        if probe["found"]:
+            return path
+
+        for index, (frame, label) in enumerate(zip(probe["frames"], probe["labels"])):
             try:
-                logger.info(f'\n\nПереключение на <iframe> {index + 1} - с локатором: {locator_value}\n\n')
-                driver.switch_to.frame(iframe)
-                new_iframe_locator = f"{iframe_locator}//iframe[{index + 1}]"
-                result = self._find_element_in_iframes(driver, locator, locator_value, new_iframe_locator)
-                if result:
-                    return result
-                driver.switch_to.default_content()
+                self.driver.switch_to.frame(frame)
             except (NoSuchFrameException, StaleElementReferenceException):
-                screenshot = self.driver.get_screenshot_as_png()
-                with allure.step("Скриншот во время ошибки"):
-                    allure.attach(
-                        name="Screenshot",
-                        body=screenshot,
-                        attachment_type=allure.attachment_type.PNG
-                    )
-                logger.warning(f"Не удалось переключиться на <iframe> с src: {iframe.get_attribute('src')}")
-                driver.switch_to.default_content()
-
+                logger.warning(f"Не удалось переключиться на фрейм {label} {path + (index,)}")
+                continue
+            self.frame_labels.append(label)
+            result = self._search(path + (index,))
+            if result is not None:
+                return result
+            self.frame_labels.pop()
+            self.driver.switch_to.parent_frame()
         return None
@@ -1,57 +1,158 @@
+import time
+from typing import Type, Callable
+
 import allure
 from selenium.common.exceptions import NoSuchWindowException
 from selenium.webdriver.remote.webdriver import WebDriver
-from typing import Type, Optional
+from BaseUtils.utils.attachment_policy import attach_evidence
 from BaseUtils.utils.logger import logger
+from BaseUtils.utils.screenshot_service import get_screenshot_service
+
+# Статистика ожидания новых окон всех контекстов процесса
+window_stats = {"windows": 0, "timeouts": 0, "time_to_window": 0.0}
 
 
 class SwitchWindowContext:
-    def __init__(self, driver: WebDriver):
+    """
+    Контекст работы с новым окном (вкладкой) браузера.
+
+    Набор хэндлов окон запоминается до действия, открывающего окно, после чего новые окна ожидаются
+    до дедлайна по разнице наборов хэндлов. Действие можно передать в контекст (action), тогда
+    набор хэндлов запоминается непосредственно перед ним:
+
+        with SwitchWindowContext(driver, action=lambda: page.click_on_element("xpath", link)) as window:
+            ...
+
+    Без action новыми считаются все окна, кроме текущего (как раньше), но они тоже ожидаются до дедлайна.
+    """
+
+    def __init__(
+            self,
+            driver: WebDriver,
+            action: Callable[[], object] | None = None,
+            timeout: float = 5,
+            expected_windows: int = 1,
+            close_on_exit: bool = True
+    ):
+        """
+        :param driver: Экземпляр WebDriver.
+        :param action: Действие, открывающее новое окно (окна).
+        :param timeout: Максимальное время ожидания новых окон, сек.
+        :param expected_windows: Количество ожидаемых новых окон (несколько всплывающих окон одновременно).
+        :param close_on_exit: Закрывать новые окна при выходе из контекста.
+        """
         self.driver = driver
+        self.action = action
+        self.timeout = timeout
+        self.expected_windows = expected_windows
+        self.close_on_exit = close_on_exit
         self.main_window_handle = self.driver.current_window_handle
         self.new_window_handle = None
+        self.new_window_handles: list[str] = []
+        self.time_to_window: float | None = None
 
     def __enter__(self) -> 'SwitchWindowContext':
-        self.new_window_handle = self._find_new_window_handle()
-        if not self.new_window_handle:
+        known_handles = {self.main_window_handle}
+        if self.action is not None:
+            known_handles = set(self.driver.window_handles)
+            started_at = time.perf_counter()
+            self.action()
+        else:
+            started_at = time.perf_counter()
+
+        self.new_window_handles = self._wait_for_new_windows(known_handles, started_at)
+        if len(self.new_window_handles) < self.expected_windows:
+            window_stats["timeouts"] += 1
             self._take_screenshot()
-            raise AssertionError("Новое окно НЕ НАЙДЕНО.")
-        self.driver.switch_to.window(self.new_window_handle)
+            # __exit__ не вызывается при ошибке в __enter__: закрываем окна, которые успели открыться
+            self._close_new_windows()
+            raise AssertionError(
+                f"Новое окно НЕ НАЙДЕНО. Ожидалось новых окон: {self.expected_windows}, "
+                f"найдено: {len(self.new_window_handles)} за {self.timeout} сек."
+            )
+        window_stats["windows"] += len(self.new_window_handles)
+        window_stats["time_to_window"] += self.time_to_window
+        attach_evidence(
+            name="Открытие нового окна",
+            body=f"Новых окон: {len(self.new_window_handles)}, время до открытия: {self.time_to_window * 1000:.0f} мс",
+            attachment_type=allure.attachment_type.TEXT
+        )
+        self.switch_to(0)
         return self
 
     def __exit__(self, exc_type: Type[BaseException], exc_val: BaseException, exc_tb: Type) -> None:
-        if self.new_window_handle:
-            try:
-                if self.new_window_handle in self.driver.window_handles:
-                    self.driver.close()  # Закрыть новое окно
-                else:
-                    logger.warning("Целевое окно уже закрыто.")
-            except NoSuchWindowException:
-                logger.warning("Целевое окно уже закрыто.")
-        self.driver.switch_to.window(self.main_window_handle)
+        self._close_new_windows()
         logger.info("Выход из контекста окна, переключение в основное окно.")
 
-    def _find_new_window_handle(self) -> Optional[str]:
+    def _close_new_windows(self) -> None:
         """
-        Поиск хэндла нового окна.
+        Закрывает новые окна (если close_on_exit) и переключается в основное окно.
+        Перед закрытием драйвер всегда переключается на закрываемое окно: close() закрывает текущее.
+        """
+        if self.close_on_exit:
+            # Закрытие без предварительного запроса списка окон: уже закрытое окно пропускается
+            for handle in self.new_window_handles:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except NoSuchWindowException:
+                    logger.warning(f"Целевое окно {handle} уже закрыто.")
+            self.new_window_handle = None
+        self.driver.switch_to.window(self.main_window_handle)
+
+    def switch_to(self, index: int) -> str:
+        """
+        Переключение на новое окно по порядку открытия.
+
+        :param index: Порядковый номер нового окна (0 - первое открытое).
+        :return: Хэндл окна.
+        """
+        self.new_window_handle = self.new_window_handles[index]
+        self.driver.switch_to.window(self.new_window_handle)
+        return self.new_window_handle
 
-        :return: Хэндл нового окна, если найден, иначе None.
+    def _wait_for_new_windows(self, known_handles: set[str], started_at: float) -> list[str]:
         """
-        try:
-            all_window_handles = self.driver.window_handles
-            for handle in all_window_handles:
-                if handle != self.main_window_handle:
+        Ожидание новых окон до дедлайна по разнице наборов хэндлов.
+        Интервал между запросами растет от 50 до 250 мс, чтобы быстрые окна обнаруживались сразу.
+
+        :param known_handles: Хэндлы окон до действия.
+        :param started_at: Момент действия (time.perf_counter).
+        :return: Хэндлы новых окон в порядке открытия.
+        """
+        deadline = started_at + self.timeout
+        interval = 0.05
+        new_handles: list[str] = []
+        while True:
+            try:
+                handles = self.driver.window_handles
+            except NoSuchWindowException:
+                handles = []
+            for handle in handles:
+                if handle not in known_handles and handle not in new_handles:
+                    new_handles.append(handle)
                     logger.info(f"Новое окно НАЙДЕНО с хэндлом: {handle}")
-                    return handle
-        except NoSuchWindowException:
-            logger.warning("Не удалось найти новое окно.")
-        return None
+            now = time.perf_counter()
+            if len(new_handles) >= self.expected_windows:
+                self.time_to_window = now - started_at
+                return new_handles
+            if now >= deadline:
+                logger.warning("Не удалось найти новое окно.")
+                return new_handles
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * 1.5, 0.25)
 
     def _take_screenshot(self):
-        screenshot = self.driver.get_screenshot_as_png()
-        with allure.step("Скриншот во время ошибки"):
-            allure.attach(
-                name="Screenshot",
-                body=screenshot,
-                attachment_type=allure.attachment_type.PNG
-            )
+        get_screenshot_service().capture(self.driver, step_title="Скриншот во время ошибки")
+
+
+def windows_summary() -> str:
+    """
+    Текстовая сводка по ожиданию новых окон для вывода в конце сессии.
+    """
+    windows = window_stats["windows"]
+    average = window_stats["time_to_window"] / windows * 1000 if windows else 0.0
+    return (
+        f"Новые окна: открыто: {windows}, среднее время до открытия: {average:.0f} мс, "
+        f"не дождались: {window_stats['timeouts']}"
+    )
@@ -0,0 +1,64 @@
+"""
+Плагин pytest для записи длительности каждого теста.
+
+Подключается воркерами параллельного запуска через "-p BaseUtils.utils.test_timings".
+Длительности (setup + call + teardown) сохраняются в JSON-файл, путь к которому
+передается через переменную окружения TEST_DURATIONS_FILE.
+"""
+import json
+import os
+
+DURATIONS_FILE_ENV = "TEST_DURATIONS_FILE"
+
+_durations: dict[str, float] = {}
+
+
+def pytest_runtest_logreport(report) -> None:
+    """
+    Суммирует длительность всех фаз теста.
+    """
+    _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + report.duration
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    """
+    Сохраняет длительности тестов в файл по окончании сессии.
+    """
+    durations_file = os.environ.get(DURATIONS_FILE_ENV)
+    if not durations_file or not _durations:
+        return
+    with open(durations_file, "w", encoding="utf-8") as file:
+        json.dump(_durations, file, ensure_ascii=False, indent=2)
+
+
+def load_durations(path: str) -> dict[str, float]:
+    """
+    Читает длительности тестов из JSON-файла.
+
+    :param path: Путь к файлу.
+    :return: Словарь nodeid -> длительность в секундах (пустой, если файла нет или он поврежден).
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return {nodeid: float(duration) for nodeid, duration in json.load(file).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def update_history(history_path: str, new_durations: dict[str, float], smoothing: float = 0.5) -> None:
+    """
+    Обновляет историю длительностей тестов, сглаживая новые значения с предыдущими,
+    чтобы единичный "медленный" прогон не ломал планирование.
+
+    :param history_path: Путь к файлу истории.
+    :param new_durations: Длительности последнего запуска.
+    :param smoothing: Вес нового значения (0..1).
+    """
+    history = load_durations(history_path)
+    for nodeid, duration in new_durations.items():
+        previous = history.get(nodeid)
+        history[nodeid] = duration if previous is None else smoothing * duration + (1 - smoothing) * previous
+    tmp_path = f"{history_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(history, file, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, history_path)
@@ -0,0 +1,400 @@
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Tuple
+
+from selenium.common.exceptions import (
+    TimeoutException,
+    InvalidSessionIdException,
+    JavascriptException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    UnknownMethodException,
+    WebDriverException,
+)
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from BaseUtils.configurations.config_reader import config_registry
+from BaseUtils.utils.logger import logger
+
+# Поиск элемента по локатору Selenium (By.*) на стороне браузера.
+# Используется всеми скриптами, которым нужен элемент по паре (тип локатора, значение).
+FIND_ELEMENT_JS = """
+function findElement(by, value, root) {
+    root = root || document;
+    switch (by) {
+        case 'xpath':
+            return document.evaluate(value, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'css selector':
+            return root.querySelector(value);
+        case 'id':
+            return root.querySelector('[id="' + value.replace(/"/g, '\\\\"') + '"]');
+        case 'name':
+            return root.querySelector('[name="' + value.replace(/"/g, '\\\\"') + '"]');
+        case 'class name':
+            return root.getElementsByClassName(value)[0] || null;
+        case 'tag name':
+            return root.getElementsByTagName(value)[0] || null;
+        case 'link text':
+        case 'partial link text':
+            var links = root.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = (links[i].innerText || links[i].textContent || '').trim();
+                if (by === 'link text' ? text === value : text.indexOf(value) !== -1) {
+                    return links[i];
+                }
+            }
+            return null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+"""
+
+# Проверка составного условия над элементом за один вызов.
+# Режимы:
+#   visible    - элемент есть в DOM и видим;
+#   enabled    - видим и доступен (не disabled);
+#   clickable  - доступен и не перекрыт другим элементом в точке центра;
+#   value_text - атрибут value содержит ожидаемый текст.
+# Возвращает {state, element, value}, где state == 'ok' при выполнении условия,
+# иначе - причина невыполнения (missing, hidden, disabled, covered, text).
+ELEMENT_CONDITION_JS = FIND_ELEMENT_JS + """
+function isVisible(el) {
+    if (!el.isConnected || el.getClientRects().length === 0) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse' || style.opacity === '0') {
+        return false;
+    }
+    var rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+function isCovered(el) {
+    var rect = el.getBoundingClientRect();
+    var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+    if (x < 0 || y < 0 || x > window.innerWidth || y > window.innerHeight) {
+        return false;  // Вне видимой области - перекрытие определит прокрутка перед кликом
+    }
+    var top = document.elementFromPoint(x, y);
+    return !!top && top !== el && !el.contains(top) && !(top.control && top.control === el);
+}
+function checkCondition(by, value, mode, expectedText) {
+    var el = findElement(by, value);
+    if (!el) {
+        return {state: 'missing', element: null, value: null};
+    }
+    var result = {state: 'ok', element: el, value: el.value === undefined ? null : String(el.value)};
+    if (mode === 'value_text') {
+        if (result.value === null || result.value.indexOf(expectedText) === -1) {
+            result.state = 'text';
+        }
+        return result;
+    }
+    if (!isVisible(el)) {
+        result.state = 'hidden';
+    } else if (mode !== 'visible' && (el.disabled || el.getAttribute('aria-disabled') === 'true')) {
+        result.state = 'disabled';
+    } else if (mode === 'clickable' && isCovered(el)) {
+        result.state = 'covered';
+    }
+    return result;
+}
+"""
+
+# Ожидание условия внутри браузера за один вызов execute_async_script.
+# Условие проверяется сразу, затем при каждом изменении DOM (MutationObserver) и на каждом кадре
+# (requestAnimationFrame - для изменений стилей и анимаций, не порождающих мутаций).
+# Таймер setTimeout завершает ожидание по дедлайну, даже если кадры не отрисовываются (фоновая вкладка).
+OBSERVER_WAIT_JS = ELEMENT_CONDITION_JS + """
+var by = arguments[0], value = arguments[1], mode = arguments[2], expectedText = arguments[3];
+var timeoutMs = arguments[4], done = arguments[arguments.length - 1];
+var finished = false, polls = 0, observer = null, timer = null, scheduled = false;
+var last = {state: 'missing', element: null, value: null};
+
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    clearTimeout(timer);
+    result.polls = polls;
+    done(result);
+}
+function check() {
+    if (finished) {
+        return true;
+    }
+    polls++;
+    try {
+        last = checkCondition(by, value, mode, expectedText);
+    } catch (e) {
+        finish({state: 'error', element: null, value: null, error: String(e)});
+        return true;
+    }
+    if (last.state === 'ok') {
+        finish(last);
+        return true;
+    }
+    return false;
+}
+function onFrame() {
+    if (!check()) {
+        requestAnimationFrame(onFrame);
+    }
+}
+
+if (!check()) {
+    observer = new MutationObserver(function () {
+        // Несколько мутаций подряд схлопываются в одну проверку
+        if (!scheduled) {
+            scheduled = true;
+            Promise.resolve().then(function () { scheduled = false; check(); });
+        }
+    });
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    timer = setTimeout(function () { finish(last); }, timeoutMs);
+    requestAnimationFrame(onFrame);
+}
+"""
+
+# Описание причин невыполнения условия для сообщений об ошибках
+STATE_DESCRIPTIONS = {
+    "missing": "элемент НЕ НАЙДЕН в DOM",
+    "hidden": "элемент НЕ ВИДИМ",
+    "disabled": "элемент НЕДОСТУПЕН (disabled)",
+    "covered": "элемент ПЕРЕКРЫТ другим элементом",
+    "text": "ожидаемый текст НЕ ПОЯВИЛСЯ",
+    "error": "ошибка выполнения проверки",
+}
+
+
+@dataclass
+class WaitResult:
+    """
+    Результат ожидания условия.
+    """
+    element: object | None
+    value: str | None
+    elapsed: float
+    polls: int
+    state: str = "ok"
+    errors: list[str] = field(default_factory=list)
+
+
+class WaitTimeoutError(TimeoutException):
+    """
+    Таймаут ожидания составного условия. Содержит итог ожидания: затраченное время,
+    количество опросов и последнюю причину невыполнения условия.
+    """
+
+    def __init__(self, result: WaitResult, locator: Tuple[str, str], mode: str) -> None:
+        self.result = result
+        reason = STATE_DESCRIPTIONS.get(result.state, result.state)
+        message = (
+            f'Условие "{mode}" для элемента с локатором: "{locator[0]}" и значением: "{locator[1]}" '
+            f"НЕ ВЫПОЛНЕНО: {reason}. "
+            f"Время ожидания: {result.elapsed:.2f} сек, опросов: {result.polls}"
+        )
+        if result.errors:
+            message += f". Последняя ошибка: {result.errors[-1]}"
+        super().__init__(message)
+
+
+class PollingWaitBackend:
+    """
+    Ожидание составного условия с единым дедлайном и адаптивным интервалом опроса:
+    первые проверки выполняются часто (элемент обычно появляется быстро),
+    затем интервал растет, чтобы не перегружать драйвер.
+    """
+
+    def __init__(
+            self,
+            initial_interval: float = 0.05,
+            max_interval: float = 0.5,
+            backoff: float = 1.5
+    ) -> None:
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+    def wait(
+            self,
+            driver: WebDriver,
+            locator: Tuple[str, str],
+            mode: str,
+            timeout: float,
+            expected_text: str | None = None
+    ) -> WaitResult:
+        """
+        Ожидает выполнения условия до дедлайна.
+
+        :param driver: Экземпляр WebDriver.
+        :param locator: Кортеж (By.*, значение локатора).
+        :param mode: Режим условия (visible, enabled, clickable, value_text).
+        :param timeout: Общее время ожидания в секундах.
+        :param expected_text: Ожидаемый текст для режима value_text.
+        :return: Результат ожидания.
+        :raises WaitTimeoutError: Если условие не выполнено до дедлайна.
+        """
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        interval = self.initial_interval
+        result = WaitResult(element=None, value=None, elapsed=0.0, polls=0, state="missing")
+
+        while True:
+            result.polls += 1
+            try:
+                state = driver.execute_script(
+                    ELEMENT_CONDITION_JS + "return checkCondition(arguments[0], arguments[1], arguments[2], arguments[3]);",
+                    locator[0], locator[1], mode, expected_text
+                )
+                result.state = state["state"]
+                if result.state == "ok":
+                    result.element = state["element"]
+                    result.value = state["value"]
+                    result.elapsed = time.monotonic() - start_time
+                    return result
+            except (JavascriptException, StaleElementReferenceException) as e:
+                # Страница могла перезагрузиться во время проверки - повторяем до дедлайна
+                result.state = "error"
+                result.errors.append(str(e).strip())
+
+            now = time.monotonic()
+            if now >= deadline:
+                result.elapsed = now - start_time
+                raise WaitTimeoutError(result, locator, mode)
+            time.sleep(min(interval, deadline - now))
+            interval = min(interval * self.backoff, self.max_interval)
+
+
+class ObserverWaitBackend:
+    """
+    Ожидание составного условия внутри браузера (MutationObserver + requestAnimationFrame)
+    за один вызов execute_async_script: ответ приходит в момент выполнения условия,
+    без периодических HTTP-запросов к драйверу.
+
+    Если асинхронные скрипты в браузере работают некорректно, драйвер помечается
+    и дальнейшие ожидания для него выполняются через PollingWaitBackend.
+    """
+
+    # Запас времени сверх таймаута ожидания для script timeout драйвера, сек
+    SCRIPT_TIMEOUT_MARGIN = 2.0
+
+    def __init__(self, fallback: PollingWaitBackend | None = None) -> None:
+        self.fallback = fallback or PollingWaitBackend()
+        self._script_timeouts: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._unsupported: weakref.WeakSet = weakref.WeakSet()
+
+    def wait(
+            self,
+            driver: WebDriver,
+            locator: Tuple[str, str],
+            mode: str,
+            timeout: float,
+            expected_text: str | None = None
+    ) -> WaitResult:
+        """
+        Ожидает выполнения условия до дедлайна.
+
+        :param driver: Экземпляр WebDriver.
+        :param locator: Кортеж (By.*, значение локатора).
+        :param mode: Режим условия (visible, enabled, clickable, value_text).
+        :param timeout: Общее время ожидания в секундах.
+        :param expected_text: Ожидаемый текст для режима value_text.
+        :return: Результат ожидания.
+        :raises WaitTimeoutError: Если условие не выполнено до дедлайна.
+        """
+        if driver in self._unsupported:
+            return self.fallback.wait(driver, locator, mode, timeout, expected_text)
+
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        result = WaitResult(element=None, value=None, elapsed=0.0, polls=0, state="missing")
+
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                self._ensure_script_timeout(driver, remaining)
+                state = driver.execute_async_script(
+                    OBSERVER_WAIT_JS, locator[0], locator[1], mode, expected_text, max(0, int(remaining * 1000))
+                )
+                result.polls += state.get("polls", 0)
+                result.state = state["state"]
+                if result.state == "ok":
+                    result.element = state["element"]
+                    result.value = state["value"]
+                    result.elapsed = time.monotonic() - start_time
+                    return result
+                if result.state == "error":
+                    result.errors.append(state.get("error", ""))
+                    time.sleep(0.05)
+            except (JavascriptException, StaleElementReferenceException) as e:
+                # Документ выгружен во время ожидания (навигация) - ждем на новой странице
+                result.state = "error"
+                result.errors.append(str(e).strip())
+                time.sleep(0.05)
+            except TimeoutException as e:
+                # Скрипт не вернул результат за script timeout (медленная страница или timeout изменен извне):
+                # timeout будет установлен заново, ожидание продолжается до дедлайна
+                self._script_timeouts.pop(driver, None)
+                result.state = "error"
+                result.errors.append(str(e).strip())
+                time.sleep(0.05)
+            except (InvalidSessionIdException, NoSuchWindowException):
+                raise  # Сессия или окно закрыты - опрос из Python тоже не поможет
+            except WebDriverException as e:
+                if self._is_async_unsupported(e):
+                    logger.warning(
+                        f"Асинхронное ожидание в браузере не поддерживается, переход на опрос из Python: {e}"
+                    )
+                    self._unsupported.add(driver)
+                else:
+                    logger.warning(f"Ошибка асинхронного ожидания, это ожидание выполняется опросом из Python: {e}")
+                return self.fallback.wait(driver, locator, mode, max(0.0, deadline - time.monotonic()), expected_text)
+
+            if time.monotonic() >= deadline:
+                result.elapsed = time.monotonic() - start_time
+                raise WaitTimeoutError(result, locator, mode)
+
+    @staticmethod
+    def _is_async_unsupported(error: WebDriverException) -> bool:
+        """
+        Драйвер не поддерживает execute_async_script (команда неизвестна или не реализована).
+        """
+        if isinstance(error, UnknownMethodException):
+            return True
+        message = (error.msg or "").lower()
+        return any(marker in message for marker in ("unknown command", "not implemented", "unsupported operation"))
+
+    def _ensure_script_timeout(self, driver: WebDriver, wait_timeout: float) -> None:
+        """
+        Увеличивает script timeout драйвера, если он меньше требуемого для ожидания.
+        """
+        required = wait_timeout + self.SCRIPT_TIMEOUT_MARGIN
+        if self._script_timeouts.get(driver, 0.0) < required:
+            driver.set_script_timeout(required)
+            self._script_timeouts[driver] = required
+
+
+_wait_backend: PollingWaitBackend | ObserverWaitBackend | None = None
+
+
+def create_wait_backend() -> PollingWaitBackend | ObserverWaitBackend:
+    """
+    Возвращает общий для процесса механизм ожидания по настройке [waits] backend из config.ini.
+    Общий экземпляр нужен, чтобы отметка о неподдерживаемых асинхронных скриптах
+    действовала для всех объектов страниц одного драйвера.
+
+    :return: ObserverWaitBackend (observer) или PollingWaitBackend (polling).
+    """
+    global _wait_backend
+    if _wait_backend is None:
+        backend = config_registry.get(category="waits", key="backend", default="polling").strip().lower()
+        _wait_backend = ObserverWaitBackend() if backend == "observer" else PollingWaitBackend()
+    return _wait_backend
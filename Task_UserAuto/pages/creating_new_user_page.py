@@ -12,6 +12,7 @@ if project_root not in sys.path:
 from BaseUtils.configurations.config_reader import read_configuration
 from BaseUtils.pages.base_page import BasePage
 from BaseUtils.pages.login_page import LoginPage
+from BaseUtils.pages.page_context import PageContext, LazyPage
 from selenium.webdriver.remote.webdriver import WebDriver
 from BaseUtils.utils.file_upload_page import FileUploadPage
 
@@ -19,16 +20,20 @@ from BaseUtils.utils.file_upload_page import FileUploadPage
 class CreatingUser(BasePage):
     """
     Класс для работы со страницей "Пользователя".
+    Вложенные страницы создаются при первом обращении и используют общий контекст драйвера.
     """
 
-    def __init__(self, driver: WebDriver) -> None:
+    __slots__ = ("_login_page", "_file_upload_page")
+
+    login_page = LazyPage(LoginPage)
+    file_upload_page = LazyPage(lambda context: FileUploadPage(context, project_dir="Task_UserAuto"))
+
+    def __init__(self, driver: WebDriver | PageContext) -> None:
         """
         Инициализация страницы проверки карточки развития.
-        :param driver: WebDriver - объект веб-драйвера для взаимодействия с браузером.
+        :param driver: WebDriver | PageContext - объект веб-драйвера или общий контекст страниц.
         """
         super().__init__(driver)
-        self.login_page = LoginPage(driver=driver)
-        self.file_upload_page = FileUploadPage(driver=driver, project_dir="Task_UserAuto")
 
     @allure.step('Открытие страницы "Пользователи"')
     def open_ku_settings_page(self) -> None:
@@ -77,13 +82,17 @@ class CreatingUser(BasePage):
             'ИНН': '//td[@data-field="inn"]/*'
         }
 
-        # Вводим параметры в каждое поле
-        for field, locator in text_params_locators.items():
-            self.type_into_element(
-                locator_type="xpath",
-                locator_value=locator,
-                text_to_enter=text_params_for_creating_user.get(field)  # Вытягиваем значение по ключу
-            )
+        # Поля дат заполняются настоящим вводом с клавиатуры: value у <input type="date"> ожидает формат ISO
+        keystroke_params = ('дата', 'начал_работать')
+
+        # Вводим параметры во все поля за несколько вызовов
+        self.fill_form(
+            fields={
+                ("xpath", locator): text_params_for_creating_user.get(field)  # Вытягиваем значение по ключу
+                for field, locator in text_params_locators.items()
+            },
+            keystroke_fields=[("xpath", text_params_locators[field]) for field in keystroke_params]
+        )
 
         # Получаем значения для `email`, `имя`, и `дата` из text_params_for_creating_user
         email_full_name_author_data: dict[str] = {
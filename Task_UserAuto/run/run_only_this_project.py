@@ -1,6 +1,17 @@
 #!/usr/bin/env python3
 
+import argparse
+import os
+import platform
 import subprocess
+import sys
+
+# Получаем абсолютный путь к корневой директории проекта
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.parallel_runner import get_workers_count, run_parallel
 
 
 def run_command(command: list[str]) -> bool:
@@ -14,7 +25,8 @@ def run_command(command: list[str]) -> bool:
         bool: True, если команда выполнена успешно, False в противном случае.
     """
     try:
-        subprocess.run(command, shell=True)
+        # Оболочка нужна на Windows для запуска allure.bat; на Unix список аргументов передается напрямую
+        subprocess.run(command, shell=platform.system() == "Windows", check=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"The command {e.cmd} failed.")
@@ -23,13 +35,33 @@ def run_command(command: list[str]) -> bool:
         return False
 
 
+def parse_args() -> tuple[argparse.Namespace, list[str]]:
+    """
+    Разбор аргументов командной строки. Неизвестные аргументы передаются в pytest.
+    """
+    parser = argparse.ArgumentParser(description="Запуск автотестов проекта с формированием отчета Allure")
+    parser.add_argument(
+        "--workers", "-n",
+        type=int,
+        default=None,
+        help="Количество параллельных воркеров (по умолчанию из config.ini или по количеству CPU)"
+    )
+    return parser.parse_known_args()
+
+
 if __name__ == "__main__":
-    # Команда 1: Запуск pytest для создания отчета Allure
-    if not run_command(["python", "-m", "pytest", "--alluredir=./report"]):
-        print("pytest failed.")
-        exit(1)  # Если ловим ошибку, завершаем с кодом 1 (ошибка)
+    args, pytest_args = parse_args()
 
-    # Команда 2: Генерация отчета Allure
+    # Команда 1: Параллельный запуск pytest для создания отчета Allure
+    exit_code = run_parallel(
+        workers=get_workers_count(args.workers),
+        report_dir="./report",
+        pytest_args=pytest_args,
+    )
+    if exit_code != 0:
+        print(f"pytest failed with exit code {exit_code}.")
+
+    # Команда 2: Генерация отчета Allure (формируется и при упавших тестах)
     if not run_command(["allure", "generate", "--clean", "./report", "-o", "allure-report"]):
         print("Error generating the Allure report.")
         exit(1)  # Если ловим ошибку, завершаем с кодом 1 (ошибка)
@@ -44,4 +76,7 @@ if __name__ == "__main__":
         print("Error combining the Allure reports.")
         exit(1)  # Если ловим ошибку, завершаем с кодом 1 (ошибка)
 
+    if exit_code != 0:
+        exit(exit_code)  # Отчет сформирован, но тесты упали - возвращаем общий код pytest
+
     print("All commands executed successfully.")
@@ -12,8 +12,49 @@ if project_root not in sys.path:
 
 from Task_UserAuto.pages.creating_new_user_page import CreatingUser
 from BaseUtils.configurations.config_reader import read_configuration
-from BaseUtils.environment.environment import before_scenario, after_scenario
+from BaseUtils.environment.environment import before_scenario, after_scenario, get_driver_pool
+from BaseUtils.environment.driver_resolver import driver_resolver
 from BaseUtils.pages.login_page import LoginPage
+from BaseUtils.utils.attachment_policy import get_attachment_policy
+from BaseUtils.utils.download_cache import get_download_cache
+from BaseUtils.utils.http_client import http_summary
+from BaseUtils.utils.link_checker import close_link_checker
+from BaseUtils.utils.screenshot_service import get_screenshot_service
+from BaseUtils.utils.session_cache import get_session_cache
+from BaseUtils.utils.switch_iframe_context import frame_path_cache
+from BaseUtils.utils.switch_window_context import windows_summary
+
+
+def pytest_configure(config) -> None:
+    """
+    Подключение плагинов: вложения отчета Allure и параметризация тестов строками Excel (маркер excel_data).
+    """
+    config.pluginmanager.import_plugin("BaseUtils.utils.report_plugin")
+    config.pluginmanager.import_plugin("BaseUtils.utils.excel_params")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def driver_pool():
+    """
+    Фикстура уровня сессии для пула "тёплых" браузеров (если он включен в config.ini).
+    По окончании сессии закрывает все браузеры пула.
+
+    Возвращает:
+        DriverPool | None: Пул браузеров или None, если пул выключен.
+    """
+    pool = get_driver_pool()
+    yield pool
+    if pool is not None:
+        pool.close_all()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def link_checker_connections():
+    """
+    Фикстура уровня сессии: по окончании сессии закрывает соединения проверки ссылок.
+    """
+    yield
+    close_link_checker()
 
 
 @pytest.fixture(scope="function")
@@ -35,6 +76,7 @@ def driver() -> WebDriver:
 def authenticated_driver(driver, login_page):
     """
     Фикстура для аутентификации драйвера с использованием учетных данных.
+    Сессия восстанавливается из кэша (если он включен), вход через UI - только при необходимости.
     После успешной аутентификации предоставляет экземпляр аутентифицированного WebDriver.
 
     Аргументы:
@@ -52,7 +94,7 @@ def authenticated_driver(driver, login_page):
         category="credentials",
         key="password",
     )
-    login_page.login(username, password)
+    login_page.login_with_session_cache(username, password)
     yield driver
 
 
@@ -82,3 +124,29 @@ def creating_new_user_page(authenticated_driver) -> CreatingUser:
         CreateNewBookPage: Экземпляр CreatingUser.
     """
     return CreatingUser(authenticated_driver)
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """
+    Вывод статистики инфраструктуры тестов в конце сессии.
+    """
+    terminalreporter.write_sep("-", "Статистика запуска")
+    terminalreporter.write_line(driver_resolver.summary())
+    terminalreporter.write_line(get_attachment_policy().summary())
+    terminalreporter.write_line(get_screenshot_service().summary())
+    terminalreporter.write_line(http_summary())
+    terminalreporter.write_line(frame_path_cache.summary())
+    terminalreporter.write_line(windows_summary())
+    pool = get_driver_pool()
+    if pool is not None:
+        terminalreporter.write_line(pool.summary())
+    download_cache = get_download_cache()
+    if download_cache is not None:
+        terminalreporter.write_line(download_cache.summary())
+    # Импорт после регистрации плагина в pytest_configure: модуль плагина загружает pytest (с перезаписью assert)
+    from BaseUtils.utils.excel_params import excel_data_stats, excel_data_summary
+    if excel_data_stats["sheets"]:
+        terminalreporter.write_line(excel_data_summary())
+    session_cache = get_session_cache()
+    if session_cache is not None:
+        terminalreporter.write_line(session_cache.summary())
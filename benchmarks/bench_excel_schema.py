@@ -0,0 +1,157 @@
+"""
+Бенчмарк преобразования строк Excel по схеме столбцов.
+
+На синтетической книге из 100 000 строк сравнивает с исходной реализацией чтения (LegacyExcelReader -
+копия get_data из версии репозитория до изменений: полная загрузка книги, _process_cell_value для каждой
+ячейки, словарь строки собирается поячеечно):
+    - преобразование уже прочитанных строк в словари: исходный цикл get_data и путь чтения ExcelReader
+      (iter_data -> _open_sheet, _process_rows, _to_dicts) без схемы и со схемой; строки подаются
+      листом из памяти (PreReadExcelReader), поэтому разбор XML в измерение не входит;
+    - полное чтение файла: исходный get_data и ExcelReader (read-only, без кэша на диске) без схемы и со схемой.
+
+Результат (Python 3.12, 100 000 строк, три запуска): путь ExcelReader медленнее исходного цикла
+на ~1 мкс на строку (исходный ~2.5-2.7 мкс, ExcelReader ~3.0-3.6 мкс без схемы и со схемой;
+разница между ними в пределах разброса) - это стоимость генераторов и промежуточного кортежа строки,
+хотя схема дополнительно разбирает даты и проверяет типы. Полное чтение определяется разбором XML
+в openpyxl (~95-120 мкс на строку): read-only ExcelReader читает файл быстрее исходной полной загрузки
+книги (9.5-9.9 против 12.2 сек), а 0.1 сек на преобразование теряется на этом фоне. Схема ускоряет
+не чтение, а обнаружение ошибок в данных (строка и столбец) и дает типизированные значения;
+повторное чтение ускоряет кэш на диске.
+
+Запуск: python benchmarks/bench_excel_schema.py [количество строк]
+"""
+import datetime
+import os
+import sys
+import tempfile
+import time
+import timeit
+from types import SimpleNamespace
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+import openpyxl
+
+from BaseUtils.utils.excel_reader import ExcelReader
+from BaseUtils.utils.logger import logger
+
+HEADERS = ("id", "login", "roles", "links", "created")
+SCHEMA = {"id": "int", "login": "str", "roles": "list", "links": "url_list", "created": "date"}
+
+
+def build_rows(count: int) -> list[tuple]:
+    start = datetime.date(2024, 1, 1)
+    return [
+        (
+            index,
+            f"user_{index}",
+            "admin;editor" if index % 3 == 0 else "viewer",
+            f"https://example.com/users/{index};https://example.com/files/{index}",
+            (start + datetime.timedelta(days=index % 365)).strftime("%Y-%m-%d"),
+        )
+        for index in range(count)
+    ]
+
+
+def write_workbook(path: str, rows: list[tuple]) -> None:
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet("Data")
+    sheet.append(HEADERS)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+class LegacyExcelReader:
+    """
+    ExcelReader до перехода на потоковое чтение и схемы (копия get_data из исходной версии репозитория):
+    книга загружается целиком (не read-only), каждая ячейка строки проходит через _process_cell_value,
+    словарь строки собирается поячеечно.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.workbook = openpyxl.load_workbook(file_path)
+
+    def get_data(self, sheet_name: str | None = None) -> list[dict]:
+        sheet = self.workbook[sheet_name] if sheet_name else self.workbook.worksheets[0]
+        headers = [cell.value for cell in sheet[1]]
+        return convert_legacy(headers, sheet.iter_rows(min_row=2, values_only=True))
+
+
+def convert_legacy(headers: list, rows) -> list[dict]:
+    data = []
+    for row in rows:
+        if all(cell is None for cell in row):
+            continue
+        row_data = {}
+        for col_index, cell_value in enumerate(row):
+            header = headers[col_index]
+            row_data[header] = ExcelReader._process_cell_value(cell_value)
+        data.append(row_data)
+    return data
+
+
+class PreReadSheet:
+    """
+    Лист с уже прочитанными строками (первая - заголовки): iter_rows отдает их без разбора XML.
+    """
+    title = "Data"
+
+    def __init__(self, rows: list[tuple]) -> None:
+        self.rows = rows
+
+    def iter_rows(self, values_only: bool = True):
+        return iter(self.rows)
+
+
+class PreReadExcelReader(ExcelReader):
+    """
+    ExcelReader, книга которого - лист с прочитанными строками: iter_data проходит путь чтения ExcelReader
+    (_open_sheet, _process_rows, _to_dicts) без openpyxl.
+    """
+
+    def __init__(self, rows: list[tuple], schema: dict | None) -> None:
+        super().__init__("", "bench.xlsx", read_only=False, use_cache=False, schema=schema)
+        self.sheet = PreReadSheet([HEADERS] + rows)
+
+    @property
+    def workbook(self):
+        return SimpleNamespace(worksheets=[self.sheet])
+
+
+def convert_reader(rows: list[tuple], schema: dict | None) -> list[dict]:
+    return list(PreReadExcelReader(rows, schema).iter_data())
+
+
+def read_file(project_dir: str, schema: dict | None) -> int:
+    reader = ExcelReader(project_dir, "bench.xlsx", read_only=True, use_cache=False, schema=schema)
+    return sum(1 for _ in reader.iter_data())
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    logger.remove()  # Вывод логов не относится к измерению
+    rows = build_rows(count)
+    with tempfile.TemporaryDirectory() as project_dir:
+        os.makedirs(os.path.join(project_dir, "credentials"))
+        write_workbook(os.path.join(project_dir, "credentials", "bench.xlsx"), rows)
+
+        print(f"Преобразование {count} прочитанных строк в словари:")
+        assert convert_reader(rows, None) == convert_legacy(list(HEADERS), rows)
+        for title, convert in (("Исходный get_data", lambda: convert_legacy(list(HEADERS), rows)),
+                               ("ExcelReader без схемы", lambda: convert_reader(rows, None)),
+                               ("ExcelReader со схемой", lambda: convert_reader(rows, SCHEMA))):
+            total = min(timeit.repeat(convert, number=1, repeat=5))
+            print(f"  {title}: {total:.3f} сек ({total / count * 1e6:.2f} мкс на строку)")
+
+        print(f"Полное чтение файла ({count} строк, без кэша):")
+        started_at = time.perf_counter()
+        read_count = len(LegacyExcelReader(os.path.join(project_dir, "credentials", "bench.xlsx")).get_data())
+        print(f"  Исходный get_data (полная загрузка книги): {time.perf_counter() - started_at:.3f} сек, "
+              f"строк: {read_count}")
+        for title, schema in (("ExcelReader без схемы (read-only)", None), ("ExcelReader со схемой (read-only)", SCHEMA)):
+            started_at = time.perf_counter()
+            read_count = read_file(project_dir, schema)
+            print(f"  {title}: {time.perf_counter() - started_at:.3f} сек, строк: {read_count}")
@@ -0,0 +1,90 @@
+"""
+Бенчмарк количества команд WebDriver при заполнении формы.
+
+Сравнивает на формах из 5, 10 и 20 полей:
+    - исходный поэлементный ввод (LegacyFormFiller - копия type_into_element и ожидания видимости
+      из версии репозитория до изменений): current_url, ожидание WebDriverWait (поиск + isDisplayed),
+      повторный поиск элемента, очистка скриптом и send_keys на каждое поле;
+    - BasePage.fill_form: ожидание первого поля, один скрипт заполнения и один скрипт чтения значений.
+
+Команды считаются CommandCounter на драйвере без браузера (BaseUtils/tests/fake_webdriver.py): настоящий
+selenium WebDriver, команды которого обрабатывает FakeFormBrowser. Время измеряется с задержкой ответа
+на каждую команду (по умолчанию 2 мс - порядок обращения к локальному chromedriver), поэтому оно
+пропорционально количеству команд и не учитывает работу браузера.
+
+Запуск: python benchmarks/bench_fill_form.py [задержка команды, мс]
+"""
+import os
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from BaseUtils.pages.base_page import BasePage
+from BaseUtils.pages.page_context import LOCATOR_MAP
+from BaseUtils.tests.fake_webdriver import create_fake_driver
+from BaseUtils.utils.command_counter import CommandCounter
+from BaseUtils.utils.logger import logger
+
+
+class LegacyFormFiller:
+    """
+    Поэлементный ввод до изменений: type_into_element для каждого поля формы.
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        self.driver = driver
+
+    def type_into_element(self, locator_type: str, locator_value: str, text_to_enter: str, timeout: int = 5) -> bool:
+        try:
+            current_url = self.driver.current_url
+        except Exception:
+            current_url = "Нового окна браузера"
+        locator = (LOCATOR_MAP[locator_type], locator_value)
+        WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+        element = self.driver.find_element(*locator)
+        try:
+            self.driver.execute_script("arguments[0].value = '';", element)
+        except Exception:
+            element.clear()
+        element.send_keys(text_to_enter)
+        logger.info(f'Введен текст "{text_to_enter}" в элемент "{locator_value}" на странице: "{current_url}"')
+        return True
+
+    def fill_form(self, fields: dict[tuple[str, str], str]) -> None:
+        for (locator_type, locator_value), text in fields.items():
+            self.type_into_element(locator_type, locator_value, text)
+
+
+def measure(fields_count: int, latency: float) -> None:
+    names = [f"field_{index}" for index in range(fields_count)]
+    fields = {("id", name): f"value {index}" for index, name in enumerate(names)}
+    results = []
+    for title, fill in (
+            ("Поэлементный ввод (как раньше)", lambda driver: LegacyFormFiller(driver).fill_form(fields)),
+            ("fill_form", lambda driver: BasePage(driver).fill_form(fields)),
+    ):
+        driver, browser = create_fake_driver(dict.fromkeys(names, ""), latency=latency)
+        started_at = time.perf_counter()
+        with CommandCounter(driver) as counter:
+            fill(driver)
+        elapsed = time.perf_counter() - started_at
+        assert all(browser.fields[name] == text for (_, name), text in fields.items())
+        results.append((title, counter.count, elapsed, dict(counter.commands)))
+
+    print(f"Форма из {fields_count} полей:")
+    for title, count, elapsed, commands in results:
+        print(f"  {title}: команд WebDriver: {count}, время: {elapsed * 1000:.0f} мс, по типам: {commands}")
+
+
+if __name__ == "__main__":
+    latency = (float(sys.argv[1]) if len(sys.argv) > 1 else 2.0) / 1000
+    logger.remove()  # Вывод логов не относится к измерению
+    for fields_count in (5, 10, 20):
+        measure(fields_count, latency)
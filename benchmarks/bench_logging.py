@@ -0,0 +1,60 @@
+"""
+Микробенчмарк накладных расходов логирования на тестовый поток.
+
+Сравнивает стоимость 1000 сообщений об успешных действиях:
+    - синхронный sink с немедленным форматированием (как раньше);
+    - sink с очередью (enqueue=True): запись выполняется в фоновом потоке;
+    - отложенное форматирование (log_lazy) при отключенном уровне INFO.
+
+Логи пишутся в os.devnull, чтобы измерялась работа логера, а не терминала.
+
+Запуск: python benchmarks/bench_logging.py
+"""
+import os
+import sys
+import timeit
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from BaseUtils.utils.logger import CONSOLE_FORMAT, log_lazy, logger
+
+ACTIONS = 1000
+LOCATOR_TYPE, LOCATOR_VALUE = "xpath", "//button[@id='submit']"
+
+
+def build_message() -> str:
+    return (
+        f'Клик на элемент: \n'
+        f'С локатором: "{LOCATOR_TYPE}" \n'
+        f'и значением: "{LOCATOR_VALUE}" \n'
+        f"Выполнен УСПЕШНО"
+    )
+
+
+def eager_actions() -> None:
+    for _ in range(ACTIONS):
+        logger.info(build_message())
+
+
+def lazy_actions() -> None:
+    for _ in range(ACTIONS):
+        log_lazy(build_message)
+
+
+def measure(title: str, actions, devnull, level: str = "INFO", enqueue: bool = False) -> None:
+    logger.remove()
+    logger.add(devnull, format=CONSOLE_FORMAT, level=level, enqueue=enqueue)
+    actions()  # Прогрев
+    total = min(timeit.repeat(actions, number=1, repeat=5))
+    logger.complete()
+    print(f"{title}: {total * 1e3:.2f} мс на {ACTIONS} действий")
+
+
+if __name__ == "__main__":
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        measure("Синхронный sink, немедленное форматирование", eager_actions, devnull)
+        measure("Sink с очередью (enqueue)", eager_actions, devnull, enqueue=True)
+        measure("Отложенное форматирование, уровень INFO выключен", lazy_actions, devnull, level="WARNING")
+        logger.remove()
@@ -0,0 +1,97 @@
+"""
+Бенчмарк анализа последовательности чисел (test_second_task).
+
+Сравнивает на 10^3 ... 10^N элементах:
+    - прежнюю реализацию: пять проходов (isinstance, sum, min, max, четные) по всей последовательности;
+    - number_analysis(*args): один проход частями через встроенные функции;
+    - number_analysis_iter(генератор): потоковый анализ, в памяти только часть последовательности;
+    - number_analysis_array(массив NumPy): векторный анализ блоками (если NumPy установлен).
+
+Для каждого пути выводится пропускная способность (млн элементов в секунду, по заранее созданному кортежу,
+чтобы не учитывать время генерации чисел) и пиковая память (tracemalloc, входные данные поступают из генератора:
+учитывается материализация, которую требует путь; массив NumPy создается заранее).
+Пути, требующие всю последовательность в памяти, пропускаются после 10^7 элементов; потоковый путь
+после 10^7 измеряется по генератору (время включает генерацию чисел).
+
+Запуск: python benchmarks/bench_number_analysis.py [N - максимальная степень 10, по умолчанию 7]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from test_second_task import AnalysisResult, np, number_analysis, number_analysis_array, number_analysis_iter
+
+# Больше элементов в списке Python не помещается в память типичного раннера
+MAX_LIST_SIZE = 10 ** 7
+
+
+def legacy_number_analysis(*args: int) -> AnalysisResult:
+    if not all(isinstance(x, int) for x in args):
+        raise ValueError("Все входящие данные должны быть целыми числами")
+    total_count = len(args)
+    total_sum = sum(args)
+    even_count = sum(1 for x in args if x % 2 == 0)
+    return AnalysisResult(
+        min=min(args), max=max(args), avg=total_sum // total_count, sum=total_sum,
+        even_cnt=even_count, odd_cnt=total_count - even_count
+    )
+
+
+def numbers(size: int):
+    return (index * 7919 % 100003 - 50000 for index in range(size))
+
+
+def measure(run, run_streamed) -> tuple[float, float, AnalysisResult]:
+    """
+    Время (без трассировки) и пиковая память (отдельным запуском под tracemalloc), МБ.
+
+    :param run: Запуск по готовым данным (для замера времени).
+    :param run_streamed: Запуск по генератору (для замера памяти).
+    """
+    started_at = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started_at
+    tracemalloc.start()
+    run_streamed()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, result
+
+
+if __name__ == "__main__":
+    max_power = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    for power in range(3, max_power + 1):
+        size = 10 ** power
+        cases = []
+        data = tuple(numbers(size)) if size <= MAX_LIST_SIZE else None
+        if data is not None:
+            cases += [
+                ("Прежняя реализация (5 проходов)",
+                 lambda: legacy_number_analysis(*data), lambda: legacy_number_analysis(*numbers(size))),
+                ("number_analysis(*args)", lambda: number_analysis(*data), lambda: number_analysis(*numbers(size))),
+            ]
+        cases.append((
+            "number_analysis_iter(генератор)",
+            (lambda: number_analysis_iter(iter(data))) if data is not None else lambda: number_analysis_iter(numbers(size)),
+            lambda: number_analysis_iter(numbers(size)),
+        ))
+        if np is not None:
+            array = np.fromiter(numbers(size), dtype=np.int64, count=size)
+            cases.append(("number_analysis_array(NumPy)",
+                          lambda: number_analysis_array(array), lambda: number_analysis_array(array)))
+
+        print(f"10^{power} элементов:")
+        results = set()
+        for title, run, run_streamed in cases:
+            elapsed, peak, result = measure(run, run_streamed)
+            results.add(result.model_dump_json())
+            print(f"  {title}: {size / elapsed / 1e6:.1f} млн/сек, пиковая память: {peak:.1f} МБ")
+        assert len(results) == 1, "Результаты путей различаются"
+        del data
+        if np is not None:
+            del array
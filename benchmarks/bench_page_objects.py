@@ -0,0 +1,139 @@
+"""
+Микробенчмарк стоимости создания объектов страниц.
+
+Сравнивает создание CreatingUser:
+    - как до введения PageContext (LegacyCreatingUser - копия конструкторов BasePage, LoginPage, FileUploadPage,
+      WaitUtils, CreatingUser и read_configuration из версии репозитория до изменений): каждый из трех объектов
+      страниц (CreatingUser + вложенные LoginPage и FileUploadPage) создает ActionChains, WaitUtils, карту
+      локаторов и читает config.ini с диска;
+    - с общим контекстом драйвера: объект страницы хранит только ссылку на контекст,
+      вложенные страницы создаются лениво при первом обращении.
+
+Результат (Python 3.12, три запуска): как раньше - ~1.2-1.3 мс на объект CreatingUser (почти все время - три
+разбора config.ini), с общим контекстом - ~0.6-1 мкс, вместе с вложенными страницами - ~4-7 мкс.
+Контекст драйвера создается один раз (прогрев) и в измерение не входит.
+
+Запуск: python benchmarks/bench_page_objects.py
+"""
+import configparser
+import os
+import sys
+import timeit
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from selenium.webdriver import ActionChains
+from selenium.webdriver.common.by import By
+
+from Task_UserAuto.pages.creating_new_user_page import CreatingUser
+
+CONFIG_PATH = os.path.join(project_root, "BaseUtils", "configurations", "config.ini")
+
+
+class FakeDriver:
+    """
+    Заглушка драйвера: при создании объектов страниц команды браузеру не отправляются.
+    """
+
+
+def legacy_read_configuration(category: str, key: str) -> str:
+    """
+    read_configuration до введения config_registry: config.ini читается с диска при каждом вызове.
+    """
+    if not os.path.isfile(CONFIG_PATH):
+        raise FileNotFoundError(f"Файл config.ini НЕ найден по пути: {CONFIG_PATH}")
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(CONFIG_PATH, encoding='utf-8')
+    if not config.has_section(category):
+        raise configparser.NoSectionError(category)
+    if not config.has_option(category, key):
+        raise configparser.NoOptionError(key, category)
+    return config.get(category, key)
+
+
+class LegacyWaitUtils:
+    def __init__(self, driver, get_locator, get_element, take_screenshot_when_error_and_scroll):
+        self.driver = driver
+        self.get_locator = get_locator
+        self.get_element = get_element
+        self.take_screenshot_when_error_and_scroll = take_screenshot_when_error_and_scroll
+
+
+class LegacyBasePage:
+    def __init__(self, driver) -> None:
+        self.driver = driver
+        self.actions = ActionChains(self.driver)
+        self.base_url = legacy_read_configuration(
+            category="basic info",
+            key="base_url"
+        )
+        self.locator_map = {
+            "id": By.ID,
+            "name": By.NAME,
+            "class_name": By.CLASS_NAME,
+            "link_text": By.LINK_TEXT,
+            "xpath": By.XPATH,
+            "css": By.CSS_SELECTOR
+        }
+        self.wait_utils = LegacyWaitUtils(
+            driver,
+            self.get_locator,
+            self.get_element,
+            self.take_screenshot_when_error_and_scroll
+        )
+
+    def get_locator(self, locator_type: str, locator_value: str) -> tuple[str, str]:
+        return self.locator_map[locator_type], locator_value
+
+    def get_element(self, locator_type: str, locator_value: str):
+        return self.driver.find_element(*self.get_locator(locator_type, locator_value))
+
+    def take_screenshot_when_error_and_scroll(self, locator_type: str | None = None, locator_value: str | None = None):
+        pass
+
+
+class LegacyLoginPage(LegacyBasePage):
+    def __init__(self, driver) -> None:
+        super().__init__(driver)
+
+
+class LegacyFileUploadPage(LegacyBasePage):
+    def __init__(self, driver, project_dir: str) -> None:
+        super().__init__(driver)
+        self.project_dir = project_dir
+
+
+class LegacyCreatingUser(LegacyBasePage):
+    def __init__(self, driver) -> None:
+        super().__init__(driver)
+        self.login_page = LegacyLoginPage(driver=driver)
+        self.file_upload_page = LegacyFileUploadPage(driver=driver, project_dir="Task_UserAuto")
+
+
+def build_legacy(driver: FakeDriver) -> None:
+    LegacyCreatingUser(driver)
+
+
+def build_with_shared_context(driver: FakeDriver) -> None:
+    CreatingUser(driver)
+
+
+def build_with_shared_context_and_nested(driver: FakeDriver) -> None:
+    page = CreatingUser(driver)
+    _ = page.login_page, page.file_upload_page
+
+
+if __name__ == "__main__":
+    driver = FakeDriver()
+    number = 2000
+    cases = [
+        ("Как раньше (без общего контекста, чтение config.ini в каждом объекте)", build_legacy),
+        ("С общим контекстом", build_with_shared_context),
+        ("С общим контекстом + вложенные страницы", build_with_shared_context_and_nested),
+    ]
+    for title, build in cases:
+        build(driver)  # Прогрев: контекст драйвера и конфигурация
+        total = min(timeit.repeat(lambda: build(driver), number=number, repeat=5))
+        print(f"{title}: {total / number * 1e6:.2f} мкс на объект CreatingUser")
@@ -1,6 +1,15 @@
+from itertools import islice, repeat
+from operator import and_
+from typing import Iterable, Sequence
+
 import pytest
 from pydantic import BaseModel
 
+try:
+    import numpy as np
+except ImportError:  # NumPy не обязателен: без него доступен потоковый анализ
+    np = None
+
 
 # Модель ответа метода
 class AnalysisResult(BaseModel):
@@ -12,6 +21,83 @@ class AnalysisResult(BaseModel):
     odd_cnt: int
 
 
+# Размер части при потоковом анализе: память ограничена частью, а не всей последовательностью
+CHUNK_SIZE = 64 * 1024
+
+# Размер блока массива NumPy: временные массивы (проверка четности) не превышают блок
+ARRAY_BLOCK_SIZE = 1024 * 1024
+
+
+class NumberStats:
+    """
+    Накопитель статистики по частям последовательности: каждая часть обрабатывается
+    встроенными функциями (sum, min, max, map) на уровне C, вся последовательность - за один проход.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0
+        self.min: int | None = None
+        self.max: int | None = None
+        self.odd_cnt = 0
+
+    def _merge(self, count: int, chunk_sum: int, chunk_min: int, chunk_max: int, odd_cnt: int) -> None:
+        self.count += count
+        self.sum += chunk_sum
+        self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+        self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+        self.odd_cnt += odd_cnt
+
+    def add_chunk(self, chunk: Sequence[int]) -> None:
+        """
+        Добавляет часть последовательности.
+
+        :param chunk: Часть последовательности (список или кортеж целых чисел).
+        :raises ValueError: если часть содержит нецелые числа
+        """
+        if not chunk:
+            return
+        # Проверка типов без цикла Python: набор типов части (isinstance - только для подклассов int)
+        types = frozenset(map(type, chunk))
+        if not types <= {int, bool} and not all(isinstance(x, int) for x in chunk):
+            raise ValueError("Все входящие данные должны быть целыми числами")
+        odd_cnt = sum(map(and_, chunk, repeat(1, len(chunk))))
+        self._merge(len(chunk), sum(chunk), min(chunk), max(chunk), odd_cnt)
+
+    def add_array(self, array: "np.ndarray") -> None:
+        """
+        Добавляет массив NumPy: все поля вычисляются векторно, блоками по ARRAY_BLOCK_SIZE элементов.
+
+        :param array: Одномерный массив целых чисел.
+        """
+        for start in range(0, len(array), ARRAY_BLOCK_SIZE):
+            block = array[start:start + ARRAY_BLOCK_SIZE]
+            block_min, block_max = int(block.min()), int(block.max())
+            # Сумма в int64, если переполнение невозможно, иначе - точная сумма целыми Python
+            if max(abs(block_min), abs(block_max)) * len(block) < 2 ** 63:
+                block_sum = int(block.sum(dtype=np.int64))
+            else:
+                block_sum = int(block.astype(object).sum())
+            odd_cnt = int(np.count_nonzero(block & 1))
+            self._merge(len(block), block_sum, block_min, block_max, odd_cnt)
+
+    def result(self) -> AnalysisResult:
+        """
+        :return: Модель типа AnalysisResult по всем добавленным числам
+        :raises ValueError: если не добавлено ни одного числа
+        """
+        if not self.count:
+            raise ValueError("Последовательность чисел пуста")
+        return AnalysisResult(
+            min=self.min,
+            max=self.max,
+            avg=self.sum // self.count,  # Среднее целое значение!
+            sum=self.sum,
+            even_cnt=self.count - self.odd_cnt,
+            odd_cnt=self.odd_cnt
+        )
+
+
 def number_analysis(*args: int) -> AnalysisResult:
     """
     Анализирует последовательность чисел и возвращает модель с информацией:
@@ -26,25 +112,67 @@ def number_analysis(*args: int) -> AnalysisResult:
     :return: Модель типа AnalysisResult с результатами анализа
     :raises ValueError: если входящие данные содержат нецелые числа
     """
-    if not all(isinstance(x, int) for x in args):
+    stats = NumberStats()
+    stats.add_chunk(args)
+    return stats.result()
+
+
+def number_analysis_iter(numbers: Iterable[int], chunk_size: int = CHUNK_SIZE) -> AnalysisResult:
+    """
+    Анализ любой итерируемой последовательности (в том числе генератора) за один проход:
+    в памяти одновременно находится только часть из chunk_size чисел.
+
+    :param numbers: Итерируемая последовательность целых чисел
+    :param chunk_size: Размер части
+    :return: Модель типа AnalysisResult с результатами анализа
+    :raises ValueError: если входящие данные содержат нецелые числа
+    """
+    iterator = iter(numbers)
+    return number_analysis_chunks(iter(lambda: list(islice(iterator, chunk_size)), []))
+
+
+def number_analysis_chunks(chunks: Iterable[Sequence[int]]) -> AnalysisResult:
+    """
+    Анализ последовательности, поступающей частями (например, пачками из файла или по сети).
+    Части могут быть списками, кортежами или массивами NumPy.
+
+    :param chunks: Итерируемая последовательность частей
+    :return: Модель типа AnalysisResult с результатами анализа
+    :raises ValueError: если входящие данные содержат нецелые числа
+    """
+    stats = NumberStats()
+    for chunk in chunks:
+        if np is not None and isinstance(chunk, np.ndarray):
+            stats.add_array(_as_int_array(chunk))
+        else:
+            stats.add_chunk(chunk)
+    return stats.result()
+
+
+def _as_int_array(array: object) -> "np.ndarray":
+    array = np.asarray(array).ravel()
+    if array.dtype.kind == "b":
+        return array.astype(np.int8)
+    if array.dtype.kind not in "iu":
         raise ValueError("Все входящие данные должны быть целыми числами")
+    return array
 
-    total_count = len(args)
-    total_sum = sum(args)
-    min_value = min(args)
-    max_value = max(args)
-    even_count = sum(1 for x in args if x % 2 == 0)
-    odd_count = total_count - even_count
-    avg_value = total_sum // total_count  # Среднее целое значение!
 
-    return AnalysisResult(
-        min=min_value,
-        max=max_value,
-        avg=avg_value,
-        sum=total_sum,
-        even_cnt=even_count,
-        odd_cnt=odd_count
-    )
+def number_analysis_array(array: object) -> AnalysisResult:
+    """
+    Векторный анализ массива NumPy или объекта с буферным протоколом (array.array, memoryview)
+    без преобразования элементов в объекты Python. Требует установленного NumPy.
+
+    :param array: Массив целых чисел
+    :return: Модель типа AnalysisResult с результатами анализа
+    :raises ValueError: если тип элементов массива не целочисленный
+    :raises ImportError: если NumPy не установлен
+    """
+    if np is None:
+        raise ImportError("Для анализа массивов необходим NumPy: pip install numpy")
+    stats = NumberStats()
+    stats.add_array(_as_int_array(array))
+    return stats.result()
 
 
 # Тесты
@@ -77,3 +205,45 @@ def test_number_analysis_negative() -> None:
             match="Все входящие данные должны быть целыми числами"
     ):
         number_analysis(1, 2, 'three', 4)
+
+
+def test_number_analysis_streaming() -> None:
+    """
+    Тест потокового анализа.
+    Генератор и последовательность частями дают тот же результат, что и number_analysis.
+
+    :return None
+    """
+    numbers = list(range(-1000, 2001, 7))
+    expected = number_analysis(*numbers)
+
+    assert number_analysis_iter(x for x in numbers) == expected
+    assert number_analysis_iter(iter(numbers), chunk_size=10) == expected
+    assert number_analysis_chunks([numbers[:100], tuple(numbers[100:]), []]) == expected
+    with pytest.raises(ValueError, match="Все входящие данные должны быть целыми числами"):
+        number_analysis_iter(iter([1, 2, 3.5]))
+    with pytest.raises(ValueError, match="Последовательность чисел пуста"):
+        number_analysis_iter(iter([]))
+
+
+@pytest.mark.skipif(np is None, reason="NumPy не установлен")
+def test_number_analysis_array() -> None:
+    """
+    Тест векторного анализа.
+    Массивы NumPy и буферы дают тот же результат, что и number_analysis, в том числе без переполнения суммы.
+
+    :return None
+    """
+    import array
+
+    numbers = list(range(-1000, 2001, 7))
+    expected = number_analysis(*numbers)
+
+    assert number_analysis_array(np.array(numbers, dtype=np.int32)) == expected
+    assert number_analysis_array(array.array("q", numbers)) == expected
+    assert number_analysis_chunks([np.array(numbers[:50]), numbers[50:]]) == expected
+
+    big = [2 ** 62, 2 ** 62, -3]
+    assert number_analysis_array(np.array(big, dtype=np.int64)) == number_analysis(*big)
+    with pytest.raises(ValueError, match="Все входящие данные должны быть целыми числами"):
+        number_analysis_array(np.array([1.0, 2.0]))